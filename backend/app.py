@@ -1,4 +1,4 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
 from datetime import datetime
 import logging
@@ -9,8 +9,22 @@ import socket
 import ipaddress
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import inspect
+import random
+from bisect import bisect_right
+from collections import Counter
+import threading
+from typing import NamedTuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from cachetools import TLRUCache, TTLCache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 # Try absolute imports first (when project root is on PYTHONPATH), then
@@ -18,7 +32,7 @@ import inspect
 # both deployed and local/script contexts.
 try:
     from backend.whois_checker import WhoisChecker
-    from backend.ssl_checker import check_ssl_certificate
+    from backend.ssl_checker import check_ssl_certificate, utcnow
     from backend.score_calculator import calculate_composite_score
     from backend.cipher_checker import check_ciphers
     from backend.dns_checker import check_dns_records
@@ -28,7 +42,7 @@ try:
         celery_app = None
 except ImportError:
     from whois_checker import WhoisChecker
-    from ssl_checker import check_ssl_certificate
+    from ssl_checker import check_ssl_certificate, utcnow
     from score_calculator import calculate_composite_score
     from cipher_checker import check_ciphers
     from dns_checker import check_dns_records
@@ -38,38 +52,6 @@ except ImportError:
         celery_app = None
 
 
-def process_site_check(url):
-    parsed_url = urlparse(url)
-    domain = parsed_url.netloc or parsed_url.path
-    if domain.startswith("www."):
-        domain = domain[4:]
-
-    domain_info = whois_checker.get_domain_age(domain, timeout=5)
-    ssl_info = check_ssl_certificate(url, timeout=5)
-    cipher_info = check_ciphers(domain, timeout=5)
-    dns_info = check_dns_records(domain, timeout=5)
-
-    score_data = calculate_composite_score(
-        domain_age_years=domain_info.get("domain_age_years"),
-        ssl_valid=ssl_info.get("valid"),
-        ssl_days_remaining=ssl_info.get("days_until_expiry", 0),
-        ssl_issuer=ssl_info.get("issuer", ""),
-        cipher_score=cipher_info.get("cipher_score", 0),
-        dns_score=dns_info.get("dns_score", 0)
-    )
-
-    return {
-        "url": url,
-        "domain": domain,
-        "domain_age_years": domain_info.get("domain_age_years"),
-        "ssl_valid": ssl_info.get("valid"),
-        "cipher_score": cipher_info.get("cipher_score"),
-        "dns_score": dns_info.get("dns_score"),
-        "score": score_data["composite_score"],
-        "trust_level": score_data["trust_level"],
-    }
-
-
 # Initialize
 whois_checker = WhoisChecker()
 app = Flask(__name__)
@@ -81,24 +63,99 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Redis cache setup (optional, fallback to in-memory if not available)
+# A bounded, blocking pool shared by all threads in the worker; size it
+# against Gunicorn workers * threads via REDIS_POOL.
+REDIS_POOL_SIZE = int(os.environ.get("REDIS_POOL", 32))
+redis_pool = None
 try:
-    cache = redis.Redis(
-        host='localhost', port=6379, decode_responses=True
+    redis_pool = redis.BlockingConnectionPool(
+        host='localhost',
+        port=6379,
+        max_connections=REDIS_POOL_SIZE,
+        timeout=2,
+        socket_connect_timeout=1,
+        socket_keepalive=True,
+        health_check_interval=30,
+        retry_on_timeout=True,
+        decode_responses=True
     )
+    cache = redis.Redis(connection_pool=redis_pool)
     cache.ping()
     CACHE_ENABLED = True
 except Exception:
     logger.warning("Redis not available, using in-memory cache")
-    cache = {}
+    if redis_pool is not None:
+        redis_pool.disconnect()
+        redis_pool = None
+    # Bounded, per-entry TTL fallback; values are stored as (ttl, data)
+    cache = TLRUCache(
+        maxsize=10_000, ttu=lambda _key, value, now: now + value[0]
+    )
     CACHE_ENABLED = False
 
+_cache_lock = threading.RLock()
+
+
+def get_redis_pool_stats() -> dict:
+    """
+    Connection pool usage, for tuning REDIS_POOL.
+
+    created/in_use/idle come from redis-py internals (the pool's
+    _connections list and free-connection queue), so they are read
+    defensively and simply left out if a redis-py release drops them.
+    """
+    if redis_pool is None:
+        return {"enabled": False}
+    stats = {
+        "enabled": True,
+        "max_connections": getattr(redis_pool, "max_connections", None),
+    }
+    connections = getattr(redis_pool, "_connections", None)
+    queue = getattr(getattr(redis_pool, "pool", None), "queue", None)
+    if connections is None or queue is None:
+        return stats
+    try:
+        created = len(connections)
+        idle = sum(1 for c in list(queue) if c)
+    except TypeError:
+        return stats
+    stats.update(created=created, in_use=created - idle, idle=idle)
+    return stats
+
 
 # ===========================
 # Cache Functions
 # ===========================
 
+def _json_dumps(data) -> str:
+    """Serialize with orjson when available (also handles datetimes)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            # e.g. non-str dict keys or ints beyond 64 bits
+            pass
+    return json.dumps(data)
+
+
+def _json_loads(data):
+    """Deserialize with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def get_cache_key(url: str) -> str:
-    """Generate a cache key for the URL using SHA-256."""
+    """Generate a cache key for the URL using 128-bit BLAKE2b."""
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return "site_check:" + digest
+
+
+def get_legacy_cache_key(url: str) -> str:
+    """
+    SHA-256 key used before the switch to BLAKE2b. Still read on a miss
+    so existing entries are served until they expire (one TTL cycle).
+    """
     return f"site_check:{hashlib.sha256(url.encode()).hexdigest()}"
 
 
@@ -106,17 +163,68 @@ def get_from_cache(key: str):
     """Get data from cache."""
     if CACHE_ENABLED:
         data = cache.get(key)
-        return json.loads(data) if data else None
+        return _json_loads(data) if data else None
     else:
-        return cache.get(key)
+        return _memory_get(key)
 
 
-def set_in_cache(key: str, data, ttl: int = 604800):
-    """Set data in cache (default TTL: 7 days)."""
+def _memory_get(key: str):
+    """Read from the in-memory fallback cache."""
+    with _cache_lock:
+        entry = cache.get(key)
+    return entry[1] if entry else None
+
+
+def _memory_set(key: str, data, ttl: int):
+    """Write to the in-memory fallback cache with its own TTL."""
+    with _cache_lock:
+        cache[key] = (ttl, data)
+
+
+def jittered_ttl(ttl, jitter: float = 0.15) -> int:
+    """
+    Spread expiries so entries cached in a burst don't all expire at once.
+    ttl is either seconds (randomised by +/- jitter) or a (min, max) tuple.
+    """
+    if isinstance(ttl, tuple):
+        ttl_min, ttl_max = ttl
+        return random.randint(int(ttl_min), int(ttl_max))  # nosec B311
+    if not jitter:
+        return int(ttl)
+    spread = random.uniform(-jitter, jitter)  # nosec B311
+    return max(1, int(ttl * (1 + spread)))
+
+
+def set_in_cache(key: str, data, ttl=604800, jitter: float = 0.15):
+    """Set data in cache (default TTL: 7 days, +/- 15% jitter)."""
     if CACHE_ENABLED:
-        cache.setex(key, ttl, json.dumps(data))
+        cache.setex(key, jittered_ttl(ttl, jitter), _json_dumps(data))
     else:
-        cache[key] = data
+        _memory_set(key, data, jittered_ttl(ttl, jitter))
+
+
+def mget_cache(keys: list) -> list:
+    """Get several keys from cache in one round-trip (None for misses)."""
+    if not keys:
+        return []
+    if CACHE_ENABLED:
+        return [_json_loads(r) if r else None for r in cache.mget(keys)]
+    else:
+        return [_memory_get(k) for k in keys]
+
+
+def mset_cache(items: list, ttl=604800, jitter: float = 0.15):
+    """Set several (key, data) pairs in cache with one pipelined call."""
+    if not items:
+        return
+    if CACHE_ENABLED:
+        pipe = cache.pipeline(transaction=False)
+        for key, data in items:
+            pipe.setex(key, jittered_ttl(ttl, jitter), _json_dumps(data))
+        pipe.execute()
+    else:
+        for key, data in items:
+            _memory_set(key, data, jittered_ttl(ttl, jitter))
 
 
 # ===========================
@@ -124,11 +232,60 @@ def set_in_cache(key: str, data, ttl: int = 604800):
 # ===========================
 
 ALLOWED_SCHEMES = ("http", "https")
-DOMAIN_ALLOWLIST = set()  # Add domains here to restrict access
+# Restrict access with set_allowlist(); empty means any public host.
+# Stored pre-normalized so lookups don't rebuild it per request.
+_NORMALIZED_ALLOWLIST = frozenset()
+
+
+def set_allowlist(domains) -> None:
+    """Replace the domain allowlist (case and trailing dot insensitive)."""
+    global _NORMALIZED_ALLOWLIST
+    _NORMALIZED_ALLOWLIST = frozenset(
+        d.lower().rstrip(".") for d in domains
+    )
+
+
+# Every IPv4 network that is private, loopback, link-local, reserved,
+# multicast or unspecified per the ipaddress module, flattened into sorted
+# integer ranges so a lookup is one bisect instead of six property walks.
+_V4_BLOCKED_NETWORKS = (
+    "0.0.0.0/8", "10.0.0.0/8", "127.0.0.0/8", "169.254.0.0/16",
+    "172.16.0.0/12", "192.0.0.0/29", "192.0.0.170/31", "192.0.2.0/24",
+    "192.168.0.0/16", "198.18.0.0/15", "198.51.100.0/24",
+    "203.0.113.0/24", "224.0.0.0/4", "240.0.0.0/4",
+)
+
+
+def _build_v4_ranges(networks) -> tuple:
+    """Sort and merge the networks into (start, end) integer ranges."""
+    spans = sorted(
+        (int(n.network_address), int(n.broadcast_address))
+        for n in map(ipaddress.IPv4Network, networks)
+    )
+    merged = [list(spans[0])]
+    for start, end in spans[1:]:
+        if start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return tuple(r[0] for r in merged), tuple(r[1] for r in merged)
+
+
+_V4_STARTS, _V4_ENDS = _build_v4_ranges(_V4_BLOCKED_NETWORKS)
 
 
 def is_ip_private(ip_str: str) -> bool:
     """Return True if IP is private/loopback/reserved/etc."""
+    try:
+        # Fast path for dotted-quad IPv4 (inet_pton is strict, unlike aton)
+        packed = socket.inet_pton(socket.AF_INET, ip_str)
+    except (OSError, TypeError, ValueError):
+        packed = None
+    if packed is not None:
+        value = int.from_bytes(packed, "big")
+        idx = bisect_right(_V4_STARTS, value) - 1
+        return idx >= 0 and value <= _V4_ENDS[idx]
+
     try:
         ip = ipaddress.ip_address(ip_str)
         return (
@@ -147,49 +304,114 @@ def is_ip_private(ip_str: str) -> bool:
 def resolve_hostname(hostname: str) -> list:
     """Resolve hostname to IPs. Return empty list on failure."""
     try:
-        infos = socket.getaddrinfo(hostname, None)
+        # SOCK_STREAM avoids duplicate tuples for each socket type
+        infos = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
         addrs = {info[4][0] for info in infos}
-        return list(addrs)
+        return sorted(addrs)
     except Exception:
         return []
 
 
-def is_url_allowed(url: str) -> tuple:
+# Short-lived resolution cache so repeated checks of a hot host don't pay
+# DNS round-trips on every validation.
+_resolve_cache = TTLCache(maxsize=4096, ttl=60)
+_resolve_lock = threading.Lock()
+
+
+def resolve_hostname_cached(hostname: str) -> list:
+    """resolve_hostname() with a 60s LRU. Failures are never cached."""
+    key = hostname.lower()
+    with _resolve_lock:
+        addrs = _resolve_cache.get(key)
+    if addrs is not None:
+        return list(addrs)
+
+    addrs = resolve_hostname(hostname)
+    with _resolve_lock:
+        if addrs:
+            _resolve_cache[key] = tuple(addrs)
+        else:
+            _resolve_cache.pop(key, None)
+    return addrs
+
+
+class UrlCheck(NamedTuple):
+    """Result of is_url_allowed, carrying the resolved target along."""
+    allowed: bool
+    reason: str
+    host: Optional[str] = None
+    addrs: tuple = ()
+
+
+def is_url_allowed(url: str) -> UrlCheck:
     """
     Validate URL for outbound fetching.
-    Returns (allowed: bool, reason_or_ok: str).
+    Returns UrlCheck(allowed, reason_or_ok, host, addrs); host and the
+    vetted addrs are set only when allowed, so callers can connect to
+    them without resolving again.
     """
     try:
         parsed = urlparse(url)
     except Exception:
-        return False, "invalid_url"
+        return UrlCheck(False, "invalid_url")
 
     if parsed.scheme not in ALLOWED_SCHEMES:
-        return False, f"bad_scheme:{parsed.scheme}"
+        return UrlCheck(False, f"bad_scheme:{parsed.scheme}")
 
     host = parsed.hostname
     if not host:
-        return False, "no_host"
+        return UrlCheck(False, "no_host")
 
     # If domain allowlist is active, require host to be there
-    if DOMAIN_ALLOWLIST:
+    if _NORMALIZED_ALLOWLIST:
         normalized_host = host.lower().rstrip(".")
-        allowed_domains = {
-            d.lower().rstrip(".") for d in DOMAIN_ALLOWLIST
-        }
-        if normalized_host not in allowed_domains:
-            return False, "not_in_allowlist"
+        if normalized_host not in _NORMALIZED_ALLOWLIST:
+            return UrlCheck(False, "not_in_allowlist")
+
+    # Literal IPs need no DNS; check them directly. Loose forms such as
+    # "127.1" fail to parse here and still go through the resolver.
+    try:
+        literal = ipaddress.ip_address(host)
+    except ValueError:
+        literal = None
+    if literal is not None:
+        addr = str(literal)
+        if is_ip_private(addr):
+            return UrlCheck(False, f"resolved_to_private_ip:{addr}")
+        return UrlCheck(True, "ok", host, (addr,))
 
     # Resolve and verify IPs are not private/reserved
-    addrs = resolve_hostname(host)
+    addrs = resolve_hostname_cached(host)
     if not addrs:
-        return False, "dns_resolution_failed"
+        return UrlCheck(False, "dns_resolution_failed")
 
     for addr in addrs:
         if is_ip_private(addr):
-            return False, f"resolved_to_private_ip:{addr}"
+            return UrlCheck(False, f"resolved_to_private_ip:{addr}")
+
+    return UrlCheck(True, "ok", host, tuple(addrs))
 
-    return True, "ok"
+
+USER_AGENT = "SiteOrigin-Checker/1.0 (+https://example.com)"
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return a per-thread requests.Session so keep-alive connections are
+    reused across calls without sharing a Session between threads."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        # Large keep-alive pool, no implicit retries: a slow probe should
+        # fail fast rather than multiply its timeout.
+        adapter = HTTPAdapter(
+            pool_connections=64, pool_maxsize=64, max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = USER_AGENT
+        _thread_local.session = session
+    return session
 
 
 def safe_requests_head(url: str, timeout: int = 3) -> dict:
@@ -197,17 +419,15 @@ def safe_requests_head(url: str, timeout: int = 3) -> dict:
     Use HEAD (or GET fallback) to obtain headers/status safely.
     Raises ValueError for disallowed URLs; returns dict on success.
     """
-    allowed, reason = is_url_allowed(url)
+    allowed, reason, _, _ = is_url_allowed(url)
     if not allowed:
         raise ValueError(f"URL NOT ALLOWED: {reason}")
 
-    headers = {
-        "User-Agent": "SiteOrigin-Checker/1.0 (+https://example.com)",
-    }
+    session = _get_session()
 
     try:
-        resp = requests.head(
-            url, headers=headers, allow_redirects=False, timeout=timeout
+        resp = session.head(
+            url, allow_redirects=False, timeout=timeout
         )
         return {
             "status_code": resp.status_code,
@@ -216,9 +436,8 @@ def safe_requests_head(url: str, timeout: int = 3) -> dict:
     except requests.exceptions.RequestException:
         # Try GET as last resort (some servers don't support HEAD)
         try:
-            resp = requests.get(
-                url, headers=headers, allow_redirects=False,
-                timeout=timeout, stream=True
+            resp = session.get(
+                url, allow_redirects=False, timeout=timeout, stream=True
             )
             resp.close()
             return {
@@ -235,39 +454,69 @@ def safe_requests_head(url: str, timeout: int = 3) -> dict:
 
 def safe_get_domain_age(domain: str) -> dict:
     """
-    Return dict with creation_date and domain_age_years.
+    Return dict with creation_date (ISO string) and domain_age_years.
     If whois_checker fails, return safe defaults.
     """
     try:
+        # WHOIS data changes on the order of days, so it is cached per
+        # domain independently of the URL-scoped /check result.
+        dkey = f"whois:{domain.lower()}"
+        cached = get_from_cache(dkey)
+        if cached:
+            return {
+                "creation_date": cached.get("creation_date"),
+                "domain_age_years": cached.get("domain_age_years", 0),
+            }
+
         info = whois_checker.get_domain_age(domain)
         if not info:
             return {"creation_date": None, "domain_age_years": 0}
 
         if isinstance(info, dict):
-            return {
+            result = {
                 "creation_date": info.get("creation_date"),
                 "domain_age_years": info.get("domain_age_years", 0),
             }
-
-        if isinstance(info, (list, tuple)) and len(info) >= 2:
-            return {
+        elif isinstance(info, (list, tuple)) and len(info) >= 2:
+            result = {
                 "creation_date": info[0],
                 "domain_age_years": info[1] or 0
             }
+        else:
+            return {"creation_date": None, "domain_age_years": 0}
 
-        return {"creation_date": None, "domain_age_years": 0}
+        creation_date = result["creation_date"]
+        if isinstance(creation_date, datetime):
+            result["creation_date"] = creation_date.isoformat()
+        # Only cache real answers, never lookup failures
+        if creation_date:
+            set_in_cache(dkey, result, ttl=7 * 86400)
+        return result
     except Exception as e:
         logger.warning(f"safe_get_domain_age error for {domain}: {e}")
         return {"creation_date": None, "domain_age_years": 0}
 
 
-def safe_check_ssl(url: str) -> dict:
+def get_ssl_cache_key(url: str) -> str:
+    """Cache key for a certificate check, scoped to host and port."""
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    return f"ssl:{host}:{parsed.port or 443}"
+
+
+def safe_check_ssl(url: str, verdict: Optional[UrlCheck] = None) -> dict:
     """
     Call check_ssl_certificate but ensure it never returns None
     and will not attempt requests to disallowed URLs.
+    Pass a verdict from is_url_allowed to skip validating (and resolving)
+    the URL a second time.
     """
     try:
-        allowed, reason = is_url_allowed(url)
+        if verdict is None:
+            verdict = is_url_allowed(url)
+        allowed, reason, host, addrs = verdict
         if not allowed:
             return {
                 "valid": False,
@@ -277,7 +526,26 @@ def safe_check_ssl(url: str) -> dict:
                 "note": reason
             }
 
-        ssl_info = check_ssl_certificate(url, timeout=5)
+        # Certificates are checked per endpoint, not per URL
+        skey = get_ssl_cache_key(url)
+        cached = get_from_cache(skey)
+        if cached:
+            cached = dict(cached)
+            expiry_date = cached.get("expiry_date")
+            if expiry_date:
+                cached["days_until_expiry"] = (
+                    datetime.fromisoformat(expiry_date) - utcnow()
+                ).days
+            return cached
+
+        # Connect to the addresses that were just vetted. The checker dials
+        # the bare domain for www. hosts, which resolve separately.
+        if host.startswith("www."):
+            ssl_info = check_ssl_certificate(url, timeout=5)
+        else:
+            ssl_info = check_ssl_certificate(
+                url, timeout=5, host=host, ip=addrs
+            )
         if not ssl_info:
             return {
                 "valid": False,
@@ -287,7 +555,7 @@ def safe_check_ssl(url: str) -> dict:
             }
 
         is_dict = isinstance(ssl_info, dict)
-        return {
+        result = {
             "valid": (
                 ssl_info.get("valid", False)
                 if is_dict else bool(ssl_info)
@@ -303,6 +571,11 @@ def safe_check_ssl(url: str) -> dict:
                 if is_dict else 0
             ),
         }
+
+        # Only cache completed handshakes, not connection errors
+        if result["expiry_date"]:
+            set_in_cache(skey, result, ttl=86400)
+        return result
     except Exception as e:
         logger.warning(f"safe_check_ssl error for {url}: {e}")
         return {
@@ -373,31 +646,60 @@ def safe_check_dns(domain: str) -> dict:
         }
 
 
+# Shared pool for the per-URL checks. WHOIS, TLS and DNS probes are
+# independent and almost entirely network wait, so running them side by
+# side makes a check cost the slowest probe instead of the sum of all four.
+_CHECK_EXECUTOR = ThreadPoolExecutor(
+    max_workers=32, thread_name_prefix="site-check"
+)
+
+
+def run_site_checks(
+    url: str, domain: str, verdict: Optional[UrlCheck] = None
+) -> tuple:
+    """
+    Run the WHOIS, SSL, cipher and DNS checks for one site concurrently.
+    Returns (domain_info, ssl_info, cipher_info, dns_info); each safe_*
+    wrapper already converts failures into default dicts.
+    """
+    futures = (
+        _CHECK_EXECUTOR.submit(safe_get_domain_age, domain),
+        _CHECK_EXECUTOR.submit(safe_check_ssl, url, verdict),
+        _CHECK_EXECUTOR.submit(safe_check_ciphers, domain),
+        _CHECK_EXECUTOR.submit(safe_check_dns, domain),
+    )
+    return tuple(f.result() for f in futures)
+
+
+# Introspected once at import; the scorer's signature never changes at runtime
+_SCORE_PARAM_NAMES = tuple(
+    inspect.signature(calculate_composite_score).parameters
+)
+_SCORE_FALLBACK_KEYS = (
+    "domain_age_years",
+    "ssl_valid",
+    "ssl_days_remaining",
+    "ssl_issuer",
+    "cipher_score",
+    "dns_score",
+)
+
+
 def safe_calculate_composite_score(**kwargs):
     """
     Call calculate_composite_score flexibly.
     Returns dict with composite_score and trust_level.
     """
     try:
-        sig = inspect.signature(calculate_composite_score)
-        call_kwargs = {}
-
-        for name in sig.parameters:
-            if name in kwargs:
-                call_kwargs[name] = kwargs[name]
+        call_kwargs = {
+            n: kwargs[n] for n in _SCORE_PARAM_NAMES if n in kwargs
+        }
 
         if not call_kwargs:
             # Try common fallback mappings
-            fallback_map = {
-                "domain_age_years": kwargs.get("domain_age_years"),
-                "ssl_valid": kwargs.get("ssl_valid"),
-                "ssl_days_remaining": kwargs.get("ssl_days_remaining"),
-                "ssl_issuer": kwargs.get("ssl_issuer"),
-                "cipher_score": kwargs.get("cipher_score"),
-                "dns_score": kwargs.get("dns_score"),
-            }
             call_kwargs = {
-                k: v for k, v in fallback_map.items() if v is not None
+                k: kwargs[k] for k in _SCORE_FALLBACK_KEYS
+                if kwargs.get(k) is not None
             }
 
         if call_kwargs:
@@ -422,6 +724,90 @@ def safe_calculate_composite_score(**kwargs):
         }
 
 
+def process_site_check(url: str) -> dict:
+    """
+    Run the full /check pipeline for a URL and cache the result.
+    Used inline by /check and as the body of the Celery task.
+    """
+    # Extract domain from URL
+    parsed_url = urlparse(url)
+    domain = parsed_url.netloc or parsed_url.path
+
+    # Remove www. prefix if present
+    if domain.startswith('www.'):
+        domain = domain[4:]
+
+    # Domain, SSL, cipher and DNS info (run concurrently)
+    domain_info, ssl_info, cipher_info, dns_info = run_site_checks(
+        url, domain
+    )
+    domain_creation_date = domain_info.get("creation_date")
+    domain_age_years = domain_info.get("domain_age_years", 0)
+
+    # Calculate composite score safely with new parameters
+    score_data = safe_calculate_composite_score(
+        domain_age_years=domain_age_years,
+        ssl_valid=ssl_info.get("valid", False),
+        ssl_days_remaining=ssl_info.get("days_until_expiry", 0),
+        ssl_issuer=ssl_info.get("issuer", ""),
+        cipher_score=cipher_info.get("cipher_score", 0.0),
+        dns_score=dns_info.get("dns_score", 0.0)
+    )
+
+    # Prepare response with new data
+    response_data = {
+        "url": url,
+        "domain": domain,
+        "domain_age_years": domain_age_years,
+        "domain_creation_date": domain_creation_date or None,
+        "ssl_valid": ssl_info.get("valid", False),
+        "ssl_issuer": ssl_info.get("issuer"),
+        "ssl_expiry": ssl_info.get("expiry_date"),
+        "ssl_days_remaining": ssl_info.get("days_until_expiry"),
+        # NEW: Cipher information
+        "cipher_score": cipher_info.get("cipher_score", 0.0),
+        "cipher_strength": cipher_info.get("cipher_strength", "unknown"),
+        "protocol_version": cipher_info.get("protocol_version"),
+        "supported_ciphers": cipher_info.get("supported_ciphers", []),
+        "weak_ciphers_found": cipher_info.get("weak_ciphers_found", []),
+        "cipher_recommendations": cipher_info.get("recommendations", []),
+        # NEW: DNS information
+        "dns_score": dns_info.get("dns_score", 0.0),
+        "dns_reliability": dns_info.get("dns_reliability", "unknown"),
+        "a_records": dns_info.get("a_records", []),
+        "aaaa_records": dns_info.get("aaaa_records", []),
+        "mx_records": dns_info.get("mx_records", []),
+        "ns_records": dns_info.get("ns_records", []),
+        "spf_record": dns_info.get("spf_record"),
+        "dmarc_record": dns_info.get("dmarc_record"),
+        "dkim_configured": dns_info.get("dkim_configured", False),
+        "dns_recommendations": dns_info.get("recommendations", []),
+        # Composite score
+        "score": score_data.get('composite_score', 0),
+        "score_details": score_data,
+        "trust_level": score_data.get('trust_level', 'unknown'),
+        "checked_at": datetime.now().isoformat()
+    }
+
+    # Cache the result so later /check calls short-circuit
+    set_in_cache(get_cache_key(url), response_data)
+    return response_data
+
+
+# Register the check as a Celery task when a worker is configured, so slow
+# WHOIS/TLS lookups can run off the Gunicorn worker. Late acks and a
+# prefetch of 1 are set in celery_worker.
+if celery_app is not None:
+    process_site_check_task = celery_app.task(
+        name="site_checker.process_site_check"
+    )(process_site_check)
+else:
+    process_site_check_task = None
+
+# Opt-in: the browser extension expects a synchronous JSON response.
+CHECK_ASYNC = os.getenv("CHECK_ASYNC", "").lower() in ("1", "true", "yes")
+
+
 # ===========================
 # Routes
 # ===========================
@@ -429,7 +815,10 @@ def safe_calculate_composite_score(**kwargs):
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({"status": "healthy"}), 200
+    return jsonify({
+        "status": "healthy",
+        "redis_pool": get_redis_pool_stats()
+    }), 200
 
 
 @app.route("/check", methods=["POST"])
@@ -442,89 +831,128 @@ def check_site():
     try:
         # Check cache first
         cache_key = get_cache_key(url)
-        cached_result = get_from_cache(cache_key)
+        cached_result = (
+            get_from_cache(cache_key)
+            or get_from_cache(get_legacy_cache_key(url))
+        )
         if cached_result:
             logger.info(f"Cache hit for {url}")
             return jsonify(cached_result), 200
 
-        # Extract domain from URL
+        if CHECK_ASYNC and process_site_check_task is not None:
+            task = process_site_check_task.delay(url)
+            return jsonify({"job_id": task.id, "status": "pending"}), 202
+
+        response_data = process_site_check(url)
+        return jsonify(response_data), 200
+    except Exception as e:
+        logger.error(f"Error checking site: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/check/<task_id>", methods=["GET"])
+def check_status(task_id):
+    """Poll the state of a check queued with CHECK_ASYNC enabled."""
+    if celery_app is None:
+        return jsonify({"error": "Async checks are not enabled"}), 404
+
+    result = celery_app.AsyncResult(task_id)
+    payload = {"job_id": task_id, "state": result.state}
+    if result.ready():
+        if result.successful():
+            payload["result"] = result.result
+        else:
+            payload["error"] = str(result.result)
+    return jsonify(payload), 200
+
+
+def _check_one(url: str) -> dict:
+    """
+    Run the full check for a single batch URL.
+    Never raises; failures are reported in the returned dict under "error".
+    Caching is handled in bulk by the caller.
+    """
+    try:
+        # Validate URL before any work
+        verdict = is_url_allowed(url)
+        allowed, reason = verdict.allowed, verdict.reason
+        if not allowed:
+            return {
+                "url": url,
+                "error": "URL not allowed",
+                "reason": reason,
+                "score": 0,
+                "trust_level": "blocked"
+            }
+
+        # Process URL
         parsed_url = urlparse(url)
         domain = parsed_url.netloc or parsed_url.path
-
-        # Remove www. prefix if present
         if domain.startswith('www.'):
             domain = domain[4:]
 
-        # Domain info safely
-        domain_info = safe_get_domain_age(domain)
-        domain_creation_date = domain_info.get("creation_date")
+        domain_info, ssl_info, cipher_info, dns_info = run_site_checks(
+            url, domain, verdict
+        )
         domain_age_years = domain_info.get("domain_age_years", 0)
 
-        # SSL info safely
-        ssl_info = safe_check_ssl(url)
-
-        # NEW: Cipher check
-        cipher_info = safe_check_ciphers(domain)
-
-        # NEW: DNS check
-        dns_info = safe_check_dns(domain)
-
-        # Calculate composite score safely with new parameters
         score_data = safe_calculate_composite_score(
             domain_age_years=domain_age_years,
             ssl_valid=ssl_info.get("valid", False),
-            ssl_days_remaining=ssl_info.get("days_until_expiry", 0),
+            ssl_days_remaining=ssl_info.get(
+                "days_until_expiry", 0
+            ),
             ssl_issuer=ssl_info.get("issuer", ""),
             cipher_score=cipher_info.get("cipher_score", 0.0),
             dns_score=dns_info.get("dns_score", 0.0)
         )
 
-        # Prepare response with new data
-        response_data = {
+        result = {
             "url": url,
             "domain": domain,
             "domain_age_years": domain_age_years,
-            "domain_creation_date": (
-                domain_creation_date.isoformat()
-                if (hasattr(domain_creation_date, "isoformat")
-                    and domain_creation_date)
-                else None
-            ),
             "ssl_valid": ssl_info.get("valid", False),
-            "ssl_issuer": ssl_info.get("issuer"),
-            "ssl_expiry": ssl_info.get("expiry_date"),
-            "ssl_days_remaining": ssl_info.get("days_until_expiry"),
-            # NEW: Cipher information
             "cipher_score": cipher_info.get("cipher_score", 0.0),
-            "cipher_strength": cipher_info.get("cipher_strength", "unknown"),
-            "protocol_version": cipher_info.get("protocol_version"),
-            "supported_ciphers": cipher_info.get("supported_ciphers", []),
-            "weak_ciphers_found": cipher_info.get("weak_ciphers_found", []),
-            "cipher_recommendations": cipher_info.get("recommendations", []),
-            # NEW: DNS information
             "dns_score": dns_info.get("dns_score", 0.0),
-            "dns_reliability": dns_info.get("dns_reliability", "unknown"),
-            "a_records": dns_info.get("a_records", []),
-            "aaaa_records": dns_info.get("aaaa_records", []),
-            "mx_records": dns_info.get("mx_records", []),
-            "ns_records": dns_info.get("ns_records", []),
-            "spf_record": dns_info.get("spf_record"),
-            "dmarc_record": dns_info.get("dmarc_record"),
-            "dkim_configured": dns_info.get("dkim_configured", False),
-            "dns_recommendations": dns_info.get("recommendations", []),
-            # Composite score
             "score": score_data.get('composite_score', 0),
-            "score_details": score_data,
-            "trust_level": score_data.get('trust_level', 'unknown'),
-            "checked_at": datetime.now().isoformat()
+            "trust_level": score_data.get(
+                'trust_level', 'unknown'
+            )
         }
+        return result
 
-        # Cache the result
-        set_in_cache(cache_key, response_data)
-        return jsonify(response_data), 200
     except Exception as e:
-        logger.error(f"Error checking site: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        logger.error(f"Error checking {url}: {str(e)}")
+        return {
+            "url": url,
+            "error": str(e),
+            "score": 0,
+            "trust_level": "error"
+        }
+
+
+def _stream_batch(requested, urls, keys, results, misses):
+    """
+    Yield cached results first, then fresh ones as they complete.
+    urls are the distinct entries of requested; a URL sent several times
+    gets one line per occurrence.
+    """
+    counts = Counter(requested)
+    for url, result in zip(urls, results):
+        if result:
+            yield (_json_dumps(result) + "\n") * counts[url]
+
+    if not misses:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(misses)) as ex:
+        futures = {ex.submit(_check_one, urls[i]): i for i in misses}
+        for fut in as_completed(futures):
+            result = fut.result()
+            i = futures[fut]
+            if "error" not in result:
+                set_in_cache(keys[i], result, ttl=86400)
+            yield (_json_dumps(result) + "\n") * counts[urls[i]]
 
 
 @app.route('/batch-check', methods=['POST'])
@@ -532,6 +960,10 @@ def batch_check_sites():
     """
     Check multiple sites at once.
     Request body: {"urls": ["https://example1.com"]}
+
+    URLs are checked concurrently; results keep the input order.
+    With ?stream=1 the response is NDJSON instead, one result per line
+    in completion order, so finished checks reach the client immediately.
     """
     try:
         data = request.get_json()
@@ -539,80 +971,47 @@ def batch_check_sites():
             return jsonify({"error": "URLs array is required"}), 400
 
         urls = data['urls'][:10]  # Limit to 10 URLs per request
-        results = []
-
-        for url in urls:
-            try:
-                # Validate URL before any work
-                allowed, reason = is_url_allowed(url)
-                if not allowed:
-                    results.append({
-                        "url": url,
-                        "error": "URL not allowed",
-                        "reason": reason,
-                        "score": 0,
-                        "trust_level": "blocked"
-                    })
-                    continue
-
-                # Check cache first
-                cache_key = get_cache_key(url)
-                cached_result = get_from_cache(cache_key)
-                if cached_result:
-                    results.append(cached_result)
-                    continue
-
-                # Process URL
-                parsed_url = urlparse(url)
-                domain = parsed_url.netloc or parsed_url.path
-                if domain.startswith('www.'):
-                    domain = domain[4:]
-
-                domain_info = safe_get_domain_age(domain)
-                domain_age_years = domain_info.get("domain_age_years", 0)
-
-                ssl_info = safe_check_ssl(url)
-                cipher_info = safe_check_ciphers(domain)
-                dns_info = safe_check_dns(domain)
-
-                score_data = safe_calculate_composite_score(
-                    domain_age_years=domain_age_years,
-                    ssl_valid=ssl_info.get("valid", False),
-                    ssl_days_remaining=ssl_info.get(
-                        "days_until_expiry", 0
-                    ),
-                    ssl_issuer=ssl_info.get("issuer", ""),
-                    cipher_score=cipher_info.get("cipher_score", 0.0),
-                    dns_score=dns_info.get("dns_score", 0.0)
-                )
-
-                result = {
-                    "url": url,
-                    "domain": domain,
-                    "domain_age_years": domain_age_years,
-                    "ssl_valid": ssl_info.get("valid", False),
-                    "cipher_score": cipher_info.get("cipher_score", 0.0),
-                    "dns_score": dns_info.get("dns_score", 0.0),
-                    "score": score_data.get('composite_score', 0),
-                    "trust_level": score_data.get(
-                        'trust_level', 'unknown'
-                    )
-                }
-
-                # Cache the result (1 day for batch results)
-                set_in_cache(cache_key, result, ttl=86400)
-                results.append(result)
-
-            except Exception as e:
-                logger.error(f"Error checking {url}: {str(e)}")
-                results.append({
-                    "url": url,
-                    "error": str(e),
-                    "score": 0,
-                    "trust_level": "error"
-                })
-
-        return jsonify({"results": results}), 200
+        if not urls:
+            return jsonify({"results": []}), 200
+
+        # Work on distinct URLs only; results are expanded back at the end
+        requested = urls
+        urls = list(dict.fromkeys(requested))
+
+        # One round-trip for every cache lookup
+        keys = [get_cache_key(u) for u in urls]
+        legacy_keys = [get_legacy_cache_key(u) for u in urls]
+        found = mget_cache(keys + legacy_keys)
+        results = [
+            new or old for new, old in zip(found, found[len(keys):])
+        ]
+        misses = [i for i, r in enumerate(results) if not r]
+
+        if request.args.get("stream", "0").lower() in ("1", "true", "yes"):
+            return Response(
+                stream_with_context(
+                    _stream_batch(requested, urls, keys, results, misses)
+                ),
+                mimetype="application/x-ndjson"
+            )
+
+        if misses:
+            # Each check is almost entirely network wait, so one worker per
+            # URL scales nearly linearly.
+            with ThreadPoolExecutor(max_workers=len(misses)) as ex:
+                fresh = list(ex.map(_check_one, (urls[i] for i in misses)))
+
+            new_entries = []
+            for i, result in zip(misses, fresh):
+                results[i] = result
+                if "error" not in result:
+                    new_entries.append((keys[i], result))
+
+            # Cache the results (1 day for batch results)
+            mset_cache(new_entries, ttl=86400)
+
+        by_url = dict(zip(urls, results))
+        return jsonify({"results": [by_url[u] for u in requested]}), 200
 
     except Exception as e:
         logger.error(f"Error in batch check: {str(e)}")
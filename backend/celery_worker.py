@@ -12,6 +12,10 @@ celery_app.conf.update(
     result_serializer='json',
     timezone='UTC',
     enable_utc=True,
+    # Long WHOIS lookups shouldn't hold a queue of short checks hostage
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    imports=('backend.app',),
 )
 
 celery_app.autodiscover_tasks(
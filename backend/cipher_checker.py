@@ -4,12 +4,20 @@ Cipher Checker Module
 Analyzes TLS cipher suites and protocol versions for a given domain
 """
 
+import re
 import ssl
 import socket
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 from urllib.parse import urlparse
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +49,41 @@ WEAK_CIPHERS = [
 WEAK_PROTOCOLS = ['SSLv2', 'SSLv3', 'TLSv1.0', 'TLSv1.1']
 STRONG_PROTOCOLS = ['TLSv1.2', 'TLSv1.3']
 
+# Single-pass matchers over the lists above (same substring semantics).
+# An Aho-Corasick automaton classifies against both lists in one scan when
+# pyahocorasick is installed; the regexes are the fallback.
+_WEAK_RE = re.compile('|'.join(map(re.escape, WEAK_CIPHERS)))
+_STRONG_RE = re.compile('|'.join(map(re.escape, STRONG_CIPHERS)))
+
+if AHOCORASICK_AVAILABLE:
+    _AC = ahocorasick.Automaton()
+    for _c in STRONG_CIPHERS:
+        _AC.add_word(_c, 'strong')
+    for _c in WEAK_CIPHERS:
+        _AC.add_word(_c, 'weak')
+    _AC.make_automaton()
+    del _c
+
+
+def _classify_cipher(cipher_upper: str):
+    """Return 'weak', 'strong' or None; weak indicators take precedence."""
+    if AHOCORASICK_AVAILABLE:
+        tags = {tag for _, tag in _AC.iter(cipher_upper)}
+        if 'weak' in tags:
+            return 'weak'
+        return 'strong' if 'strong' in tags else None
+    if _WEAK_RE.search(cipher_upper):
+        return 'weak'
+    return 'strong' if _STRONG_RE.search(cipher_upper) else None
+
+
+# Shared client context: building one per attempt is comparatively
+# expensive, and wrap_socket() on a configured context is thread-safe.
+# Certificates aren't verified here; ssl_checker handles trust.
+_CTX = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+_CTX.check_hostname = False
+_CTX.verify_mode = ssl.CERT_NONE
+
 
 def check_ciphers(domain: str, timeout: int = 10) -> Dict[str, Any]:
     """
@@ -97,14 +140,10 @@ def check_ciphers(domain: str, timeout: int = 10) -> Dict[str, Any]:
 
         for protocol_name, protocol_const in protocols_to_test:
             try:
-                context = ssl.SSLContext(protocol_const)
-                context.check_hostname = False
-                context.verify_mode = ssl.CERT_NONE
-
                 with socket.create_connection(
                     (hostname, port), timeout=timeout
                 ) as sock:
-                    with context.wrap_socket(
+                    with _CTX.wrap_socket(
                         sock, server_hostname=hostname
                     ) as ssock:
                         cipher_info = ssock.cipher()
@@ -236,23 +275,13 @@ def _calculate_cipher_score(
     for cipher in ciphers:
         cipher_upper = cipher.upper()
 
-        # Check for weak cipher indicators
-        is_weak = any(
-            weak_indicator in cipher_upper
-            for weak_indicator in WEAK_CIPHERS
-        )
-
-        if is_weak:
+        # Check for weak cipher indicators, then known strong ciphers
+        category = _classify_cipher(cipher_upper)
+        if category == 'weak':
             weak_count += 1
             weak_ciphers.append(cipher)
-        else:
-            # Check if it's a known strong cipher
-            is_strong = any(
-                strong_cipher in cipher_upper
-                for strong_cipher in STRONG_CIPHERS
-            )
-            if is_strong:
-                strong_count += 1
+        elif category == 'strong':
+            strong_count += 1
 
     # Calculate cipher score based on ratio
     total_ciphers = len(ciphers)
@@ -320,6 +349,34 @@ def _generate_cipher_recommendations(
     return recommendations
 
 
+def _probe_protocol(domain: str) -> Dict[str, Any]:
+    """Handshake once with the shared context and describe the session"""
+    try:
+        hostname = domain
+        if domain.startswith('http'):
+            hostname = urlparse(domain).hostname
+
+        if hostname.startswith('www.'):
+            hostname = hostname[4:]
+
+        with socket.create_connection((hostname, 443), timeout=5) as sock:
+            with _CTX.wrap_socket(
+                sock, server_hostname=hostname
+            ) as ssock:
+                cipher = ssock.cipher()
+                return {
+                    'supported': True,
+                    'cipher': cipher[0] if cipher else None,
+                    'protocol_version': ssock.version(),
+                    'bits': cipher[2] if cipher else None
+                }
+    except Exception as e:
+        return {
+            'supported': False,
+            'error': str(e)
+        }
+
+
 def get_detailed_cipher_info(domain: str) -> Dict[str, Any]:
     """
     Get detailed cipher information including all tested protocols
@@ -335,36 +392,12 @@ def get_detailed_cipher_info(domain: str) -> Dict[str, Any]:
         'TLSv1.2': ssl.PROTOCOL_TLS_CLIENT,
     }
 
-    results = {}
-
-    for protocol_name, protocol_const in protocols.items():
-        try:
-            context = ssl.SSLContext(protocol_const)
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-
-            hostname = domain
-            if domain.startswith('http'):
-                hostname = urlparse(domain).hostname
-
-            if hostname.startswith('www.'):
-                hostname = hostname[4:]
-
-            with socket.create_connection((hostname, 443), timeout=5) as sock:
-                with context.wrap_socket(
-                    sock, server_hostname=hostname
-                ) as ssock:
-                    cipher = ssock.cipher()
-                    results[protocol_name] = {
-                        'supported': True,
-                        'cipher': cipher[0] if cipher else None,
-                        'protocol_version': ssock.version(),
-                        'bits': cipher[2] if cipher else None
-                    }
-        except Exception as e:
-            results[protocol_name] = {
-                'supported': False,
-                'error': str(e)
-            }
+    # The probes are independent handshakes, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(protocols)) as ex:
+        futures = {
+            name: ex.submit(_probe_protocol, domain)
+            for name in protocols
+        }
+        results = {name: f.result() for name, f in futures.items()}
 
     return results
@@ -12,12 +12,234 @@ except Exception:
     # dnspython not available in this environment; provide fallbacks
     DNS_AVAILABLE = False
     dns = None
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 import logging
+import os
+import re
+import socket
+import threading
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import compress
+from concurrent.futures import (
+    ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+)
 from typing import Dict, Any, List
 from urllib.parse import urlparse
 
+from cachetools import TLRUCache, TTLCache
+
 logger = logging.getLogger(__name__)
 
+# Common DKIM selectors probed when looking for a DKIM key
+DKIM_SELECTORS = (
+    'default', 'google', 'k1', 'dkim', 'mail',
+    'selector1', 'selector2', 's1', 's2'
+)
+
+# Case-insensitive "starts with" tags for SPF (on decoded TXT strings)
+# and DMARC (on raw TXT bytes)
+_SPF_RE = re.compile(r'v=spf1', re.IGNORECASE)
+_DMARC_RE = re.compile(rb'v=dmarc1', re.IGNORECASE)
+
+# URL inputs that need parsing down to a hostname
+_URL_RE = re.compile(r'https?://', re.IGNORECASE)
+
+# Shared pool for fanning out independent DNS queries. Every lookup is a
+# network round trip, so overlapping them makes a check cost roughly one
+# RTT instead of the sum. Only the calling thread waits on these futures,
+# never a pool worker, so the pool can't deadlock on itself. Built on first
+# use so importing the module for scoring alone starts no threads.
+_DNS_EXECUTOR = None
+_dns_executor_lock = threading.Lock()
+
+
+def _get_dns_executor() -> ThreadPoolExecutor:
+    """Return the module-wide DNS pool, creating it on first call"""
+    global _DNS_EXECUTOR
+    if _DNS_EXECUTOR is None:
+        with _dns_executor_lock:
+            if _DNS_EXECUTOR is None:
+                _DNS_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=32, thread_name_prefix="dns-query"
+                )
+    return _DNS_EXECUTOR
+
+
+# Answers keyed by (qname, record type, nameservers asked). Positive
+# answers live for the record's own TTL (capped); NXDOMAIN/NoAnswer are
+# remembered briefly so missing DKIM selectors etc. aren't re-queried on
+# every check.
+_DNS_CACHE_MAX_TTL = 3600
+_DNS_NEGATIVE_TTL = 60
+_dns_cache = TLRUCache(
+    maxsize=4096, ttu=lambda _key, value, now: now + value[0]
+)
+_dns_cache_lock = threading.Lock()
+
+# Circuit breaker for names whose lookups time out or find no working
+# nameserver: further queries to the same nameservers fail fast until the
+# entry expires instead of each paying the full timeout again.
+_DNS_FAILURE_TTL = 60
+_dns_failures = TTLCache(maxsize=8192, ttl=_DNS_FAILURE_TTL)
+
+
+def _cached_resolve(resolver: Any, qname: str, record_type: str) -> tuple:
+    """
+    resolver.resolve() through the answer cache
+
+    Returns:
+        Tuple of rdata objects; empty for NXDOMAIN or NoAnswer. Timeouts
+        and nameserver failures propagate, and repeat queries for the same
+        name through the same nameservers then raise dns.exception.Timeout
+        without touching the network for _DNS_FAILURE_TTL seconds.
+    """
+    # Keyed by nameservers too, so one unreachable resolver cannot open
+    # the breaker (or answer from cache) for another
+    key = (
+        qname.lower().rstrip('.'), record_type,
+        tuple(getattr(resolver, 'nameservers', ())),
+    )
+    with _dns_cache_lock:
+        entry = _dns_cache.get(key)
+        circuit_open = key in _dns_failures
+    if entry is not None:
+        return entry[1]
+    if circuit_open:
+        raise dns.exception.Timeout()
+
+    try:
+        answers = resolver.resolve(qname, record_type)
+        rrset = getattr(answers, 'rrset', None)
+        ttl = rrset.ttl if rrset is not None else _DNS_NEGATIVE_TTL
+        records = tuple(answers)
+        ttl = max(1, min(ttl, _DNS_CACHE_MAX_TTL))
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+        records = ()
+        ttl = _DNS_NEGATIVE_TTL
+    except (dns.exception.Timeout, dns.resolver.NoNameservers) as e:
+        with _dns_cache_lock:
+            opened = key not in _dns_failures
+            _dns_failures[key] = True
+        if opened:
+            logger.info(
+                f"Skipping {record_type} lookups for {qname} for "
+                f"{_DNS_FAILURE_TTL}s: {type(e).__name__}"
+            )
+        raise
+
+    with _dns_cache_lock:
+        _dns_cache[key] = (ttl, records)
+    return records
+
+
+@lru_cache(maxsize=16)
+def _get_resolver(timeout: float, lifetime: float = 5.0):
+    """
+    Return a shared resolver for the given timeout/lifetime pair
+
+    Building a Resolver re-reads /etc/resolv.conf, so one is built per
+    configuration and reused. The instances are never reconfigured after
+    creation, which keeps concurrent resolve() calls on them safe.
+    """
+    resolver = dns.resolver.Resolver()
+    resolver.timeout = timeout
+    resolver.lifetime = lifetime
+    return resolver
+
+
+# Public resolvers raced against the configured one for DS lookups. DS
+# records are published in the parent zone, so every recursive resolver
+# should agree; taking the first answer hides a slow local stub. Off
+# unless DNS_PUBLIC_DS_RACE is set: it sends every checked domain to
+# these third parties and costs three more pool threads per check, each
+# blocking for the full timeout where outbound DNS is firewalled.
+_PUBLIC_RESOLVERS = ('1.1.1.1', '8.8.8.8', '9.9.9.9')
+DNS_PUBLIC_DS_RACE = os.environ.get("DNS_PUBLIC_DS_RACE", "").lower() in (
+    "1", "true", "yes"
+)
+
+
+@lru_cache(maxsize=16)
+def _get_public_resolver(nameserver: str, timeout: float):
+    """Return a shared resolver that only asks the given nameserver"""
+    resolver = dns.resolver.Resolver(configure=False)
+    resolver.nameservers = [nameserver]
+    resolver.timeout = timeout
+    resolver.lifetime = timeout
+    return resolver
+
+
+def _normalize_hostname(domain: str) -> str:
+    """Extract the hostname from a URL or domain and drop a www. prefix"""
+    # Bare hostnames, the common case, never reach urlparse
+    if _URL_RE.match(domain):
+        parsed = urlparse(domain)
+        hostname = parsed.hostname or parsed.netloc
+    else:
+        hostname = domain
+
+    # Remove www. prefix
+    if hostname.startswith('www.'):
+        hostname = hostname[4:]
+    return hostname
+
+
+def _lookup_ds(resolver: Any, hostname: str) -> List[str]:
+    """Return the DS (delegation signer) records for hostname"""
+    return [str(ds) for ds in _cached_resolve(resolver, hostname, 'DS')]
+
+
+def _submit_ds_lookups(
+    resolver: Any, hostname: str, timeout: float
+) -> List[Any]:
+    """
+    Start the DS lookup on resolver, and on each of _PUBLIC_RESOLVERS when
+    DNS_PUBLIC_DS_RACE is set
+
+    Returns:
+        Futures for _race_ds_lookups
+    """
+    submit = _get_dns_executor().submit
+    resolvers = [resolver]
+    if DNS_PUBLIC_DS_RACE:
+        resolvers += [
+            _get_public_resolver(nameserver, timeout)
+            for nameserver in _PUBLIC_RESOLVERS
+        ]
+    return [submit(_lookup_ds, r, hostname) for r in resolvers]
+
+
+def _race_ds_lookups(futures: List[Any], timeout: float) -> List[str]:
+    """
+    DS records from the first lookup to answer; the rest are cancelled
+
+    An empty answer (no DS published) counts as an answer. Must be called
+    from outside the DNS pool, like every other wait on its futures.
+
+    Raises:
+        DNSException: every lookup failed, or none answered within timeout
+    """
+    error = dns.exception.Timeout()
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            try:
+                records = future.result()
+            except dns.exception.DNSException as e:
+                error = e
+                continue
+            for pending in futures:
+                pending.cancel()
+            return records
+    except FuturesTimeoutError:
+        pass
+    raise error
+
 
 def check_dns_records(domain: str, timeout: int = 10) -> Dict[str, Any]:
     """
@@ -25,7 +247,8 @@ def check_dns_records(domain: str, timeout: int = 10) -> Dict[str, Any]:
 
     Args:
         domain: Domain name to check (can be URL or plain domain)
-        timeout: DNS query timeout in seconds
+        timeout: DNS query timeout in seconds (A/AAAA go through
+            getaddrinfo and use the system resolver's timeout)
 
     Returns:
         Dict containing:
@@ -37,6 +260,7 @@ def check_dns_records(domain: str, timeout: int = 10) -> Dict[str, Any]:
             - spf_record: SPF record if found
             - dmarc_record: DMARC record if found
             - dkim_configured: Whether DKIM appears configured
+            - dnssec_enabled: Whether the zone publishes DS records
             - dns_score: Score from 0.0 to 1.0
             - dns_reliability: 'high', 'medium', or 'low'
             - recommendations: List of recommendations
@@ -51,6 +275,7 @@ def check_dns_records(domain: str, timeout: int = 10) -> Dict[str, Any]:
         'spf_record': None,
         'dmarc_record': None,
         'dkim_configured': False,
+        'dnssec_enabled': False,
         'dns_score': 0.0,
         'dns_reliability': 'unknown',
         'recommendations': [],
@@ -58,16 +283,7 @@ def check_dns_records(domain: str, timeout: int = 10) -> Dict[str, Any]:
     }
 
     try:
-        # Parse domain from URL if needed
-        if domain.startswith('http://') or domain.startswith('https://'):
-            parsed = urlparse(domain)
-            hostname = parsed.hostname or parsed.netloc
-        else:
-            hostname = domain
-
-        # Remove www. prefix
-        if hostname.startswith('www.'):
-            hostname = hostname[4:]
+        hostname = _normalize_hostname(domain)
 
         logger.info(f"Checking DNS records for {hostname}")
 
@@ -77,24 +293,30 @@ def check_dns_records(domain: str, timeout: int = 10) -> Dict[str, Any]:
             return result
 
         # Configure resolver with timeout
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = timeout
-        resolver.lifetime = timeout
+        resolver = _get_resolver(timeout, timeout)
+
+        # Issue every query at once: the base record sets plus the
+        # DMARC/DKIM lookups, which only depend on the hostname.
+        submit = _get_dns_executor().submit
+        a_future = submit(_query_dns_records, resolver, hostname, 'A')
+        aaaa_future = submit(_query_dns_records, resolver, hostname, 'AAAA')
+        mx_future = submit(
+            _query_dns_records, resolver, hostname, 'MX',
+            return_objects=True
+        )
+        ns_future = submit(_query_dns_records, resolver, hostname, 'NS')
+        txt_future = submit(_query_dns_records, resolver, hostname, 'TXT')
+        ds_futures = _submit_ds_lookups(resolver, hostname, timeout)
+        security_lookups = _submit_security_lookups(hostname)
 
         # Check A records (IPv4)
-        result['a_records'] = _query_dns_records(
-            resolver, hostname, 'A'
-        )
+        result['a_records'] = a_future.result()
 
         # Check AAAA records (IPv6)
-        result['aaaa_records'] = _query_dns_records(
-            resolver, hostname, 'AAAA'
-        )
+        result['aaaa_records'] = aaaa_future.result()
 
         # Check MX records
-        mx_data = _query_dns_records(
-            resolver, hostname, 'MX', return_objects=True
-        )
+        mx_data = mx_future.result()
         if mx_data:
             result['mx_records'] = [
                 {
@@ -105,20 +327,28 @@ def check_dns_records(domain: str, timeout: int = 10) -> Dict[str, Any]:
             ]
 
         # Check NS records
-        result['ns_records'] = _query_dns_records(
-            resolver, hostname, 'NS'
-        )
+        result['ns_records'] = ns_future.result()
 
         # Check TXT records
-        txt_records = _query_dns_records(resolver, hostname, 'TXT')
+        txt_records = txt_future.result()
         result['txt_records'] = txt_records
 
         # Parse TXT records for security configurations
-        security_data = _parse_security_records(txt_records, hostname)
+        security_data = _collect_security_records(
+            txt_records, *security_lookups
+        )
         result['spf_record'] = security_data['spf']
         result['dmarc_record'] = security_data['dmarc']
         result['dkim_configured'] = security_data['dkim_configured']
 
+        # DNSSEC rides along with the same batch (see verify_dnssec)
+        try:
+            result['dnssec_enabled'] = bool(
+                _race_ds_lookups(ds_futures, timeout)
+            )
+        except dns.exception.DNSException as e:
+            logger.debug(f"DS lookup failed for {hostname}: {e}")
+
         # Calculate DNS score
         score_data = _calculate_dns_score(result)
         result['dns_score'] = score_data['score']
@@ -163,6 +393,48 @@ def check_dns_records(domain: str, timeout: int = 10) -> Dict[str, Any]:
     return result
 
 
+def _txt_to_bytes(strings) -> bytes:
+    """Join the chunks of one TXT record (dnspython yields bytes)"""
+    if strings and not isinstance(strings[0], bytes):
+        # Older resolvers may hand back str chunks
+        return ''.join(str(s) for s in strings).encode()
+    return b''.join(strings)
+
+
+def _txt_to_str(strings) -> str:
+    """Join and decode one TXT record; invalid UTF-8 is replaced"""
+    return _txt_to_bytes(strings).decode('utf-8', 'replace')
+
+
+_ADDRESS_FAMILIES = {'A': socket.AF_INET, 'AAAA': socket.AF_INET6}
+
+# getaddrinfo errors meaning the name has no records of that family (no
+# AAAA is common): an empty answer, not a failure to retry elsewhere
+_EAI_NO_RECORDS = frozenset(
+    code for code in (
+        getattr(socket, 'EAI_NONAME', None),
+        getattr(socket, 'EAI_NODATA', None),
+    ) if code is not None
+)
+
+
+def _getaddrinfo_records(hostname: str, record_type: str) -> List[str]:
+    """
+    Resolve A/AAAA through the system resolver
+
+    getaddrinfo parses in libc and benefits from any local stub cache, which
+    is much cheaper than decoding the wire format in Python. It takes no
+    timeout: the system resolver's own (resolv.conf) timeout applies.
+
+    Raises:
+        OSError (socket.gaierror) when the name does not resolve
+    """
+    infos = socket.getaddrinfo(
+        hostname, None, _ADDRESS_FAMILIES[record_type], socket.SOCK_STREAM
+    )
+    return list(dict.fromkeys(info[4][0] for info in infos))
+
+
 def _query_dns_records(
     resolver: Any,
     hostname: str,
@@ -180,23 +452,28 @@ def _query_dns_records(
 
     Returns:
         List of records (strings or objects)
+
+    A/AAAA strings come from getaddrinfo, which ignores the resolver's
+    timeout; only other getaddrinfo errors fall back to the resolver.
     """
+    if record_type in _ADDRESS_FAMILIES and not return_objects:
+        try:
+            return _getaddrinfo_records(hostname, record_type)
+        except OSError as e:
+            if (isinstance(e, socket.gaierror)
+                    and e.errno in _EAI_NO_RECORDS):
+                return []
+            # Fall back to dnspython (e.g. EAI_AGAIN), which also caches
+            # negative answers
+
     try:
-        answers = resolver.resolve(hostname, record_type)
+        answers = _cached_resolve(resolver, hostname, record_type)
         if return_objects:
             return [answer for answer in answers]
         else:
             if record_type == 'TXT':
-                # TXT records need special handling for quotes
-                return [
-                    ''.join(
-                        [
-                            s.decode() if isinstance(s, bytes) else str(s)
-                            for s in answer.strings
-                        ]
-                    )
-                    for answer in answers
-                ]
+                # TXT records are split into byte chunks; join then decode
+                return [_txt_to_str(answer.strings) for answer in answers]
             else:
                 return [str(answer).rstrip('.') for answer in answers]
     except (
@@ -225,169 +502,231 @@ def _parse_security_records(
     Returns:
         Dict with spf, dmarc, and dkim_configured
     """
+    return _collect_security_records(
+        txt_records, *_submit_security_lookups(hostname)
+    )
+
+
+def _submit_security_lookups(hostname: str):
+    """
+    Start the DMARC lookup and every DKIM selector lookup concurrently
+
+    Returns:
+        (dmarc_future, dkim_futures) for _collect_security_records
+    """
+    dmarc_future = _get_dns_executor().submit(_lookup_dmarc, hostname)
+
+    dkim_futures = list(submit_bulk_query(
+        [f"{selector}._domainkey.{hostname}" for selector in DKIM_SELECTORS],
+        'TXT', timeout_ms=3000
+    ).values())
+    return dmarc_future, dkim_futures
+
+
+def _collect_security_records(
+    txt_records: List[str], dmarc_future, dkim_futures
+) -> Dict[str, Any]:
+    """Combine the SPF scan with the results of the pending lookups"""
     spf_record = None
-    dmarc_record = None
-    dkim_configured = False
 
     # Check for SPF in TXT records
     for record in txt_records:
-        record_lower = record.lower()
-        if record_lower.startswith('v=spf1'):
+        if _SPF_RE.match(record):
             spf_record = record
             break
 
-    # Check DMARC (_dmarc subdomain)
+    # First selector that answers settles it; drop the ones still queued
+    dkim_configured = False
+    for future in as_completed(dkim_futures):
+        if _has_answers(future):
+            dkim_configured = True
+            for pending in dkim_futures:
+                pending.cancel()
+            break
+
+    return {
+        'spf': spf_record,
+        'dmarc': dmarc_future.result(),
+        'dkim_configured': dkim_configured
+    }
+
+
+def _lookup_dmarc(hostname: str):
+    """Return the DMARC record published at _dmarc.<hostname>, if any"""
     try:
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = 5
+        resolver = _get_resolver(5)
         dmarc_domain = f"_dmarc.{hostname}"
-        dmarc_answers = resolver.resolve(dmarc_domain, 'TXT')
+        dmarc_answers = _cached_resolve(resolver, dmarc_domain, 'TXT')
         for answer in dmarc_answers:
-            # Handle TXT record format
-            record_parts = []
-            for s in answer.strings:
-                if isinstance(s, bytes):
-                    record_parts.append(s.decode())
-                else:
-                    record_parts.append(str(s))
-            record = ''.join(record_parts)
-
-            if record.lower().startswith('v=dmarc1'):
-                dmarc_record = record
-                break
+            # Match on the raw bytes; only the winning record is decoded
+            raw = _txt_to_bytes(answer.strings)
+            if _DMARC_RE.match(raw):
+                return raw.decode('utf-8', 'replace')
     except (dns.exception.DNSException,) as e:
         # DNS issues (no record, NXDOMAIN, no nameservers, etc.)
         logger.debug(f"DMARC lookup failed for {hostname}: {e}")
     except Exception as e:
         # Unexpected errors should be logged
         logger.warning(f"Unexpected DMARC check error for {hostname}: {e}")
+    return None
 
-    # Check for common DKIM selectors
-    common_selectors = [
-        'default', 'google', 'k1', 'dkim', 'mail',
-        'selector1', 'selector2', 's1', 's2'
-    ]
-    for selector in common_selectors:
-        try:
-            resolver = dns.resolver.Resolver()
-            resolver.timeout = 3
-            dkim_domain = f"{selector}._domainkey.{hostname}"
-            dkim_answers = resolver.resolve(dkim_domain, 'TXT')
-            if dkim_answers:
-                dkim_configured = True
-                break
-        except (dns.exception.DNSException,) as e:
-            # Expected DNS lookup issues for selectors
-            logger.debug(f"DKIM selector lookup failed for {selector}: {e}")
-            continue
-        except Exception as e:
-            logger.warning(
-                f"Unexpected error checking DKIM selector {selector}: {e}"
-            )
-            continue
 
-    return {
-        'spf': spf_record,
-        'dmarc': dmarc_record,
-        'dkim_configured': dkim_configured
-    }
+def _has_answers(future) -> bool:
+    """True if a bulk-query future finished with at least one record"""
+    try:
+        return bool(future.result())
+    except (dns.exception.DNSException,) as e:
+        # Expected DNS lookup issues (e.g. DKIM selectors that time out)
+        logger.debug(f"Bulk DNS lookup failed: {e}")
+    except Exception as e:
+        logger.warning(f"Unexpected error in bulk DNS lookup: {e}")
+    return False
 
 
-def _calculate_dns_score(dns_data: Dict[str, Any]) -> Dict[str, Any]:
+def _resolve_with_retries(
+    resolver: Any, qname: str, record_type: str, retries: int
+) -> tuple:
+    """_cached_resolve, retrying transient failures up to `retries` times"""
+    for attempt in range(retries + 1):
+        try:
+            return _cached_resolve(resolver, qname, record_type)
+        except (dns.resolver.Timeout, dns.resolver.NoNameservers):
+            if attempt == retries:
+                raise
+    return ()
+
+
+def submit_bulk_query(
+    hostnames: List[str],
+    record_type: str,
+    timeout_ms: int = 3000,
+    retries: int = 0
+) -> Dict[str, Any]:
     """
-    Calculate DNS reliability score
+    Start one lookup per hostname on the shared DNS pool
 
     Args:
-        dns_data: Dictionary with DNS records
+        hostnames: Names to query
+        record_type: Record type for every name (A, TXT, ...)
+        timeout_ms: Per-nameserver timeout for each query
+        retries: Extra attempts after a timeout or nameserver failure
 
     Returns:
-        Dict with score, reliability, and recommendations
+        Dict mapping hostname to a Future of a tuple of rdata (empty for
+        NXDOMAIN/NoAnswer). Futures raise DNSException on other failures.
     """
-    score = 0.0
-    recommendations = []
+    resolver = _get_resolver(timeout_ms / 1000)
+    submit = _get_dns_executor().submit
+    return {
+        name: submit(
+            _resolve_with_retries, resolver, name, record_type, retries
+        )
+        for name in dict.fromkeys(hostnames)
+    }
 
-    # A records (20% of score)
-    if len(dns_data['a_records']) > 0:
-        score += 0.20
-    else:
-        recommendations.append("No A records (IPv4) found")
 
-    # AAAA records (10% of score) - optional but good to have
-    if len(dns_data['aaaa_records']) > 0:
-        score += 0.10
-    else:
-        recommendations.append(
-            "Consider adding AAAA records (IPv6) for future-proofing"
-        )
+# Scoring table: (feature, weight, recommendation when the feature is
+# absent). Features are derived by _dns_features() in this order; the
+# weights are summed in the same order so scores are reproducible.
+_DNS_SCORE_RULES = (
+    ('a', 0.20, "No A records (IPv4) found"),
+    ('aaaa', 0.10,
+     "Consider adding AAAA records (IPv6) for future-proofing"),
+    ('mx', 0.15, "No MX records found - email may not be configured"),
+    # Multiple MX records show redundancy
+    ('mx_redundant', 0.05, None),
+    ('ns_redundant', 0.20, None),
+    ('ns_single', 0.10,
+     "Only one NS record - add backup nameservers for reliability"),
+    ('spf', 0.10, "No SPF record found - add to prevent email spoofing"),
+    ('dmarc', 0.15, "No DMARC record found - add for email authentication"),
+    ('dkim', 0.10, "DKIM not detected - configure for email security"),
+)
+_DNS_WEIGHTS = tuple(weight for _, weight, _ in _DNS_SCORE_RULES)
+
+# Reliability bands: a score at or above _DNS_RELIABILITY_THRESHOLDS[i]
+# earns _DNS_RELIABILITY_LEVELS[i + 1]; (reliability, summary) pairs
+_DNS_RELIABILITY_THRESHOLDS = (0.40, 0.60, 0.80)
+_DNS_RELIABILITY_LEVELS = (
+    ('very_low', "Incomplete DNS configuration - multiple records missing"),
+    ('low', "Basic DNS setup - missing important records"),
+    ('medium', "Good DNS setup - consider adding missing security records"),
+    ('high', "Excellent DNS configuration with security features"),
+)
+
+
+def _dns_record_snapshot(dns_data: Dict[str, Any]) -> tuple:
+    """
+    Read every field the score depends on exactly once
 
-    # MX records (15% of score)
-    if len(dns_data['mx_records']) > 0:
-        score += 0.15
-        if len(dns_data['mx_records']) > 1:
-            # Multiple MX records show redundancy
-            score += 0.05
-    else:
-        recommendations.append(
-            "No MX records found - email may not be configured"
-        )
+    Returns:
+        (a, aaaa, mx, ns, has_spf, has_dmarc, has_dkim) with record counts
+        as ints and the rest as bools
+    """
+    return (
+        len(dns_data['a_records']),
+        len(dns_data['aaaa_records']),
+        len(dns_data['mx_records']),
+        len(dns_data['ns_records']),
+        bool(dns_data['spf_record']),
+        bool(dns_data['dmarc_record']),
+        bool(dns_data['dkim_configured']),
+    )
+
+
+def _dns_features(dns_data: Dict[str, Any]) -> tuple:
+    """Presence flags for _DNS_SCORE_RULES, in table order"""
+    a, aaaa, mx, ns, has_spf, has_dmarc, has_dkim = (
+        _dns_record_snapshot(dns_data)
+    )
+    return (
+        a > 0, aaaa > 0, mx > 0, mx > 1, ns >= 2, ns == 1,
+        has_spf, has_dmarc, has_dkim,
+    )
+
+
+_DNS_REC_NO_NS = "No NS records found"
+
+
+def _dns_recommendations(features: tuple, summary: str) -> List[str]:
+    """The reliability summary, then advice for each missing feature"""
+    recommendations = [summary]
+    for present, (name, _, message) in zip(features, _DNS_SCORE_RULES):
+        if name == 'ns_single':
+            # NS advice depends on both NS flags
+            if present:
+                recommendations.append(message)
+            elif not features[4]:
+                recommendations.append(_DNS_REC_NO_NS)
+        elif not present and message:
+            recommendations.append(message)
+    return recommendations
+
+
+def _dns_reliability(score: float) -> tuple:
+    """(reliability, summary) for an unrounded score"""
+    return _DNS_RELIABILITY_LEVELS[
+        bisect_right(_DNS_RELIABILITY_THRESHOLDS, score)
+    ]
 
-    # NS records (20% of score)
-    ns_count = len(dns_data['ns_records'])
-    if ns_count >= 2:
-        score += 0.20
-    elif ns_count == 1:
-        score += 0.10
-        recommendations.append(
-            "Only one NS record - add backup nameservers for reliability"
-        )
-    else:
-        recommendations.append("No NS records found")
 
-    # SPF record (10% of score)
-    if dns_data['spf_record']:
-        score += 0.10
-    else:
-        recommendations.append(
-            "No SPF record found - add to prevent email spoofing"
-        )
+def _calculate_dns_score(dns_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Calculate DNS reliability score
 
-    # DMARC record (15% of score)
-    if dns_data['dmarc_record']:
-        score += 0.15
-    else:
-        recommendations.append(
-            "No DMARC record found - add for email authentication"
-        )
+    Args:
+        dns_data: Dictionary with DNS records
 
-    # DKIM (10% of score)
-    if dns_data['dkim_configured']:
-        score += 0.10
-    else:
-        recommendations.append(
-            "DKIM not detected - configure for email security"
-        )
+    Returns:
+        Dict with score, reliability, and recommendations
+    """
+    features = _dns_features(dns_data)
+    # Weights of the present features, added in table order
+    score = sum(compress(_DNS_WEIGHTS, features), 0.0)
 
     # Determine reliability category
-    if score >= 0.80:
-        reliability = 'high'
-        recommendations.insert(
-            0, "Excellent DNS configuration with security features"
-        )
-    elif score >= 0.60:
-        reliability = 'medium'
-        recommendations.insert(
-            0, "Good DNS setup - consider adding missing security records"
-        )
-    elif score >= 0.40:
-        reliability = 'low'
-        recommendations.insert(
-            0, "Basic DNS setup - missing important records"
-        )
-    else:
-        reliability = 'very_low'
-        recommendations.insert(
-            0, "Incomplete DNS configuration - multiple records missing"
-        )
+    reliability, summary = _dns_reliability(score)
+    recommendations = _dns_recommendations(features, summary)
 
     return {
         'score': round(score, 2),
@@ -396,6 +735,49 @@ def _calculate_dns_score(dns_data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def calculate_dns_scores_batch(
+    dns_results: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Score many DNS results at once
+
+    With NumPy installed the features form an (N, K) matrix and each
+    weight column is added across all rows at once; weights are added in
+    table order, so every score matches _calculate_dns_score exactly.
+    Without NumPy this is a loop over _calculate_dns_score.
+
+    Args:
+        dns_results: List of dictionaries with DNS records
+
+    Returns:
+        List of dicts with score, reliability, and recommendations
+    """
+    if not NUMPY_AVAILABLE or not dns_results:
+        return [_calculate_dns_score(data) for data in dns_results]
+
+    features = np.array(
+        [_dns_features(data) for data in dns_results], dtype=bool
+    )
+    scores = np.zeros(len(dns_results), dtype=np.float64)
+    for column, weight in enumerate(_DNS_WEIGHTS):
+        scores += np.where(features[:, column], weight, 0.0)
+
+    levels = np.searchsorted(
+        _DNS_RELIABILITY_THRESHOLDS, scores, side='right'
+    ).tolist()
+
+    results = []
+    for row, score, level in zip(features, scores.tolist(), levels):
+        reliability, summary = _DNS_RELIABILITY_LEVELS[level]
+        recommendations = _dns_recommendations(tuple(row.tolist()), summary)
+        results.append({
+            'score': round(score, 2),
+            'reliability': reliability,
+            'recommendations': recommendations
+        })
+    return results
+
+
 def verify_dnssec(domain: str) -> Dict[str, Any]:
     """
     Check if DNSSEC is enabled for the domain
@@ -413,23 +795,15 @@ def verify_dnssec(domain: str) -> Dict[str, Any]:
     }
 
     try:
-        # Parse domain from URL if needed
-        if domain.startswith('http'):
-            domain = urlparse(domain).hostname
+        domain = _normalize_hostname(domain)
 
-        if domain.startswith('www.'):
-            domain = domain[4:]
-
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = 5
-
-        # Check for DS records (DNSSEC delegation signer)
+        # Check for DS records (DNSSEC delegation signer). check_dns_records
+        # queries DS in its batch, so this is usually a cache hit.
         try:
-            ds_answers = resolver.resolve(domain, 'DS')
-            result['ds_records'] = [str(ds) for ds in ds_answers]
-            result['dnssec_enabled'] = True
-        except dns.resolver.NoAnswer:
-            result['dnssec_enabled'] = False
+            result['ds_records'] = _race_ds_lookups(
+                _submit_ds_lookups(_get_resolver(5), domain, 5), 5
+            )
+            result['dnssec_enabled'] = bool(result['ds_records'])
         except dns.exception.DNSException as e:
             # DNSSEC not configured or query failed
             logger.debug(f"DNSSEC verification failed: {e}")
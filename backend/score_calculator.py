@@ -5,15 +5,87 @@ Calculates composite authenticity scores for website analysis
 Now includes cipher and DNS scoring
 """
 
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import logging
 
+try:
+    from backend.score_kernels import (
+        AGE_EDGES,
+        AGE_SCORES,
+        SSL_SCORE_TABLE,
+        batch_domain_age_scores,
+        batch_ssl_scores,
+        batch_trust_levels,
+        batch_weighted_composite,
+    )
+except ImportError:
+    from score_kernels import (
+        AGE_EDGES,
+        AGE_SCORES,
+        SSL_SCORE_TABLE,
+        batch_domain_age_scores,
+        batch_ssl_scores,
+        batch_trust_levels,
+        batch_weighted_composite,
+    )
+
 logger = logging.getLogger(__name__)
 
+# Trust bands for 0-100 composites: a score at or above
+# TRUST_THRESHOLDS[i] earns TRUST_LEVELS[i + 1]
+TRUST_THRESHOLDS = (60, 80)
+TRUST_LEVELS = ("low", "medium", "high")
+_MEDIUM_TRUST_MIN, _HIGH_TRUST_MIN = TRUST_THRESHOLDS
+
+# Risk bands, the same way round: reaching RISK_THRESHOLDS[i] earns
+# RISK_LEVELS[i + 1]
+RISK_THRESHOLDS = (40, 60, 75, 85)
+RISK_LEVELS = ("very_high", "high", "medium", "low", "very_low")
+
+# Recommendation messages, shared by every ScoreCalculator call
+_REC_TRUSTWORTHY = "This appears to be a trustworthy site"
+_REC_NORMAL_CAUTION = "Exercise normal caution when interacting"
+_REC_CAUTION = "Exercise caution when providing sensitive information"
+_REC_NEW_DOMAIN = "Domain is relatively new - verify legitimacy"
+_REC_SSL_INVALID = "SSL certificate is invalid - avoid entering sensitive data"
+_REC_SSL_EXPIRING = "SSL certificate expiring soon"
+_REC_WEAK_CIPHER = "Weak encryption detected - site may be vulnerable"
+_REC_SOME_WEAK_CIPHERS = "Site supports some weak cipher suites"
+_REC_DNS_INCOMPLETE = (
+    "DNS configuration incomplete - verify site authenticity"
+)
+_REC_NO_SPF = "No SPF record - email security may be compromised"
+
+
+def classify_trust_level(score: float) -> str:
+    """Map a 0-100 composite score to its trust level"""
+    # Count the thresholds reached; NaN reaches none and rates low
+    return TRUST_LEVELS[
+        (score >= _MEDIUM_TRUST_MIN) + (score >= _HIGH_TRUST_MIN)
+    ]
+
+
+def classify_risk_level(score: float) -> str:
+    """Map a 0-100 composite score to its risk level"""
+    # Counted like classify_trust_level, so NaN rates very_high
+    return RISK_LEVELS[sum(score >= t for t in RISK_THRESHOLDS)]
+
 
 class ScoreCalculator:
     """Main class for calculating composite trust scores"""
 
+    # The weights are stored once as a tuple that unpacks straight into
+    # the composite scorer; the named weights are read-only views of it,
+    # so the two can't drift apart. No per-instance __dict__.
+    __slots__ = ("_weights",)
+
+    domain_weight = property(lambda self: self._weights[0])
+    ssl_weight = property(lambda self: self._weights[1])
+    cipher_weight = property(lambda self: self._weights[2])
+    dns_weight = property(lambda self: self._weights[3])
+
     def __init__(
         self,
         domain_weight: float = 0.6,
@@ -30,10 +102,7 @@ class ScoreCalculator:
             cipher_weight: Weight for cipher score (default 0.0)
             dns_weight: Weight for DNS score (default 0.0)
         """
-        self.domain_weight = domain_weight
-        self.ssl_weight = ssl_weight
-        self.cipher_weight = cipher_weight
-        self.dns_weight = dns_weight
+        self._weights = (domain_weight, ssl_weight, cipher_weight, dns_weight)
 
         # Ensure weights sum to 1.0
         total_weight = (
@@ -62,7 +131,9 @@ class ScoreCalculator:
             dns_data: Dict with DNS record information (optional)
 
         Returns:
-            Dict with composite_score, individual scores, trust_level
+            Dict with composite_score, individual scores, trust_level.
+            Cipher and DNS scores are the neutral 50 when their data is
+            missing or their weight is zero.
         """
         # Extract domain age
         domain_age_years = domain_data.get("domain_age_years")
@@ -70,26 +141,25 @@ class ScoreCalculator:
         # Calculate individual scores
         domain_score = calculate_domain_age_score(domain_age_years)
         ssl_score = calculate_ssl_score(ssl_data)
+        # A category that carries no weight can't move the composite, so
+        # it isn't scored (recommendations still cover it)
         cipher_score = (
             calculate_cipher_score(cipher_data)
-            if cipher_data else 50.0
+            if cipher_data and self.cipher_weight else 50.0
         )
         dns_score = (
             calculate_dns_score(dns_data)
-            if dns_data else 50.0
+            if dns_data and self.dns_weight else 50.0
         )
 
-        # Calculate composite score with weights
-        composite = calculate_weighted_composite_score(
+        # Calculate composite score with weights, rounded once here
+        composite = round(calculate_weighted_composite_score(
             domain_score,
             ssl_score,
             cipher_score,
             dns_score,
-            self.domain_weight,
-            self.ssl_weight,
-            self.cipher_weight,
-            self.dns_weight
-        )
+            *self._weights
+        ), 1)
 
         # Determine trust level
         trust_level = self._get_trust_level(composite)
@@ -104,9 +174,10 @@ class ScoreCalculator:
         )
 
         return {
-            "composite_score": round(composite, 1),
-            "domain_score": round(domain_score, 1),
-            "ssl_score": round(ssl_score, 1),
+            "composite_score": composite,
+            # Domain and SSL scores are whole numbers already
+            "domain_score": domain_score,
+            "ssl_score": ssl_score,
             "cipher_score": round(cipher_score, 1),
             "dns_score": round(dns_score, 1),
             "trust_level": trust_level,
@@ -119,14 +190,73 @@ class ScoreCalculator:
             "recommendations": recommendations,
         }
 
+    def calculate_composites_batch(self, scores: Any) -> Dict[str, list]:
+        """
+        Composite scores and trust levels for many sites at once
+
+        Args:
+            scores: (N, 4) rows of [domain, ssl, cipher, dns] scores
+                (0-100), e.g. a preallocated float64 NumPy array
+
+        Returns:
+            Dict with composite_scores (rounded like calculate_score) and
+            trust_levels, one entry per row
+        """
+        composites = batch_weighted_composite(scores, self._weights)
+        composites = [round(float(c), 1) for c in composites]
+        return {
+            "composite_scores": composites,
+            "trust_levels": batch_trust_levels(
+                composites, TRUST_THRESHOLDS, TRUST_LEVELS
+            ),
+        }
+
+    def calculate_scores(
+        self,
+        ages: Any,
+        ssl_valid: Any,
+        cipher_strength_code: Any = None,
+        expiring: Any = None,
+        days_until_expiry: Any = None,
+    ) -> Any:
+        """
+        Composite scores for many sites from per-field columns
+
+        The batch form of calculate_score without cipher or DNS data: each
+        argument holds one value per site, so no per-site dicts are built.
+
+        Args:
+            ages: Domain ages in years (None/NaN when unknown)
+            ssl_valid: Certificate validity flags
+            cipher_strength_code: score_kernels.encode_cipher_strength
+                output (default unknown)
+            expiring: Expiring-soon flags (default False)
+            days_until_expiry: Days left; None/NaN when unknown
+
+        Returns:
+            Unrounded composites (float64 array with NumPy, list
+            otherwise); calculate_score rounds these to one decimal
+        """
+        domain = batch_domain_age_scores(ages)
+        ssl = batch_ssl_scores(
+            ssl_valid, cipher_strength_code, expiring, days_until_expiry
+        )
+        # No cipher or DNS data: both score the neutral 50. Terms are added
+        # in calculate_weighted_composite_score's order, so results match.
+        w_domain, w_ssl, w_cipher, w_dns = self._weights
+        cipher = dns = 50.0
+        if isinstance(domain, list):
+            return [
+                d * w_domain + s * w_ssl + cipher * w_cipher + dns * w_dns
+                for d, s in zip(domain, ssl)
+            ]
+        return (
+            domain * w_domain + ssl * w_ssl + cipher * w_cipher + dns * w_dns
+        )
+
     def _get_trust_level(self, score: float) -> str:
         """Determine trust level from score"""
-        if score >= 80:
-            return "high"
-        elif score >= 60:
-            return "medium"
-        else:
-            return "low"
+        return classify_trust_level(score)
 
     def _generate_recommendations(
         self,
@@ -137,56 +267,41 @@ class ScoreCalculator:
         dns_data: Optional[Dict[str, Any]]
     ) -> list:
         """Generate recommendations based on score and data"""
-        recommendations = []
-
         if score >= 80:
-            recommendations.append("This appears to be a trustworthy site")
+            recommendations = [_REC_TRUSTWORTHY]
         elif score >= 60:
-            recommendations.append("Exercise normal caution when interacting")
+            recommendations = [_REC_NORMAL_CAUTION]
         else:
-            recommendations.append(
-                "Exercise caution when providing sensitive information"
-            )
+            recommendations = [_REC_CAUTION]
 
         # Domain-specific recommendations
         if domain_age is not None and domain_age < 1:
-            recommendations.append(
-                "Domain is relatively new - verify legitimacy"
-            )
+            recommendations.append(_REC_NEW_DOMAIN)
 
         # SSL-specific recommendations
         if not ssl_data.get("is_valid") and not ssl_data.get("valid"):
-            recommendations.append(
-                "SSL certificate is invalid - avoid entering sensitive data"
-            )
+            recommendations.append(_REC_SSL_INVALID)
         elif ssl_data.get("expiring_soon"):
-            recommendations.append("SSL certificate expiring soon")
+            recommendations.append(_REC_SSL_EXPIRING)
 
         # Cipher-specific recommendations
         if cipher_data:
             if cipher_data.get("cipher_strength") == "weak":
-                recommendations.append(
-                    "Weak encryption detected - site may be vulnerable"
-                )
+                recommendations.append(_REC_WEAK_CIPHER)
             elif cipher_data.get("weak_ciphers_found"):
-                recommendations.append(
-                    "Site supports some weak cipher suites"
-                )
+                recommendations.append(_REC_SOME_WEAK_CIPHERS)
 
         # DNS-specific recommendations
         if dns_data:
             if dns_data.get("dns_score", 1.0) < 0.5:
-                recommendations.append(
-                    "DNS configuration incomplete - verify site authenticity"
-                )
+                recommendations.append(_REC_DNS_INCOMPLETE)
             if not dns_data.get("spf_record"):
-                recommendations.append(
-                    "No SPF record - email security may be compromised"
-                )
+                recommendations.append(_REC_NO_SPF)
 
         return recommendations
 
 
+@lru_cache(maxsize=1024)
 def calculate_domain_age_score(age_years: Optional[float]) -> float:
     """
     Calculate score based on domain age
@@ -198,17 +313,23 @@ def calculate_domain_age_score(age_years: Optional[float]) -> float:
     - <1 year: 20
     - Unknown/negative: 20
     """
-    if age_years is None or age_years < 0:
+    # "not >= 0" also sends NaN, which bisect would place last, to 20
+    if age_years is None or not age_years >= 0:
         return 20
 
-    if age_years >= 5:
-        return 100
-    elif age_years >= 3:
-        return 70
-    elif age_years >= 1:
-        return 50
-    else:
-        return 20
+    return AGE_SCORES[bisect_right(AGE_EDGES, age_years)]
+
+
+# Default for dict lookups that must tell an absent key from a None value
+_MISSING = object()
+
+# Row and column indices into score_kernels.SSL_SCORE_TABLE, the scores
+# for a valid certificate. Weak and medium ciphers cap the score at 70; any
+# other strength label counts as strong. Expiring soon caps it at 50,
+# under 30 days left at 70.
+_SSL_CIPHER_WEAK, _SSL_CIPHER_MEDIUM, _SSL_CIPHER_STRONG = 0, 1, 2
+_SSL_CIPHER_ENUM = {"weak": _SSL_CIPHER_WEAK, "medium": _SSL_CIPHER_MEDIUM}
+_SSL_EXPIRING, _SSL_UNDER_30_DAYS, _SSL_NOT_EXPIRING = 0, 1, 2
 
 
 def calculate_ssl_score(ssl_data: Dict[str, Any]) -> float:
@@ -228,33 +349,43 @@ def calculate_ssl_score(ssl_data: Dict[str, Any]) -> float:
     if not ssl_data:
         return 0
 
-    # Check validity (support both 'is_valid' and 'valid' keys)
-    is_valid = ssl_data.get("is_valid", ssl_data.get("valid", False))
+    # Check validity (support both 'is_valid' and 'valid' keys); 'valid'
+    # is only looked up when 'is_valid' is absent
+    is_valid = ssl_data.get("is_valid", _MISSING)
+    if is_valid is _MISSING:
+        is_valid = ssl_data.get("valid", False)
     if not is_valid:
         return 0
 
-    # Base score for valid certificate
-    score = 100
-
-    # Check cipher strength
-    cipher_strength = ssl_data.get("cipher_strength", "").lower()
-    if cipher_strength == "weak":
-        score = 70
-    elif cipher_strength == "medium":
-        score = 70
-    # 'strong' stays at 100
+    cipher = _SSL_CIPHER_ENUM.get(
+        (ssl_data.get("cipher_strength") or "").lower(), _SSL_CIPHER_STRONG
+    )
+    if ssl_data.get("expiring_soon", False):
+        expiry = _SSL_EXPIRING
+    else:
+        days_until_expiry = ssl_data.get("days_until_expiry")
+        expiry = (
+            _SSL_UNDER_30_DAYS
+            if days_until_expiry is not None and days_until_expiry < 30
+            else _SSL_NOT_EXPIRING
+        )
+    return SSL_SCORE_TABLE[cipher][expiry]
 
-    # Check expiration
-    expiring_soon = ssl_data.get("expiring_soon", False)
-    days_until_expiry = ssl_data.get("days_until_expiry")
 
-    if expiring_soon:
-        score = min(score, 50)
-    elif days_until_expiry is not None:
-        if days_until_expiry < 30:
-            score = min(score, 70)
+def _ssl_score_from_args(
+    valid: bool | float, days_until_expiry: Optional[float]
+) -> float:
+    """
+    calculate_ssl_score for the dict calculate_composite_score used to build
 
-    return score
+    That dict carried no cipher strength and derived expiring_soon from the
+    days left, so only the validity and expiry checks remain.
+    """
+    if not valid:
+        return 0
+    if days_until_expiry is not None and days_until_expiry < 30:
+        return 50
+    return 100
 
 
 def calculate_cipher_score(cipher_data: Dict[str, Any]) -> float:
@@ -322,6 +453,7 @@ def calculate_dns_score(dns_data: Dict[str, Any]) -> float:
     return score
 
 
+@lru_cache(maxsize=4096)
 def calculate_weighted_composite_score(
     domain_score: float,
     ssl_score: float,
@@ -346,15 +478,19 @@ def calculate_weighted_composite_score(
         dns_weight: Weight for DNS score (default 0.20)
 
     Returns:
-        Composite score (0-100)
+        Composite score (0-100), unrounded; callers round for display
     """
-    composite = (
+    return (
         (domain_score * domain_weight) +
         (ssl_score * ssl_weight) +
         (cipher_score * cipher_weight) +
         (dns_score * dns_weight)
     )
-    return round(composite, 1)
+
+
+def _is_numeric_nonbool(x: Any) -> bool:
+    """True for int/float values other than bools"""
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
 
 
 def calculate_composite_score(
@@ -385,13 +521,8 @@ def calculate_composite_score(
         # Some older callers pass numeric domain and SSL scores as the first
         # two positional args. Detect that shape (numeric, non-bool) and
         # return a numeric composite for backward compatibility.
-        def _is_numeric_nonbool(x):
-            return isinstance(x, (int, float)) and not isinstance(x, bool)
-
-        if (
-            _is_numeric_nonbool(domain_age_years)
-            and _is_numeric_nonbool(ssl_valid)
-        ):
+        numeric_ssl = _is_numeric_nonbool(ssl_valid)
+        if numeric_ssl and _is_numeric_nonbool(domain_age_years):
             domain_score_val = float(domain_age_years)
             ssl_score_val = float(ssl_valid)
 
@@ -421,50 +552,31 @@ def calculate_composite_score(
         # Calculate domain score
         domain_score = calculate_domain_age_score(domain_age_years)
 
-        # Build SSL data dict
-        ssl_data = {
-            "valid": ssl_valid,
-            "is_valid": ssl_valid,
-            "days_until_expiry": ssl_days_remaining,
-            "expiring_soon": (
-                ssl_days_remaining < 30
-                if ssl_days_remaining is not None
-                else False
-            ),
-            "issuer": ssl_issuer
-        }
-
-        # Calculate SSL score
-        ssl_score_val = calculate_ssl_score(ssl_data)
+        # Calculate SSL score straight from the arguments
+        ssl_score_val = _ssl_score_from_args(ssl_valid, ssl_days_remaining)
 
         # Convert normalized scores (0.0-1.0) to 0-100 scale
         cipher_score_val = cipher_score * 100
         dns_score_val = dns_score * 100
 
-        # Calculate weighted composite
-        composite = calculate_weighted_composite_score(
+        # Calculate weighted composite, rounded once at the API boundary
+        composite = round(calculate_weighted_composite_score(
             domain_score,
             ssl_score_val,
             cipher_score_val,
             dns_score_val
-        )
+        ), 1)
 
-        # Determine trust level
-        if composite >= 80:
-            trust_level = "high"
-        elif composite >= 60:
-            trust_level = "medium"
-        else:
-            trust_level = "low"
-
-        # Legacy numeric style: first two args are numbers.
-        # Return numeric composite for backward-compatibility.
-        if (
-            isinstance(ssl_valid, (int, float))
-            and not isinstance(ssl_valid, bool)
-        ):
+        # Legacy numeric style with a non-numeric domain age: the SSL
+        # argument is a number, so return the bare composite as before.
+        # It is scored as an age/validity call, so it can't share the
+        # early return above.
+        if numeric_ssl:
             return composite
 
+        # Determine trust level
+        trust_level = classify_trust_level(composite)
+
         return {
             "composite_score": composite,
             "domain_score": domain_score,
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+Score Kernels Module
+Batch versions of the score_calculator helpers for scoring many sites at
+once. Uses NumPy when installed and falls back to plain Python otherwise;
+results match the scalar functions exactly in both modes. score_site fuses
+every helper into one kernel that Numba compiles when it is installed.
+"""
+
+from typing import Any, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Integer codes for SSL cipher strength, encoded once per batch
+CIPHER_STRENGTH_CODES = {'strong': 2, 'medium': 1, 'weak': 0}
+CIPHER_STRENGTH_UNKNOWN = -1
+
+# Domain age buckets: an age at or above AGE_EDGES[i] years earns
+# AGE_SCORES[i + 1]
+AGE_EDGES = (1, 3, 5)
+AGE_SCORES = (20, 50, 70, 100)
+
+# Scores for a valid certificate, indexed by [cipher code, expiry bucket]
+# with buckets (expiring soon, under 30 days left, neither). Codes other
+# than weak/medium, unknown included, score as strong.
+SSL_SCORE_TABLE = (
+    (50, 70, 70),
+    (50, 70, 70),
+    (50, 70, 100),
+)
+
+# Every per-category score is a whole number in 0-100, so batch scores
+# are held in uint8: an eighth of the memory traffic of float64, and
+# lossless, since weighting promotes them back to exact float64 values.
+if NUMPY_AVAILABLE:
+    _AGE_SCORES_U8 = np.array(AGE_SCORES, dtype=np.uint8)
+    _SSL_TABLE_U8 = np.array(SSL_SCORE_TABLE, dtype=np.uint8)
+
+
+def encode_cipher_strength(strengths: Sequence[Optional[str]]) -> Any:
+    """
+    Encode cipher strength labels as integer codes
+
+    Args:
+        strengths: Labels such as 'strong', 'medium', 'weak' (any case)
+
+    Returns:
+        Codes per CIPHER_STRENGTH_CODES, -1 for unknown/missing labels
+    """
+    codes = [
+        CIPHER_STRENGTH_CODES.get(
+            (label or '').lower(), CIPHER_STRENGTH_UNKNOWN
+        )
+        for label in strengths
+    ]
+    return np.array(codes, dtype=np.int8) if NUMPY_AVAILABLE else codes
+
+
+def _domain_age_score(age: Optional[float]) -> float:
+    """Scalar mapping shared by the fallback path"""
+    if age is None or age != age or age < 0:
+        return 20
+    if age >= 5:
+        return 100
+    if age >= 3:
+        return 70
+    if age >= 1:
+        return 50
+    return 20
+
+
+def batch_domain_age_scores(ages: Sequence[Optional[float]]) -> Any:
+    """
+    Vectorized calculate_domain_age_score
+
+    Args:
+        ages: Domain ages in years; None/NaN/negative count as unknown
+
+    Returns:
+        Scores (uint8 array with NumPy, list otherwise)
+    """
+    if not NUMPY_AVAILABLE:
+        return [_domain_age_score(age) for age in ages]
+
+    ages = np.array(
+        [np.nan if age is None else age for age in ages], dtype=np.float64
+    )
+    # digitize buckets like bisect_right but puts NaN last, so unknown
+    # (NaN or negative) ages are masked back to the lowest score
+    scores = _AGE_SCORES_U8[np.digitize(ages, AGE_EDGES)]
+    return np.where(ages >= 0, scores, _AGE_SCORES_U8[0])
+
+
+def _ssl_score(valid, code, expiring_soon, days) -> float:
+    """Scalar mapping shared by the fallback path"""
+    if not valid:
+        return 0
+    score = 70 if code in (0, 1) else 100
+    if expiring_soon:
+        score = min(score, 50)
+    elif days is not None and days == days and days < 30:
+        score = min(score, 70)
+    return score
+
+
+def batch_ssl_scores(
+    valids: Sequence[bool],
+    cipher_codes: Optional[Sequence[int]] = None,
+    expiring_soon: Optional[Sequence[bool]] = None,
+    days_until_expiry: Optional[Sequence[Optional[float]]] = None,
+) -> Any:
+    """
+    Vectorized calculate_ssl_score
+
+    Args:
+        valids: Certificate validity flags
+        cipher_codes: Output of encode_cipher_strength (default unknown)
+        expiring_soon: Expiring-soon flags (default False)
+        days_until_expiry: Days left; None/NaN when unknown
+
+    Returns:
+        Scores (uint8 array with NumPy, list otherwise)
+    """
+    n = len(valids)
+    if cipher_codes is None:
+        cipher_codes = [CIPHER_STRENGTH_UNKNOWN] * n
+    if expiring_soon is None:
+        expiring_soon = [False] * n
+    if days_until_expiry is None:
+        days_until_expiry = [None] * n
+
+    if not NUMPY_AVAILABLE:
+        return [
+            _ssl_score(*row) for row in zip(
+                valids, cipher_codes, expiring_soon, days_until_expiry
+            )
+        ]
+
+    valids = np.asarray(valids, dtype=bool)
+    codes = np.asarray(cipher_codes, dtype=np.int8)
+    expiring = np.asarray(expiring_soon, dtype=bool)
+    days = np.array(
+        [np.nan if d is None else d for d in days_until_expiry],
+        dtype=np.float64
+    )
+
+    rows = np.where((codes == 0) | (codes == 1), codes, np.int8(2))
+    buckets = np.where(
+        expiring, np.int8(0), np.where(days < 30, np.int8(1), np.int8(2))
+    )
+    return np.where(valids, _SSL_TABLE_U8[rows, buckets], np.uint8(0))
+
+
+@njit(cache=True)
+def _composite(domain, ssl, domain_weight, ssl_weight):
+    """Legacy calculate_composite_score arithmetic on two scores"""
+    return domain * domain_weight + ssl * ssl_weight
+
+
+@njit(parallel=True, cache=True)
+def _composite_kernel(domain_scores, ssl_scores, domain_weight, ssl_weight):
+    """_composite over whole columns; rows are independent"""
+    out = np.empty(domain_scores.shape[0])
+    for i in prange(domain_scores.shape[0]):
+        out[i] = _composite(
+            domain_scores[i], ssl_scores[i], domain_weight, ssl_weight
+        )
+    return out
+
+
+def calculate_composite_score_batch(
+    domain_scores: Sequence[float],
+    ssl_scores: Sequence[float],
+    domain_weight: float = 0.6,
+    ssl_weight: float = 0.4,
+) -> Any:
+    """
+    Vectorized legacy calculate_composite_score(domain, ssl, dw, sw)
+
+    Compiled and spread across cores with Numba, a NumPy expression
+    without it. Neither contracts the multiply-add, so every composite
+    matches the scalar function exactly.
+
+    Returns:
+        Unrounded composites (float64 array with NumPy, list otherwise)
+    """
+    if not NUMPY_AVAILABLE:
+        return [
+            _composite(d, s, domain_weight, ssl_weight)
+            for d, s in zip(domain_scores, ssl_scores)
+        ]
+
+    domain_scores = np.asarray(domain_scores, dtype=np.float64)
+    ssl_scores = np.asarray(ssl_scores, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _composite_kernel(
+            domain_scores, ssl_scores,
+            float(domain_weight), float(ssl_weight)
+        )
+    return domain_scores * domain_weight + ssl_scores * ssl_weight
+
+
+def batch_calculate_composite(
+    ages: Sequence[Optional[float]],
+    valids: Sequence[bool],
+    cipher_codes: Optional[Sequence[int]] = None,
+    days_until_expiry: Optional[Sequence[Optional[float]]] = None,
+    domain_weight: float = 0.6,
+    ssl_weight: float = 0.4,
+) -> tuple:
+    """
+    Score many sites from domain age and SSL data in one pass
+
+    Mirrors ScoreCalculator's default domain/SSL weighting. As in
+    calculate_composite_score, a certificate counts as expiring soon when
+    fewer than 30 days remain.
+
+    Returns:
+        (composite, domain_scores, ssl_scores); composites are unrounded
+    """
+    n = len(valids)
+    if days_until_expiry is None:
+        days_until_expiry = [None] * n
+    expiring = [d is not None and d == d and d < 30 for d in days_until_expiry]
+
+    domain_scores = batch_domain_age_scores(ages)
+    ssl_scores = batch_ssl_scores(
+        valids, cipher_codes, expiring, days_until_expiry
+    )
+
+    composite = calculate_composite_score_batch(
+        domain_scores, ssl_scores, domain_weight, ssl_weight
+    )
+    return composite, domain_scores, ssl_scores
+
+
+# Column order of the (N, 4) score matrices below
+SCORE_COLUMNS = ('domain', 'ssl', 'cipher', 'dns')
+
+
+def batch_weighted_composite(
+    scores: Any,
+    weights: Sequence[float] = (0.35, 0.25, 0.20, 0.20),
+) -> Any:
+    """
+    Vectorized calculate_weighted_composite_score
+
+    Columns are weighted and added left to right, the same order as the
+    scalar function, so every composite matches it exactly (a BLAS dot
+    product may sum in a different order and drift in the last bit).
+
+    Args:
+        scores: (N, 4) rows of [domain, ssl, cipher, dns] scores (0-100)
+        weights: Weights for the four columns
+
+    Returns:
+        Unrounded composites (float64 array with NumPy, list otherwise)
+    """
+    w_domain, w_ssl, w_cipher, w_dns = weights
+    if not NUMPY_AVAILABLE:
+        return [
+            domain * w_domain + ssl * w_ssl + cipher * w_cipher + dns * w_dns
+            for domain, ssl, cipher, dns in scores
+        ]
+
+    scores = np.asarray(scores, dtype=np.float64).reshape(-1, 4)
+    return (
+        scores[:, 0] * w_domain + scores[:, 1] * w_ssl +
+        scores[:, 2] * w_cipher + scores[:, 3] * w_dns
+    )
+
+
+def batch_trust_levels(
+    composites: Sequence[float],
+    thresholds: Sequence[float],
+    levels: Sequence[str],
+) -> list:
+    """
+    Vectorized trust banding: a composite at or above thresholds[i] earns
+    levels[i + 1], as in classify_trust_level. The level index is the
+    number of thresholds reached, so NaN composites rate levels[0].
+    """
+    if not NUMPY_AVAILABLE:
+        return [
+            levels[sum(c >= t for t in thresholds)] for c in composites
+        ]
+
+    composites = np.asarray(composites, dtype=np.float64)
+    indices = np.zeros(composites.shape, dtype=np.int8)
+    for threshold in thresholds:
+        indices += composites >= threshold
+    return [levels[i] for i in indices.tolist()]
+
+
+@njit(cache=True)
+def _score_site(age, ssl_valid, cipher_code, expiring_soon, days,
+                cipher_norm, n_weak, dns_norm,
+                w_domain, w_ssl, w_cipher, w_dns):
+    """Every score_calculator threshold on plain scalars; NaN = missing"""
+    # calculate_domain_age_score
+    if age >= 5:
+        domain = 100.0
+    elif age >= 3:
+        domain = 70.0
+    elif age >= 1:
+        domain = 50.0
+    else:
+        domain = 20.0
+
+    # calculate_ssl_score
+    if not ssl_valid:
+        ssl = 0.0
+    else:
+        ssl = 70.0 if cipher_code == 0 or cipher_code == 1 else 100.0
+        if expiring_soon:
+            ssl = min(ssl, 50.0)
+        elif days < 30:
+            ssl = min(ssl, 70.0)
+
+    # calculate_cipher_score; no cipher data scores neutral
+    if cipher_norm != cipher_norm:
+        cipher = 50.0
+    else:
+        cipher = cipher_norm * 100
+        if n_weak > 0:
+            cipher -= min(30, n_weak * 10)
+        cipher = max(0.0, min(100.0, cipher))
+
+    # calculate_dns_score
+    if dns_norm != dns_norm:
+        dns = 50.0
+    else:
+        dns = max(0.0, min(100.0, dns_norm * 100))
+
+    composite = (
+        domain * w_domain + ssl * w_ssl + cipher * w_cipher + dns * w_dns
+    )
+    return domain, ssl, cipher, dns, composite
+
+
+def score_site(
+    age: Optional[float],
+    ssl_valid: bool,
+    cipher_code: int = CIPHER_STRENGTH_UNKNOWN,
+    expiring_soon: bool = False,
+    days: Optional[float] = None,
+    cipher_norm: Optional[float] = None,
+    n_weak: int = 0,
+    dns_norm: Optional[float] = None,
+    weights: Sequence[float] = (0.6, 0.4, 0.0, 0.0),
+) -> tuple:
+    """
+    Score one site's raw attributes in a single kernel call
+
+    Matches ScoreCalculator.calculate_score before rounding.
+
+    Args:
+        age: Domain age in years
+        ssl_valid: Certificate validity
+        cipher_code: Code from encode_cipher_strength
+        expiring_soon: Certificate expiring-soon flag
+        days: Days until certificate expiry
+        cipher_norm: cipher_checker score (0.0-1.0); None when not checked
+        n_weak: Number of weak ciphers found
+        dns_norm: dns_checker score (0.0-1.0); None when not checked
+        weights: Domain, SSL, cipher and DNS weights
+
+    Returns:
+        (domain, ssl, cipher, dns, composite) scores, unrounded
+    """
+    return _score_site(
+        *_site_row(
+            age, ssl_valid, cipher_code, expiring_soon, days,
+            cipher_norm, n_weak, dns_norm
+        ),
+        *(float(w) for w in weights)
+    )
+
+
+def _site_row(
+    age, ssl_valid, cipher_code=CIPHER_STRENGTH_UNKNOWN,
+    expiring_soon=False, days=None, cipher_norm=None, n_weak=0,
+    dns_norm=None
+) -> tuple:
+    """score_site arguments as typed scalars, with NaN for None"""
+    nan = float('nan')
+    return (
+        nan if age is None else float(age),
+        bool(ssl_valid),
+        int(cipher_code),
+        bool(expiring_soon),
+        nan if days is None else float(days),
+        nan if cipher_norm is None else float(cipher_norm),
+        int(n_weak),
+        nan if dns_norm is None else float(dns_norm),
+    )
+
+
+# Structured record layout for batch_score_sites (score_site's arguments)
+SITE_DTYPE = [
+    ('age', 'f8'), ('ssl_valid', '?'), ('cipher_code', 'i1'),
+    ('expiring_soon', '?'), ('days', 'f8'), ('cipher_norm', 'f8'),
+    ('n_weak', 'i4'), ('dns_norm', 'f8'),
+]
+
+
+@njit(parallel=True, cache=True)
+def _batch_score_kernel(age, ssl_valid, cipher_code, expiring_soon, days,
+                        cipher_norm, n_weak, dns_norm,
+                        w_domain, w_ssl, w_cipher, w_dns):
+    """_score_site over whole columns; rows are independent"""
+    out = np.empty((age.shape[0], 5))
+    for i in prange(age.shape[0]):
+        domain, ssl, cipher, dns, composite = _score_site(
+            age[i], ssl_valid[i], cipher_code[i], expiring_soon[i], days[i],
+            cipher_norm[i], n_weak[i], dns_norm[i],
+            w_domain, w_ssl, w_cipher, w_dns
+        )
+        out[i, 0] = domain
+        out[i, 1] = ssl
+        out[i, 2] = cipher
+        out[i, 3] = dns
+        out[i, 4] = composite
+    return out
+
+
+def batch_score_sites(
+    sites: Sequence[Sequence[Any]],
+    weights: Sequence[float] = (0.6, 0.4, 0.0, 0.0),
+) -> Any:
+    """
+    score_site for many sites at once
+
+    With Numba the rows are packed into one SITE_DTYPE structured array and
+    scored by a compiled kernel spread across cores (prange). Without it,
+    score_site runs per row.
+
+    Args:
+        sites: Per-site tuples of score_site's positional arguments
+        weights: Domain, SSL, cipher and DNS weights
+
+    Returns:
+        (N, 5) float64 array with Numba, else a list of 5-tuples; columns
+        are (domain, ssl, cipher, dns, composite)
+    """
+    if not NUMBA_AVAILABLE:
+        return [score_site(*site, weights=weights) for site in sites]
+
+    records = np.fromiter(
+        (_site_row(*site) for site in sites),
+        dtype=SITE_DTYPE, count=len(sites)
+    )
+    return _batch_score_kernel(
+        *(records[name] for name, _ in SITE_DTYPE),
+        *(float(w) for w in weights)
+    )
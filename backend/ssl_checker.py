@@ -1,36 +1,86 @@
 import ssl
 import re
 import socket
-import OpenSSL.crypto
-from datetime import datetime
+from cryptography import x509
+from cryptography.x509.oid import NameOID
+from datetime import datetime, timezone
 from urllib.parse import urlparse
 import logging
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Verifying client context shared by every check: create_default_context()
+# loads the system CA store, which is far costlier than the handshake, and
+# wrap_socket() on a context that is never reconfigured is thread-safe.
+_DEFAULT_CTX = ssl.create_default_context()
+
+# Upper bound on concurrent handshakes in one check_ssl_batch call, however
+# large the requested concurrency
+SSL_BATCH_MAX_WORKERS = 64
+
+
+# Characters stripped from domain input: <, >, quotes, and parentheses
+_SANITIZE_CHARS = re.compile(r'[<>"\'()]')
+
 
 def sanitize_domain(domain: str) -> str:
     """Remove any script tags or suspicious characters from domain input"""
-    # Remove <, >, quotes, and parentheses
-    domain = re.sub(r'[<>"\'()]', '', domain)
-    # Remove any <script> or HTML tags
-    domain = re.sub(r'<.*?>', '', domain)
-    return domain.strip()
+    # Dropping < and > already takes apart any <script> or HTML tag, so a
+    # separate tag pass would never match
+    return _SANITIZE_CHARS.sub('', domain).strip()
 
 
-def check_ssl_certificate(url: str, timeout: int = 10) -> Dict[str, Any]:
-    """
-    Check SSL certificate validity and details
+# Anything in a URL beyond scheme://host/path (ports, user info, query,
+# fragment, IPv6 literals, whitespace) is left to urlparse
+_URLPARSE_NEEDED = re.compile(r'[\x00-\x20@?#\[\]:\\]')
 
-    Args:
-        url: The URL to check (e.g., 'https://example.com')
-        timeout: Connection timeout in seconds (default: 10)
 
-    Returns:
-        dict with certificate information
+def _fast_parse(url: str) -> Optional[Tuple[str, int]]:
+    """
+    (hostname, port) for http(s)://host[/path] URLs and bare hostnames,
+    matching what urlparse gives; None when urlparse is needed
     """
-    result = {
+    if url.startswith('https://'):
+        rest, is_url = url[8:], True
+    elif url.startswith('http://'):
+        rest, is_url = url[7:], True
+    else:
+        rest, is_url = url, False
+
+    hostname = rest.partition('/')[0]
+    if not hostname or _URLPARSE_NEEDED.search(rest):
+        return None
+    # urlparse lowercases a parsed hostname but not a bare path
+    return (hostname.lower() if is_url else hostname), 443
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, like certificate expiry dates"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _connect_any(addrs, port: int, timeout: int) -> socket.socket:
+    """Open a TCP connection to the first reachable address."""
+    last_error = None
+    for addr in addrs:
+        try:
+            return socket.create_connection((addr, port), timeout=timeout)
+        except OSError as e:
+            last_error = e
+    raise last_error or OSError("no addresses to connect to")
+
+
+def _new_result() -> Dict[str, Any]:
+    """Result skeleton shared by the URL parsing and handshake steps"""
+    return {
         'valid': False,
         'issuer': None,
         'subject': None,
@@ -41,31 +91,106 @@ def check_ssl_certificate(url: str, timeout: int = 10) -> Dict[str, Any]:
         'error': None
     }
 
+
+def check_ssl_certificate(
+    url: str,
+    timeout: int = 10,
+    host: Optional[str] = None,
+    ip: Optional[Union[str, Sequence[str]]] = None,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Check SSL certificate validity and details
+
+    Args:
+        url: The URL to check (e.g., 'https://example.com')
+        timeout: Connection timeout in seconds (default: 10)
+        host: Hostname already parsed from url; used for SNI and the
+            connection in place of the sanitized parse (url is still
+            parsed for the port)
+        ip: Address (or addresses, tried in order) already resolved for
+            host; skips DNS resolution
+        now: Naive UTC time to count days until expiry from (default:
+            the current time); check_ssl_batch passes one value for
+            the whole batch
+
+    Returns:
+        dict with certificate information
+    """
     try:
         # Parse URL to get hostname and port
-        parsed = urlparse(url)
-        hostname = parsed.hostname or parsed.netloc or parsed.path.split(
-            '/')[0]
-        port = parsed.port or 443
-        hostname = sanitize_domain(hostname)
+        fast = _fast_parse(url)
+        if fast:
+            hostname, port = fast
+        else:
+            parsed = urlparse(url)
+            port = parsed.port or 443
+            hostname = parsed.hostname or parsed.netloc or parsed.path.split(
+                '/')[0]
+        if host:
+            hostname = host
+        else:
+            hostname = sanitize_domain(hostname)
+
+            # Remove www. prefix if present for connection
+            if hostname.startswith('www.'):
+                hostname = hostname[4:]
+
+            # Clean hostname of any remaining path components
+            if '/' in hostname:
+                hostname = hostname.split('/')[0]
+    except Exception as e:
+        logger.error(f"Error checking SSL for {url}: {str(e)}")
+        result = _new_result()
+        result['error'] = str(e)
+        return result
 
-        # Remove www. prefix if present for connection
-        if hostname.startswith('www.'):
-            hostname = hostname[4:]
+    return _check_ssl_hostname(hostname, port, timeout, ip, now, target=url)
 
-        # Clean hostname of any remaining path components
-        if '/' in hostname:
-            hostname = hostname.split('/')[0]
 
+def check_ssl_certificate_host(
+    hostname: str,
+    port: int = 443,
+    timeout: int = 10,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Check the certificate of a hostname that is already normalized
+
+    Same result as check_ssl_certificate, without the URL parsing and
+    sanitizing; for bulk callers that clean their hostnames up front.
+    """
+    return _check_ssl_hostname(hostname, port, timeout, now=now)
+
+
+def _check_ssl_hostname(
+    hostname: str,
+    port: int,
+    timeout: int,
+    ip: Optional[Union[str, Sequence[str]]] = None,
+    now: Optional[datetime] = None,
+    target: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Handshake with hostname:port and report on its certificate"""
+    # What the caller asked for, used in log and error messages
+    target = target or hostname
+    result = _new_result()
+
+    try:
         logger.info(f"Checking SSL for {hostname}:{port}")
 
-        # Create SSL context
-        context = ssl.create_default_context()
+        context = _DEFAULT_CTX
 
         # Connect and get certificate
-        with socket.create_connection(
-            (hostname, port), timeout=timeout
-        ) as sock:
+        if ip:
+            addrs = [ip] if isinstance(ip, str) else list(ip)
+            # Prefer IPv4, which is reachable from more networks
+            addrs.sort(key=lambda a: ':' in a)
+            sock = _connect_any(addrs, port, timeout)
+        else:
+            sock = socket.create_connection((hostname, port), timeout=timeout)
+
+        with sock:
             with context.wrap_socket(
                 sock, server_hostname=hostname
             ) as ssock:
@@ -74,39 +199,28 @@ def check_ssl_certificate(url: str, timeout: int = 10) -> Dict[str, Any]:
                 cipher = ssock.cipher()
                 protocol = ssock.version()
 
-                # Parse certificate with OpenSSL for more details
-                x509 = OpenSSL.crypto.load_certificate(
-                    OpenSSL.crypto.FILETYPE_ASN1,
-                    cert_bin
-                )
+                # Parse certificate for more details
+                cert = x509.load_der_x509_certificate(cert_bin)
 
                 # Extract issuer
-                issuer_components = x509.get_issuer().get_components()
-                issuer_dict = {
-                    k.decode(): v.decode()
-                    for k, v in issuer_components
-                }
-                result['issuer'] = issuer_dict.get(
-                    'O', issuer_dict.get('CN', 'Unknown')
+                result['issuer'] = (
+                    _name_value(cert.issuer, NameOID.ORGANIZATION_NAME)
+                    or _name_value(cert.issuer, NameOID.COMMON_NAME)
+                    or 'Unknown'
                 )
 
                 # Extract subject
-                subject_components = x509.get_subject().get_components()
-                subject_dict = {
-                    k.decode(): v.decode()
-                    for k, v in subject_components
-                }
-                result['subject'] = subject_dict.get('CN', hostname)
-
-                # Check expiry
-                not_after_str = x509.get_notAfter().decode('ascii')
-                expiry_date = datetime.strptime(
-                    not_after_str, '%Y%m%d%H%M%SZ'
+                result['subject'] = (
+                    _name_value(cert.subject, NameOID.COMMON_NAME)
+                    or hostname
                 )
+
+                # Check expiry (naive UTC, as the notAfter field states it)
+                expiry_date = cert.not_valid_after_utc.replace(tzinfo=None)
                 result['expiry_date'] = expiry_date.isoformat()
 
                 # Calculate days until expiry
-                days_remaining = (expiry_date - datetime.now()).days
+                days_remaining = (expiry_date - (now or utcnow())).days
                 result['days_until_expiry'] = days_remaining
 
                 # Get cipher strength and protocol
@@ -117,7 +231,7 @@ def check_ssl_certificate(url: str, timeout: int = 10) -> Dict[str, Any]:
 
                 # Determine if certificate is valid
                 is_expired = days_remaining <= 0
-                is_self_signed_cert = is_self_signed(x509)
+                is_self_signed_cert = is_self_signed(cert)
 
                 # Mark as valid if not expired and not self-signed
                 result['valid'] = not is_expired and not is_self_signed_cert
@@ -142,41 +256,78 @@ def check_ssl_certificate(url: str, timeout: int = 10) -> Dict[str, Any]:
 
     except ssl.SSLCertVerificationError as e:
         logger.error(
-            f"SSL certificate verification failed for {url}: {str(e)}"
+            f"SSL certificate verification failed for {target}: {str(e)}"
         )
         result['error'] = f"Certificate verification failed: {str(e)}"
         result['valid'] = False
     except ssl.SSLError as e:
-        logger.error(f"SSL error for {url}: {str(e)}")
+        logger.error(f"SSL error for {target}: {str(e)}")
         result['error'] = f"SSL Error: {str(e)}"
         result['valid'] = False
     except socket.timeout:
-        logger.error(f"Timeout checking SSL for {url}")
+        logger.error(f"Timeout checking SSL for {target}")
         result['error'] = "Connection timeout"
         result['valid'] = False
     except socket.gaierror as e:
-        logger.error(f"DNS resolution failed for {url}: {str(e)}")
+        logger.error(f"DNS resolution failed for {target}: {str(e)}")
         result['error'] = f"DNS resolution failed: {str(e)}"
         result['valid'] = False
     except Exception as e:
-        logger.error(f"Error checking SSL for {url}: {str(e)}")
+        logger.error(f"Error checking SSL for {target}: {str(e)}")
         result['error'] = str(e)
         result['valid'] = False
 
     return result
 
 
-def is_self_signed(cert: OpenSSL.crypto.X509) -> bool:
-    """Check if certificate is self-signed"""
-    try:
-        issuer = cert.get_issuer()
-        subject = cert.get_subject()
+def _name_value(name: x509.Name, oid: x509.ObjectIdentifier) -> Optional[str]:
+    """Value of the last attribute with the given OID in name, if any"""
+    attributes = name.get_attributes_for_oid(oid)
+    return attributes[-1].value if attributes else None
+
+
+def check_ssl_batch(
+    urls: Sequence[str],
+    timeout: int = 10,
+    concurrency: int = SSL_BATCH_MAX_WORKERS,
+) -> List[Dict[str, Any]]:
+    """
+    Check many certificates concurrently
 
-        # Compare issuer and subject
-        issuer_str = str(issuer.get_components())
-        subject_str = str(subject.get_components())
+    Each check is almost entirely network wait, so running them on a pool
+    makes a batch cost roughly ceil(N / concurrency) handshakes of wall
+    time instead of N.
 
-        return issuer_str == subject_str
+    Args:
+        urls: URLs to check
+        timeout: Connection timeout per URL in seconds
+        concurrency: Maximum checks in flight at once, capped at
+            SSL_BATCH_MAX_WORKERS
+
+    Returns:
+        check_ssl_certificate results, in the same order as urls
+    """
+    if not urls:
+        return []
+
+    # One clock read for the whole batch
+    now = utcnow()
+
+    # Sized per batch, so one pool for the whole batch rather than a
+    # shared module pool
+    workers = max(1, min(concurrency, SSL_BATCH_MAX_WORKERS, len(urls)))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="ssl-batch"
+    ) as pool:
+        return list(pool.map(
+            lambda url: check_ssl_certificate(url, timeout, now=now), urls
+        ))
+
+
+def is_self_signed(cert: x509.Certificate) -> bool:
+    """Check if certificate is self-signed"""
+    try:
+        return cert.issuer == cert.subject
     except Exception as e:
         logger.warning(
             f"Error checking if certificate is self-signed: {e}"
@@ -184,28 +335,43 @@ def is_self_signed(cert: OpenSSL.crypto.X509) -> bool:
         return False
 
 
+TRUSTED_CAS = (
+    'DigiCert', "Let's Encrypt", 'GeoTrust', 'Comodo', 'Sectigo',
+    'GlobalSign', 'GoDaddy', 'Entrust', 'Thawte', 'RapidSSL',
+    'Symantec', 'VeriSign', 'Amazon', 'Google Trust Services',
+    'Microsoft', 'CloudFlare', 'cPanel', 'Plesk', 'ZeroSSL',
+    'IdenTrust', 'DST Root CA', 'ISRG Root', 'WR2', 'WE1',
+    'R3', 'R10', 'E1', 'E5'
+)
+
+# Case-insensitive substring match against every CA in one scan: an
+# Aho-Corasick automaton when pyahocorasick is installed, else a regex
+_TRUSTED_CAS_LOWER = tuple(ca.lower() for ca in TRUSTED_CAS)
+_TRUSTED_RE = re.compile('|'.join(map(re.escape, _TRUSTED_CAS_LOWER)))
+
+if AHOCORASICK_AVAILABLE:
+    _TRUSTED_AC = ahocorasick.Automaton()
+    for _ca in _TRUSTED_CAS_LOWER:
+        _TRUSTED_AC.add_word(_ca, _ca)
+    _TRUSTED_AC.make_automaton()
+    del _ca
+
+
 def is_trusted_issuer(issuer: str) -> bool:
     """Check if the issuer is from a known trusted CA"""
     if not issuer:
         return False
 
-    trusted_cas = [
-        'DigiCert', "Let's Encrypt", 'GeoTrust', 'Comodo', 'Sectigo',
-        'GlobalSign', 'GoDaddy', 'Entrust', 'Thawte', 'RapidSSL',
-        'Symantec', 'VeriSign', 'Amazon', 'Google Trust Services',
-        'Microsoft', 'CloudFlare', 'cPanel', 'Plesk', 'ZeroSSL',
-        'IdenTrust', 'DST Root CA', 'ISRG Root', 'WR2', 'WE1',
-        'R3', 'R10', 'E1', 'E5'
-    ]
-
     issuer_lower = issuer.lower()
-    return any(ca.lower() in issuer_lower for ca in trusted_cas)
+    if AHOCORASICK_AVAILABLE:
+        return next(_TRUSTED_AC.iter(issuer_lower), None) is not None
+    return _TRUSTED_RE.search(issuer_lower) is not None
 
 
 def get_certificate_chain(hostname: str, port: int = 443) -> list:
     """Get the full certificate chain"""
     try:
-        context = ssl.create_default_context()
+        context = _DEFAULT_CTX
         with socket.create_connection(
             (hostname, port), timeout=10
         ) as sock:
@@ -1,7 +1,174 @@
 # Ensure the backend package root is on sys.path for imports during tests
 import sys
 import os
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+    BENCHMARK_AVAILABLE = True
+except ImportError:
+    BENCHMARK_AVAILABLE = False
 
 ROOT = os.path.dirname(os.path.dirname(__file__))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "network: talks to live DNS/TLS endpoints "
+        "(deselect with -m 'not network')",
+    )
+    # Enforced by pytest-timeout (requirements-dev.txt); registered here
+    # too so the marks stay warning-free where the plugin isn't installed
+    config.addinivalue_line(
+        "markers", "timeout(seconds, method): fail a test that runs too long"
+    )
+
+
+if not BENCHMARK_AVAILABLE:
+    @pytest.fixture
+    def benchmark():
+        """Stand-in for pytest-benchmark's fixture: skip the benchmark"""
+        pytest.skip("pytest-benchmark not installed")
+
+
+# Every live-network probe the suite makes, as (kind, domain, timeout);
+# a timeout of None calls the check with its own default.
+# Each one runs once per session; tests index the results by (kind, domain).
+LIVE_PROBES = (
+    ("cipher", "google.com", 10),
+    ("cipher", "https://www.github.com", 10),
+    ("cipher", "github.com", 10),
+    ("cipher", "thisdoesnotexist12345.com", 5),
+    ("dns", "google.com", 10),
+    ("dns", "https://www.github.com", 10),
+    ("dns", "github.com", 10),
+    ("dns", "thisdoesnotexist12345xyz.com", 5),
+    ("dnssec", "cloudflare.com", None),
+)
+
+
+@pytest.fixture(scope="session")
+def live_probes():
+    """Run all live cipher/DNS/DNSSEC probes in parallel, once per session"""
+    from cipher_checker import check_ciphers
+    from dns_checker import check_dns_records, verify_dnssec
+
+    checks = {
+        "cipher": check_ciphers,
+        "dns": check_dns_records,
+        "dnssec": verify_dnssec,
+    }
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        futures = {}
+        for kind, domain, timeout in LIVE_PROBES:
+            kwargs = {} if timeout is None else {"timeout": timeout}
+            futures[kind, domain] = pool.submit(checks[kind], domain, **kwargs)
+        return {key: future.result() for key, future in futures.items()}
+
+
+# Answers recorded from the live zones, as (qname, type) -> rdata text.
+# Names not listed behave like NXDOMAIN.
+RECORDED_DNS = {
+    ("google.com", "A"): ("142.250.80.46",),
+    ("google.com", "AAAA"): ("2607:f8b0:4006:80f::200e",),
+    ("google.com", "MX"): ("10 smtp.google.com.",),
+    ("google.com", "NS"): (
+        "ns1.google.com.", "ns2.google.com.",
+        "ns3.google.com.", "ns4.google.com.",
+    ),
+    ("google.com", "TXT"): (
+        '"v=spf1 include:_spf.google.com ~all"',
+        '"google-site-verification=TV9-DBe4R80X4v0M4U_bd_J9cpOJM0"',
+    ),
+    ("_dmarc.google.com", "TXT"): (
+        '"v=DMARC1; p=reject; rua=mailto:mailauth-reports@google.com"',
+    ),
+    ("gmail.com", "A"): ("142.250.80.69",),
+    ("gmail.com", "AAAA"): ("2607:f8b0:4006:81f::2005",),
+    ("gmail.com", "MX"): (
+        "5 gmail-smtp-in.l.google.com.",
+        "10 alt1.gmail-smtp-in.l.google.com.",
+    ),
+    ("gmail.com", "NS"): (
+        "ns1.google.com.", "ns2.google.com.",
+        "ns3.google.com.", "ns4.google.com.",
+    ),
+    ("gmail.com", "TXT"): ('"v=spf1 redirect=_spf.google.com"',),
+    ("_dmarc.gmail.com", "TXT"): (
+        '"v=DMARC1; p=none; sp=quarantine; '
+        'rua=mailto:mailauth-reports@google.com"',
+    ),
+}
+
+# What a TLS 1.3 handshake with google.com negotiated when recorded
+RECORDED_TLS = {
+    "google.com": (("TLS_AES_256_GCM_SHA384", "TLSv1.3", 256), "TLSv1.3"),
+}
+
+
+@pytest.fixture
+def recorded_dns(monkeypatch):
+    """Answer dns_checker lookups from RECORDED_DNS instead of the network"""
+    import dns.rdata
+    import dns_checker
+
+    def resolve(resolver, qname, record_type):
+        texts = RECORDED_DNS.get((qname.lower().rstrip("."), record_type))
+        return tuple(
+            dns.rdata.from_text("IN", record_type, text)
+            for text in texts or ()
+        )
+
+    def no_getaddrinfo(hostname, record_type):
+        raise socket.gaierror(socket.EAI_FAIL, "recorded DNS only")
+
+    # A/AAAA normally go through getaddrinfo; send them to the recording
+    monkeypatch.setattr(dns_checker, "_getaddrinfo_records", no_getaddrinfo)
+    monkeypatch.setattr(dns_checker, "_cached_resolve", resolve)
+    return RECORDED_DNS
+
+
+@pytest.fixture
+def recorded_tls(monkeypatch):
+    """Replay RECORDED_TLS handshakes for cipher_checker connections"""
+    import cipher_checker
+
+    class RecordedSocket:
+        def __init__(self, hostname):
+            self.hostname = hostname
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def cipher(self):
+            return RECORDED_TLS[self.hostname][0]
+
+        def version(self):
+            return RECORDED_TLS[self.hostname][1]
+
+        def shared_ciphers(self):
+            return None
+
+    class RecordedContext:
+        def wrap_socket(self, sock, server_hostname=None):
+            return RecordedSocket(server_hostname)
+
+    def create_connection(address, timeout=None):
+        if address[0] not in RECORDED_TLS:
+            raise socket.gaierror(socket.EAI_NONAME, "not recorded")
+        return RecordedSocket(address[0])
+
+    monkeypatch.setattr(cipher_checker, "_CTX", RecordedContext())
+    monkeypatch.setattr(
+        cipher_checker.socket, "create_connection", create_connection
+    )
+    return RECORDED_TLS
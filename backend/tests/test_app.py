@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Flask app's caching, SSRF and batch helpers
+
+Nothing here touches the network: WHOIS, SSL, cipher and DNS checks are
+patched out, and without a local Redis the app runs on its in-memory
+cache.
+"""
+
+import ipaddress
+import json
+import time
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from backend import app as backend_app
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    """
+    A fresh in-memory fallback cache for each test, on a fake clock;
+    returns the clock as a one-item list to advance
+    """
+    clock = [1000.0]
+    monkeypatch.setattr(backend_app, "CACHE_ENABLED", False)
+    monkeypatch.setattr(
+        backend_app, "cache", backend_app.TLRUCache(
+            maxsize=100, ttu=lambda _key, value, now: now + value[0],
+            timer=lambda: clock[0],
+        )
+    )
+    return clock
+
+
+class TestDomainAgeCache:
+    """Per-domain WHOIS caching in safe_get_domain_age"""
+
+    def test_second_call_served_from_cache(self, memory_cache):
+        info = {
+            "creation_date": "2016-03-15T00:00:00",
+            "domain_age_years": 8.5,
+        }
+        with patch.object(
+            backend_app.whois_checker, "get_domain_age", return_value=info
+        ) as mock_age:
+            first = backend_app.safe_get_domain_age("example.com")
+            second = backend_app.safe_get_domain_age("example.com")
+
+        mock_age.assert_called_once_with("example.com")
+        assert first == second  # nosec B101
+        assert second["creation_date"] == "2016-03-15T00:00:00"  # nosec B101
+
+    def test_misses_are_not_cached(self, memory_cache):
+        with patch.object(
+            backend_app.whois_checker, "get_domain_age", return_value=None
+        ) as mock_age:
+            backend_app.safe_get_domain_age("example.com")
+            backend_app.safe_get_domain_age("example.com")
+
+        assert mock_age.call_count == 2  # nosec B101
+
+
+class TestIsIpPrivate:
+    """The bisect fast path agrees with the ipaddress properties"""
+
+    @staticmethod
+    def _reference(ip_str):
+        ip = ipaddress.ip_address(ip_str)
+        return (
+            ip.is_private or ip.is_loopback or ip.is_link_local
+            or ip.is_reserved or ip.is_multicast or ip.is_unspecified
+        )
+
+    def test_matches_ipaddress_for_ipv4(self):
+        # Both edges of every blocked range, their neighbours, and a
+        # deterministic spread over the rest of the address space
+        samples = set()
+        for start, end in zip(backend_app._V4_STARTS, backend_app._V4_ENDS):
+            samples.update((start - 1, start, end, end + 1))
+        samples.update(range(0, 2 ** 32, 2 ** 32 // 4099))
+        samples = [n for n in samples if 0 <= n < 2 ** 32]
+
+        for value in samples:
+            addr = str(ipaddress.IPv4Address(value))
+            assert backend_app.is_ip_private(addr) == (  # nosec B101
+                self._reference(addr)
+            ), addr
+
+    def test_ipv6_and_garbage_take_the_slow_path(self):
+        assert backend_app.is_ip_private("not-an-ip")  # nosec B101
+        assert backend_app.is_ip_private("::1")  # nosec B101
+
+
+class TestMemoryCache:
+    """The TLRU fallback used when Redis is unavailable"""
+
+    def test_entries_expire_after_their_own_ttl(self, memory_cache):
+        backend_app.set_in_cache("short", {"v": 1}, ttl=10, jitter=0)
+        backend_app.set_in_cache("long", {"v": 2}, ttl=100, jitter=0)
+
+        memory_cache[0] += 9
+        assert backend_app.get_from_cache("short") == {"v": 1}  # nosec B101
+        memory_cache[0] += 2
+        assert backend_app.get_from_cache("short") is None  # nosec B101
+        assert backend_app.get_from_cache("long") == {"v": 2}  # nosec B101
+
+
+class TestRedisPoolStats:
+    """get_redis_pool_stats tolerates changes in redis-py internals"""
+
+    def test_disabled_without_pool(self, monkeypatch):
+        monkeypatch.setattr(backend_app, "redis_pool", None)
+        assert backend_app.get_redis_pool_stats() == {  # nosec B101
+            "enabled": False
+        }
+
+    def test_counts_connections(self, monkeypatch):
+        pool = SimpleNamespace(
+            max_connections=4,
+            _connections=["c1", "c2", "c3"],
+            pool=SimpleNamespace(queue=deque(["c1", None, None, None])),
+        )
+        monkeypatch.setattr(backend_app, "redis_pool", pool)
+        assert backend_app.get_redis_pool_stats() == {  # nosec B101
+            "enabled": True, "max_connections": 4,
+            "created": 3, "in_use": 2, "idle": 1,
+        }
+
+    def test_missing_internals_are_omitted(self, monkeypatch):
+        monkeypatch.setattr(
+            backend_app, "redis_pool", SimpleNamespace(max_connections=4)
+        )
+        assert backend_app.get_redis_pool_stats() == {  # nosec B101
+            "enabled": True, "max_connections": 4
+        }
+
+
+def _fake_check(url):
+    """_check_one stand-in: a result naming its URL, slower for slow.*"""
+    if "slow." in url:
+        time.sleep(0.05)
+    return {"url": url, "score": 1}
+
+
+class TestBatchCheck:
+    """/batch-check fan-out, de-duplication and streaming"""
+
+    @pytest.fixture
+    def client(self, memory_cache, monkeypatch):
+        monkeypatch.setattr(backend_app, "_check_one", _fake_check)
+        return backend_app.app.test_client()
+
+    def test_results_keep_input_order(self, client):
+        urls = ["https://slow.example", "https://a.example",
+                "https://b.example"]
+        resp = client.post("/batch-check", json={"urls": urls})
+
+        assert resp.status_code == 200  # nosec B101
+        assert [  # nosec B101
+            r["url"] for r in resp.get_json()["results"]
+        ] == urls
+
+    def test_legacy_cache_key_is_still_served(self, client, monkeypatch):
+        url = "https://legacy.example"
+        backend_app.set_in_cache(
+            backend_app.get_legacy_cache_key(url), {"url": url, "score": 7}
+        )
+        monkeypatch.setattr(
+            backend_app, "_check_one", lambda u: pytest.fail("re-checked")
+        )
+
+        assert backend_app.mget_cache([  # nosec B101
+            backend_app.get_cache_key(url),
+            backend_app.get_legacy_cache_key(url),
+        ]) == [None, {"url": url, "score": 7}]
+        resp = client.post("/batch-check", json={"urls": [url]})
+        assert resp.get_json()["results"] == [  # nosec B101
+            {"url": url, "score": 7}
+        ]
+
+    def test_stream_yields_ndjson_per_occurrence(self, client):
+        cached = "https://cached.example"
+        backend_app.set_in_cache(
+            backend_app.get_cache_key(cached), {"url": cached, "score": 9}
+        )
+        urls = ["https://a.example", cached, "https://a.example"]
+        resp = client.post("/batch-check?stream=1", json={"urls": urls})
+
+        assert resp.mimetype == "application/x-ndjson"  # nosec B101
+        lines = [
+            json.loads(line)
+            for line in resp.get_data(as_text=True).splitlines()
+        ]
+        # Cached results come first, then fresh ones as they complete
+        assert lines == [  # nosec B101
+            {"url": cached, "score": 9},
+            {"url": "https://a.example", "score": 1},
+            {"url": "https://a.example", "score": 1},
+        ]
+
+    def test_duplicate_urls_checked_once(self, client, monkeypatch):
+        checked = []
+
+        def check(url):
+            checked.append(url)
+            return _fake_check(url)
+
+        monkeypatch.setattr(backend_app, "_check_one", check)
+        urls = ["https://b.example", "https://a.example",
+                "https://b.example"]
+        resp = client.post("/batch-check", json={"urls": urls})
+
+        assert sorted(checked) == [  # nosec B101
+            "https://a.example", "https://b.example"
+        ]
+        assert [  # nosec B101
+            r["url"] for r in resp.get_json()["results"]
+        ] == urls
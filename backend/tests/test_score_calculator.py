@@ -4,7 +4,13 @@ Test suite for score_calculator.py module
 Tests composite scoring logic for website authenticity analysis
 """
 
+import gc
+import itertools
+import tracemalloc
 import unittest
+from types import MappingProxyType
+
+import pytest
 
 # Import the module to test (assuming it's in the same directory)
 try:
@@ -13,7 +19,10 @@ try:
         calculate_composite_score,
         calculate_domain_age_score,
         calculate_ssl_score,
+        classify_risk_level,
+        classify_trust_level,
     )
+    import score_kernels
 except ImportError:
     # Create mock classes for testing structure
     class ScoreCalculator:
@@ -35,488 +44,658 @@ except ImportError:
     def calculate_ssl_score(ssl_data):
         pass
 
+    def classify_risk_level(score):
+        pass
 
-class TestScoreCalculator(unittest.TestCase):
-    """Test cases for ScoreCalculator class"""
-
-    def setUp(self):
-        """Set up test fixtures"""
-        self.calculator = ScoreCalculator()
-
-        # Test data scenarios
-        self.old_domain_data = {
-            'domain_age_years': 7.5,
-            'registrar': 'GoDaddy Inc.'
-        }
+    def classify_trust_level(score):
+        pass
 
-        self.new_domain_data = {
-            'domain_age_years': 0.5,
-            'registrar': 'Namecheap Inc.'
-        }
 
-        self.medium_domain_data = {
-            'domain_age_years': 3.2,
-            'registrar': 'CloudFlare Inc.'
-        }
+# Shared, read-only test data scenarios
+OLD_DOMAIN_DATA = MappingProxyType({
+    'domain_age_years': 7.5,
+    'registrar': 'GoDaddy Inc.'
+})
+
+NEW_DOMAIN_DATA = MappingProxyType({
+    'domain_age_years': 0.5,
+    'registrar': 'Namecheap Inc.'
+})
+
+MEDIUM_DOMAIN_DATA = MappingProxyType({
+    'domain_age_years': 3.2,
+    'registrar': 'CloudFlare Inc.'
+})
+
+STRONG_SSL_DATA = MappingProxyType({
+    'is_valid': True,
+    'cipher_strength': 'strong',
+    'protocol_version': 'TLSv1.3',
+    'days_until_expiry': 180,
+    'expiring_soon': False
+})
+
+WEAK_SSL_DATA = MappingProxyType({
+    'is_valid': True,
+    'cipher_strength': 'weak',
+    'protocol_version': 'TLSv1.1',
+    'days_until_expiry': 15,
+    'expiring_soon': True
+})
+
+INVALID_SSL_DATA = MappingProxyType({
+    'is_valid': False,
+    'cipher_strength': None,
+    'protocol_version': None,
+    'days_until_expiry': -10,
+    'expiring_soon': False
+})
+
+
+@pytest.fixture
+def calculator():
+    """ScoreCalculator with the default weights"""
+    return ScoreCalculator()
+
+
+# ScoreCalculator and the scalar score helpers
+
+def test_score_calculator_initialization():
+    """Test ScoreCalculator initializes with correct weights"""
+    calculator = ScoreCalculator()
+    assert calculator.domain_weight == 0.6  # nosec B101
+    assert calculator.ssl_weight == 0.4  # nosec B101
+
+    # Test custom weights
+    custom_calculator = ScoreCalculator(
+        domain_weight=0.7, ssl_weight=0.3
+    )
+    assert custom_calculator.domain_weight == 0.7  # nosec B101
+    assert custom_calculator.ssl_weight == 0.3  # nosec B101
 
-        self.strong_ssl_data = {
-            'is_valid': True,
-            'cipher_strength': 'strong',
-            'protocol_version': 'TLSv1.3',
-            'days_until_expiry': 180,
-            'expiring_soon': False
-        }
 
-        self.weak_ssl_data = {
-            'is_valid': True,
-            'cipher_strength': 'weak',
-            'protocol_version': 'TLSv1.1',
-            'days_until_expiry': 15,
-            'expiring_soon': True
-        }
+def test_calculate_ssl_score_strong():
+    """Test SSL scoring for strong, valid certificates"""
+    score = calculate_ssl_score(STRONG_SSL_DATA)
+    assert score == 100  # nosec B101
 
-        self.invalid_ssl_data = {
-            'is_valid': False,
-            'cipher_strength': None,
-            'protocol_version': None,
-            'days_until_expiry': -10,
-            'expiring_soon': False
-        }
-
-    def test_score_calculator_initialization(self):
-        """Test ScoreCalculator initializes with correct weights"""
-        calculator = ScoreCalculator()
-        self.assertEqual(calculator.domain_weight, 0.6)
-        self.assertEqual(calculator.ssl_weight, 0.4)
-
-        # Test custom weights
-        custom_calculator = ScoreCalculator(
-            domain_weight=0.7, ssl_weight=0.3
-        )
-        self.assertEqual(custom_calculator.domain_weight, 0.7)
-        self.assertEqual(custom_calculator.ssl_weight, 0.3)
-
-    def test_calculate_domain_age_score_old_domain(self):
-        """Test domain age scoring for domains >5 years"""
-        age_years = 7.5
-        score = calculate_domain_age_score(age_years)
-
-        self.assertEqual(score, 100)
-        self.assertIsInstance(score, (int, float))
-
-    def test_calculate_domain_age_score_medium_domain(self):
-        """Test domain age scoring for domains 3-5 years"""
-        test_ages = [3.0, 4.0, 4.9]
-
-        for age in test_ages:
-            score = calculate_domain_age_score(age)
-            self.assertEqual(score, 70)
-
-    def test_calculate_domain_age_score_young_domain(self):
-        """Test domain age scoring for domains 1-3 years"""
-        test_ages = [1.0, 2.0, 2.9]
-
-        for age in test_ages:
-            score = calculate_domain_age_score(age)
-            self.assertEqual(score, 50)
-
-    def test_calculate_domain_age_score_new_domain(self):
-        """Test domain age scoring for domains <1 year"""
-        test_ages = [0.1, 0.5, 0.9]
-
-        for age in test_ages:
-            score = calculate_domain_age_score(age)
-            self.assertEqual(score, 20)
-
-    def test_calculate_domain_age_score_edge_cases(self):
-        """Test domain age scoring edge cases"""
-        # Exactly on boundaries
-        self.assertEqual(calculate_domain_age_score(1.0), 50)
-        self.assertEqual(calculate_domain_age_score(3.0), 70)
-        self.assertEqual(calculate_domain_age_score(5.0), 100)
-
-        # Zero or negative (should handle gracefully)
-        self.assertEqual(calculate_domain_age_score(0), 20)
-        # Should default to lowest score
-        self.assertEqual(calculate_domain_age_score(-1), 20)
-
-    def test_calculate_ssl_score_strong(self):
-        """Test SSL scoring for strong, valid certificates"""
-        score = calculate_ssl_score(self.strong_ssl_data)
-        self.assertEqual(score, 100)
-
-    def test_calculate_ssl_score_weak(self):
-        """Test SSL scoring for weak but valid certificates"""
-        score = calculate_ssl_score(self.weak_ssl_data)
-        self.assertEqual(score, 50)  # Valid but expiring soon
-
-    def test_calculate_ssl_score_invalid(self):
-        """Test SSL scoring for invalid certificates"""
-        score = calculate_ssl_score(self.invalid_ssl_data)
-        self.assertEqual(score, 0)
-
-    def test_calculate_ssl_score_expiring(self):
-        """Test SSL scoring for certificates expiring soon"""
-        expiring_ssl = {
-            'is_valid': True,
-            'cipher_strength': 'strong',
-            'protocol_version': 'TLSv1.2',
-            'days_until_expiry': 25,
-            'expiring_soon': True
-        }
-
-        score = calculate_ssl_score(expiring_ssl)
-        # Should be reduced due to expiring soon
-        self.assertEqual(score, 50)
-
-    def test_calculate_ssl_score_medium_cipher(self):
-        """Test SSL scoring for medium strength ciphers"""
-        medium_ssl = {
-            'is_valid': True,
-            'cipher_strength': 'medium',
-            'protocol_version': 'TLSv1.2',
-            'days_until_expiry': 90,
-            'expiring_soon': False
-        }
 
-        score = calculate_ssl_score(medium_ssl)
-        self.assertEqual(score, 70)
+def test_calculate_ssl_score_weak():
+    """Test SSL scoring for weak but valid certificates"""
+    score = calculate_ssl_score(WEAK_SSL_DATA)
+    # Valid but expiring soon
+    assert score == 50  # nosec B101
 
-    def test_calculate_composite_score_high_trust(self):
-        """Test composite scoring for high trust scenarios"""
-        domain_score = 100  # Old domain
-        ssl_score = 100     # Strong SSL
 
-        composite = calculate_composite_score(domain_score, ssl_score)
-        self.assertEqual(composite, 100)
+def test_calculate_ssl_score_invalid():
+    """Test SSL scoring for invalid certificates"""
+    score = calculate_ssl_score(INVALID_SSL_DATA)
+    assert score == 0  # nosec B101
 
-    def test_calculate_composite_score_medium_trust(self):
-        """Test composite scoring for medium trust scenarios"""
-        domain_score = 70   # Medium age domain
-        ssl_score = 70      # Medium SSL
 
-        composite = calculate_composite_score(domain_score, ssl_score)
-        self.assertEqual(composite, 70)
+def test_calculate_ssl_score_expiring():
+    """Test SSL scoring for certificates expiring soon"""
+    expiring_ssl = {
+        'is_valid': True,
+        'cipher_strength': 'strong',
+        'protocol_version': 'TLSv1.2',
+        'days_until_expiry': 25,
+        'expiring_soon': True
+    }
 
-    def test_calculate_composite_score_low_trust(self):
-        """Test composite scoring for low trust scenarios"""
-        domain_score = 20   # New domain
-        ssl_score = 0       # Invalid SSL
+    score = calculate_ssl_score(expiring_ssl)
+    # Should be reduced due to expiring soon
+    assert score == 50  # nosec B101
 
-        composite = calculate_composite_score(domain_score, ssl_score)
-        expected = (20 * 0.6) + (0 * 0.4)  # 12
-        self.assertEqual(composite, expected)
 
-    def test_calculate_composite_score_custom_weights(self):
-        """Test composite scoring with custom weights"""
-        domain_score = 50
-        ssl_score = 100
+def test_calculate_ssl_score_medium_cipher():
+    """Test SSL scoring for medium strength ciphers"""
+    medium_ssl = {
+        'is_valid': True,
+        'cipher_strength': 'medium',
+        'protocol_version': 'TLSv1.2',
+        'days_until_expiry': 90,
+        'expiring_soon': False
+    }
 
-        # Equal weights
-        composite_equal = calculate_composite_score(
-            domain_score, ssl_score, 0.5, 0.5
-        )
-        self.assertEqual(composite_equal, 75)
+    score = calculate_ssl_score(medium_ssl)
+    assert score == 70  # nosec B101
 
-        # SSL-heavy weighting
-        composite_ssl_heavy = calculate_composite_score(
-            domain_score, ssl_score, 0.3, 0.7
-        )
-        expected = (50 * 0.3) + (100 * 0.7)  # 85
-        self.assertEqual(composite_ssl_heavy, expected)
 
-    def test_full_score_calculation_integration(self):
-        """Test complete score calculation workflow"""
-        result = self.calculator.calculate_score(
-            self.old_domain_data, self.strong_ssl_data
-        )
+def test_calculate_composite_score_high_trust():
+    """Test composite scoring for high trust scenarios"""
+    domain_score = 100  # Old domain
+    ssl_score = 100     # Strong SSL
 
-        self.assertIsInstance(result, dict)
-        self.assertIn('composite_score', result)
-        self.assertIn('domain_score', result)
-        self.assertIn('ssl_score', result)
-        self.assertIn('trust_level', result)
-
-        # Should be high trust
-        self.assertGreaterEqual(result['composite_score'], 80)
-        self.assertEqual(result['trust_level'], 'high')
-
-    def test_trust_level_classification(self):
-        """Test trust level classification based on scores"""
-        test_cases = [
-            (95, 'high'),
-            (85, 'high'),
-            (80, 'high'),
-            (75, 'medium'),
-            (60, 'medium'),
-            (50, 'low'),
-            (30, 'low'),
-            (10, 'low')
-        ]
+    composite = calculate_composite_score(domain_score, ssl_score)
+    assert composite == 100  # nosec B101
 
-        for score, expected_level in test_cases:
-            # Mock trust level calculation
-            if score >= 80:
-                level = 'high'
-            elif score >= 60:
-                level = 'medium'
-            else:
-                level = 'low'
 
-            self.assertEqual(level, expected_level)
+def test_calculate_composite_score_medium_trust():
+    """Test composite scoring for medium trust scenarios"""
+    domain_score = 70   # Medium age domain
+    ssl_score = 70      # Medium SSL
 
-    def test_score_calculation_with_missing_data(self):
-        """Test score calculation with incomplete data"""
-        incomplete_domain = {'domain_age_years': None}
-        incomplete_ssl = {'is_valid': None}
+    composite = calculate_composite_score(domain_score, ssl_score)
+    assert composite == 70  # nosec B101
 
-        result = self.calculator.calculate_score(
-            incomplete_domain, incomplete_ssl
-        )
 
-        # Should handle missing data gracefully
-        self.assertIsInstance(result, dict)
-        self.assertIn('composite_score', result)
-        # Score should be low due to missing data
-        self.assertLessEqual(result['composite_score'], 50)
+def test_calculate_composite_score_low_trust():
+    """Test composite scoring for low trust scenarios"""
+    domain_score = 20   # New domain
+    ssl_score = 0       # Invalid SSL
 
-    def test_score_rounding(self):
-        """Test score rounding behavior"""
-        # Test fractional scores are handled correctly
-        domain_score = 73.7
-        ssl_score = 88.3
+    composite = calculate_composite_score(domain_score, ssl_score)
+    expected = (20 * 0.6) + (0 * 0.4)  # 12
+    assert composite == expected  # nosec B101
 
-        composite = calculate_composite_score(domain_score, ssl_score)
 
-        # Should be a reasonable composite
-        expected = (73.7 * 0.6) + (88.3 * 0.4)  # 79.54
-        self.assertAlmostEqual(composite, expected, places=1)
+def test_calculate_composite_score_custom_weights():
+    """Test composite scoring with custom weights"""
+    domain_score = 50
+    ssl_score = 100
 
-    def test_weight_validation(self):
-        """Test validation of weight parameters"""
-        # Weights should sum to 1.0
-        valid_weights = [(0.6, 0.4), (0.5, 0.5), (0.7, 0.3)]
+    # Equal weights
+    composite_equal = calculate_composite_score(
+        domain_score, ssl_score, 0.5, 0.5
+    )
+    assert composite_equal == 75  # nosec B101
 
-        for domain_weight, ssl_weight in valid_weights:
-            self.assertAlmostEqual(
-                domain_weight + ssl_weight, 1.0, places=1
-            )
+    # SSL-heavy weighting
+    composite_ssl_heavy = calculate_composite_score(
+        domain_score, ssl_score, 0.3, 0.7
+    )
+    expected = (50 * 0.3) + (100 * 0.7)  # 85
+    assert composite_ssl_heavy == expected  # nosec B101
+
+
+def test_full_score_calculation_integration(calculator):
+    """Test complete score calculation workflow"""
+    result = calculator.calculate_score(OLD_DOMAIN_DATA, STRONG_SSL_DATA)
+
+    assert isinstance(result, dict)  # nosec B101
+    assert 'composite_score' in result  # nosec B101
+    assert 'domain_score' in result  # nosec B101
+    assert 'ssl_score' in result  # nosec B101
+    assert 'trust_level' in result  # nosec B101
+
+    # Should be high trust
+    assert result['composite_score'] >= 80  # nosec B101
+    assert result['trust_level'] == 'high'  # nosec B101
+
+
+@pytest.mark.parametrize("score,expected_level", [
+    (95, 'high'),
+    (85, 'high'),
+    (80, 'high'),
+    (75, 'medium'),
+    (60, 'medium'),
+    (50, 'low'),
+    (30, 'low'),
+    (10, 'low')
+])
+def test_trust_level_classification(score, expected_level):
+    """Test trust level classification based on scores"""
+    assert classify_trust_level(score) == expected_level  # nosec B101
+
+
+def test_score_calculation_with_missing_data(calculator):
+    """Test score calculation with incomplete data"""
+    incomplete_domain = {'domain_age_years': None}
+    incomplete_ssl = {'is_valid': None}
+
+    result = calculator.calculate_score(incomplete_domain, incomplete_ssl)
+
+    # Should handle missing data gracefully
+    assert isinstance(result, dict)  # nosec B101
+    assert 'composite_score' in result  # nosec B101
+    # Score should be low due to missing data
+    assert result['composite_score'] <= 50  # nosec B101
+
+
+def test_score_rounding():
+    """Test score rounding behavior"""
+    # Test fractional scores are handled correctly
+    domain_score = 73.7
+    ssl_score = 88.3
+
+    composite = calculate_composite_score(domain_score, ssl_score)
+
+    # Should be a reasonable composite
+    expected = (73.7 * 0.6) + (88.3 * 0.4)  # 79.54
+    assert round(composite - expected, 1) == 0  # nosec B101
+
+
+@pytest.mark.parametrize("domain_weight,ssl_weight", [
+    (0.6, 0.4), (0.5, 0.5), (0.7, 0.3)
+])
+def test_weight_validation(domain_weight, ssl_weight):
+    """Test validation of weight parameters"""
+    # Weights should sum to 1.0
+    assert round(domain_weight + ssl_weight - 1.0, 1) == 0  # nosec B101
+
+
+def test_score_boundaries(calculator):
+    """Test score boundaries are respected"""
+    # All scores should be between 0 and 100
+    test_scores = [
+        calculator.calculate_score(OLD_DOMAIN_DATA, STRONG_SSL_DATA),
+        calculator.calculate_score(NEW_DOMAIN_DATA, INVALID_SSL_DATA),
+        calculator.calculate_score(MEDIUM_DOMAIN_DATA, WEAK_SSL_DATA),
+    ]
+
+    # One check over every score, reporting all of them on failure
+    scores = [result['composite_score'] for result in test_scores]
+    assert 0 <= min(scores) and max(scores) <= 100, scores  # nosec B101
+
+
+def test_gc_object_count_safe():
+    """Ensure gc object counting works via the module-level import"""
+    initial_objects = len(gc.get_objects())
+    assert isinstance(initial_objects, int)  # nosec B101
+
+
+@pytest.mark.parametrize("age,expected", [
+    # >5 years
+    (7.5, 100),
+    (5.0, 100),
+    # 3-5 years
+    (3.0, 70),
+    (4.0, 70),
+    (4.9, 70),
+    # 1-3 years
+    (1.0, 50),
+    (2.0, 50),
+    (2.9, 50),
+    # <1 year
+    (0.1, 20),
+    (0.5, 20),
+    (0.9, 20),
+    # Zero or negative default to the lowest score
+    (0, 20),
+    (-1, 20),
+])
+def test_calculate_domain_age_score(age, expected):
+    """Test domain age scoring across every bucket and boundary"""
+    score = calculate_domain_age_score(age)
+
+    assert score == expected  # nosec B101
+    assert isinstance(score, (int, float))  # nosec B101
+
+
+# Scoring logic and algorithms
+
+@pytest.mark.parametrize("age,expected_score", [
+    (0.5, 20),
+    (2.0, 50),
+    (4.0, 70),
+    (10.0, 100)
+])
+def test_exponential_age_scoring(age, expected_score):
+    """Test if domain age scoring follows expected curve"""
+    # Older domains should have disproportionately higher scores
+    assert calculate_domain_age_score(age) == expected_score  # nosec B101
+
+
+# (ssl_data, minimum expected score), fully populated and read-only
+SECURITY_CASES = tuple(
+    (MappingProxyType(ssl_data), min_expected_score)
+    for ssl_data, min_expected_score in (
+        ({
+            'is_valid': False,
+            'expiring_soon': False,
+            'days_until_expiry': 90,
+        }, 0),
+        ({
+            'is_valid': True,
+            'cipher_strength': 'weak',
+            'expiring_soon': False,
+            'days_until_expiry': 90,
+        }, 70),
+        ({
+            'is_valid': True,
+            'cipher_strength': 'medium',
+            'expiring_soon': False,
+            'days_until_expiry': 90,
+        }, 70),
+        ({
+            'is_valid': True,
+            'cipher_strength': 'strong',
+            'expiring_soon': False,
+            'days_until_expiry': 90,
+        }, 100),
+    )
+)
 
-    def test_score_boundaries(self):
-        """Test score boundaries are respected"""
-        # All scores should be between 0 and 100
-        test_scores = [
-            self.calculator.calculate_score(
-                self.old_domain_data, self.strong_ssl_data
-            ),
-            self.calculator.calculate_score(
-                self.new_domain_data, self.invalid_ssl_data
-            ),
-            self.calculator.calculate_score(
-                self.medium_domain_data, self.weak_ssl_data
-            )
-        ]
 
-        for result in test_scores:
-            score = result['composite_score']
-            self.assertGreaterEqual(score, 0)
-            self.assertLessEqual(score, 100)
+@pytest.mark.parametrize("ssl_data,min_expected_score", SECURITY_CASES)
+def test_ssl_security_hierarchy(ssl_data, min_expected_score):
+    """Test SSL scoring follows security hierarchy"""
+    score = calculate_ssl_score(ssl_data)
+    assert score >= min_expected_score  # nosec B101
 
-    def test_gc_object_count_safe(self):
-        """Ensure test doesn't trigger UnboundLocalError by importing
-        gc locally."""
-        try:
-            import gc as _gc
-        except Exception:
-            _gc = None
-
-        if _gc:
-            initial_objects = len(_gc.get_objects())
-            self.assertIsInstance(initial_objects, int)
-        else:
-            # If gc isn't available in this environment, just assert True
-            self.assertTrue(True)
-
-
-class TestScoringLogic(unittest.TestCase):
-    """Test specific scoring logic and algorithms"""
-
-    def test_exponential_age_scoring(self):
-        """Test if domain age scoring follows expected curve"""
-        # Older domains should have disproportionately higher scores
-        ages_and_scores = [
-            (0.5, 20),
-            (2.0, 50),
-            (4.0, 70),
-            (10.0, 100)
-        ]
 
-        for age, expected_score in ages_and_scores:
-            score = calculate_domain_age_score(age)
-            self.assertEqual(score, expected_score)
+def test_composite_weighting_impact():
+    """Test impact of different weighting schemes"""
+    domain_score = 100
+    ssl_score = 0
 
-    def test_ssl_security_hierarchy(self):
-        """Test SSL scoring follows security hierarchy"""
-        security_levels = [
-            ({'is_valid': False}, 0),
-            (
-                {
-                    'is_valid': True,
-                    'cipher_strength': 'weak',
-                },
-                70,
-            ),
-            (
-                {
-                    'is_valid': True,
-                    'cipher_strength': 'medium',
-                },
-                70,
-            ),
-            (
-                {
-                    'is_valid': True,
-                    'cipher_strength': 'strong',
-                },
-                100,
-            ),
-        ]
-
-        for ssl_data, min_expected_score in security_levels:
-            ssl_data.setdefault('expiring_soon', False)
-            ssl_data.setdefault('days_until_expiry', 90)
-
-            score = calculate_ssl_score(ssl_data)
-            self.assertGreaterEqual(score, min_expected_score)
-
-    def test_composite_weighting_impact(self):
-        """Test impact of different weighting schemes"""
-        domain_score = 100
-        ssl_score = 0
+    # Domain-heavy weighting
+    domain_heavy = calculate_composite_score(
+        domain_score, ssl_score, 0.8, 0.2
+    )
 
-        # Domain-heavy weighting
-        domain_heavy = calculate_composite_score(
-            domain_score, ssl_score, 0.8, 0.2
-        )
+    # SSL-heavy weighting
+    ssl_heavy = calculate_composite_score(
+        domain_score, ssl_score, 0.2, 0.8
+    )
 
-        # SSL-heavy weighting
-        ssl_heavy = calculate_composite_score(
-            domain_score, ssl_score, 0.2, 0.8
-        )
+    # Domain-heavy should have higher score
+    assert domain_heavy > ssl_heavy  # nosec B101
+
+    # Expected values: 100*0.8 + 0*0.2 and 100*0.2 + 0*0.8
+    assert domain_heavy == 80  # nosec B101
+    assert ssl_heavy == 20  # nosec B101
+
+
+# Score interpretation and recommendations
+
+@pytest.mark.parametrize("score,expected_risk", [
+    (90, 'very_low'),
+    (85, 'very_low'),
+    (80, 'low'),
+    (75, 'low'),
+    (70, 'medium'),
+    (60, 'medium'),
+    (50, 'high'),
+    (40, 'high'),
+    (30, 'very_high')
+])
+def test_score_to_risk_level(score, expected_risk):
+    """Test conversion of scores to risk levels"""
+    assert classify_risk_level(score) == expected_risk  # nosec B101
+
+
+def test_recommendation_generation(calculator):
+    """Test generation of recommendations based on scores"""
+    # High trust scenario
+    high_trust_result = calculator.calculate_score(
+        {'domain_age_years': 8},
+        {
+            'is_valid': True,
+            'cipher_strength': 'strong',
+            'expiring_soon': False,
+        },
+    )
 
-        # Domain-heavy should have higher score
-        self.assertGreater(domain_heavy, ssl_heavy)
+    if 'recommendations' in high_trust_result:
+        recommendations = high_trust_result['recommendations']
+        assert 'trustworthy' in ' '.join(  # nosec B101
+            recommendations
+        ).lower()
 
-        # Expected values
-        self.assertEqual(domain_heavy, 80)  # 100*0.8 + 0*0.2
-        self.assertEqual(ssl_heavy, 20)     # 100*0.2 + 0*0.8
+    # Low trust scenario
+    low_trust_result = calculator.calculate_score(
+        {'domain_age_years': 0.2},
+        {'is_valid': False},
+    )
 
+    if 'recommendations' in low_trust_result:
+        recommendations = low_trust_result['recommendations']
+        assert 'caution' in ' '.join(  # nosec B101
+            recommendations
+        ).lower()
 
-class TestScoreInterpretation(unittest.TestCase):
-    """Test score interpretation and recommendations"""
 
-    def test_score_to_risk_level(self):
-        """Test conversion of scores to risk levels"""
-        score_risk_mapping = [
-            (90, 'very_low'),
-            (80, 'low'),
-            (70, 'medium'),
-            (50, 'high'),
-            (30, 'very_high')
-        ]
+def test_confidence_scoring():
+    """Test confidence level in score accuracy"""
+    # Complete data should have high confidence
+    complete_data_confidence = 1.0
 
-        for score, expected_risk in score_risk_mapping:
-            # Mock risk level calculation
-            if score >= 85:
-                risk = 'very_low'
-            elif score >= 75:
-                risk = 'low'
-            elif score >= 60:
-                risk = 'medium'
-            elif score >= 40:
-                risk = 'high'
-            else:
-                risk = 'very_high'
-
-            self.assertEqual(risk, expected_risk)
-
-    def test_recommendation_generation(self):
-        """Test generation of recommendations based on scores"""
-        calculator = ScoreCalculator()
-
-        # High trust scenario
-        high_trust_result = calculator.calculate_score(
-            {'domain_age_years': 8},
-            {
-                'is_valid': True,
-                'cipher_strength': 'strong',
-                'expiring_soon': False,
-            },
-        )
+    # Missing data should reduce confidence
+    incomplete_data_confidence = 0.6
 
-        if 'recommendations' in high_trust_result:
-            recommendations = high_trust_result['recommendations']
-            self.assertIn('trustworthy', ' '.join(recommendations).lower())
+    assert complete_data_confidence > incomplete_data_confidence  # nosec B101
+    assert complete_data_confidence <= 1.0  # nosec B101
+    assert incomplete_data_confidence >= 0.0  # nosec B101
 
-        # Low trust scenario
-        low_trust_result = calculator.calculate_score(
-            {'domain_age_years': 0.2},
-            {'is_valid': False},
-        )
 
-        if 'recommendations' in low_trust_result:
-            recommendations = low_trust_result['recommendations']
-            self.assertIn('caution', ' '.join(recommendations).lower())
+class TestScoreKernels(unittest.TestCase):
+    """Batch kernels must agree with the scalar score helpers"""
 
-    def test_confidence_scoring(self):
-        """Test confidence level in score accuracy"""
-        # Complete data should have high confidence
-        complete_data_confidence = 1.0
+    AGES = [None, -1, 0, 0.5, 1, 2.9, 3, 4.99, 5, 25, float('nan')]
+    SSL_CASES = [
+        (valid, strength, expiring, days)
+        for valid in (True, False)
+        for strength in ('strong', 'medium', 'weak', '')
+        for expiring in (True, False)
+        for days in (None, -5, 0, 29, 30, 365)
+    ]
 
-        # Missing data should reduce confidence
-        incomplete_data_confidence = 0.6
+    def _check_both_modes(self, check):
+        modes = [False, True] if score_kernels.NUMPY_AVAILABLE else [False]
+        original = score_kernels.NUMPY_AVAILABLE
+        try:
+            for mode in modes:
+                score_kernels.NUMPY_AVAILABLE = mode
+                with self.subTest(numpy=mode):
+                    check(score_kernels)
+        finally:
+            score_kernels.NUMPY_AVAILABLE = original
+
+    def test_batch_domain_age_scores(self):
+        """Vectorized domain age scores match calculate_domain_age_score"""
+        expected = [calculate_domain_age_score(a) for a in self.AGES]
+
+        def check(kernels):
+            scores = kernels.batch_domain_age_scores(self.AGES)
+            self.assertEqual([float(s) for s in scores], expected)
+
+        self._check_both_modes(check)
+
+    def test_batch_ssl_scores(self):
+        """Vectorized SSL scores match calculate_ssl_score"""
+        expected = [
+            calculate_ssl_score({
+                'is_valid': valid,
+                'cipher_strength': strength,
+                'expiring_soon': expiring,
+                'days_until_expiry': days,
+            })
+            for valid, strength, expiring, days in self.SSL_CASES
+        ]
 
-        self.assertGreater(
-            complete_data_confidence, incomplete_data_confidence
-        )
-        self.assertLessEqual(complete_data_confidence, 1.0)
-        self.assertGreaterEqual(incomplete_data_confidence, 0.0)
+        def check(kernels):
+            valids, strengths, expiring, days = zip(*self.SSL_CASES)
+            scores = kernels.batch_ssl_scores(
+                valids,
+                kernels.encode_cipher_strength(strengths),
+                expiring,
+                days,
+            )
+            self.assertEqual([float(s) for s in scores], expected)
 
+        self._check_both_modes(check)
 
-class TestPerformance(unittest.TestCase):
-    """Test performance characteristics of scoring algorithms"""
+    def test_batch_calculate_composite(self):
+        """Composite uses the default 0.6/0.4 domain/SSL weighting"""
+        def check(kernels):
+            composite, domain, ssl = kernels.batch_calculate_composite(
+                [10, 0.5], [True, False], days_until_expiry=[200, None]
+            )
+            self.assertEqual([float(d) for d in domain], [100.0, 20.0])
+            self.assertEqual([float(s) for s in ssl], [100.0, 0.0])
+            self.assertAlmostEqual(float(composite[0]), 100.0)
+            self.assertAlmostEqual(float(composite[1]), 12.0)
+
+        self._check_both_modes(check)
+
+    def test_calculate_composite_score_batch(self):
+        """Batch legacy composites match calculate_composite_score"""
+        domain = [100, 70, 50, 20, 0, 87.5]
+        ssl = [100, 50, 0, 70, 100, 33.3]
+        for weights in ((0.6, 0.4), (0.7, 0.3), (0.1, 0.9)):
+            expected = [
+                calculate_composite_score(d, s, *weights)
+                for d, s in zip(domain, ssl)
+            ]
+
+            def check(kernels):
+                scores = kernels.calculate_composite_score_batch(
+                    domain, ssl, *weights
+                )
+                self.assertEqual([float(c) for c in scores], expected)
+
+            self._check_both_modes(check)
+
+    def test_calculate_scores(self):
+        """Column-wise calculate_scores matches calculate_score"""
+        calculator = ScoreCalculator(0.35, 0.25, 0.2, 0.2)
+        cases = [
+            (age, valid, strength, expiring, days)
+            for age in self.AGES
+            for valid, strength, expiring, days in self.SSL_CASES[::5]
+        ]
+        expected = [
+            calculator.calculate_score(
+                {'domain_age_years': age},
+                {
+                    'is_valid': valid,
+                    'cipher_strength': strength,
+                    'expiring_soon': expiring,
+                    'days_until_expiry': days,
+                },
+            )['composite_score']
+            for age, valid, strength, expiring, days in cases
+        ]
 
-    def test_scoring_speed(self):
-        """Test that scoring calculations are fast enough"""
-        import time
+        def check(kernels):
+            ages, valids, strengths, expiring, days = zip(*cases)
+            scores = calculator.calculate_scores(
+                ages, valids, kernels.encode_cipher_strength(strengths),
+                expiring, days
+            )
+            self.assertEqual([round(float(c), 1) for c in scores], expected)
+
+        self._check_both_modes(check)
+
+    def test_batch_weighted_composite(self):
+        """Batch composites and trust levels match calculate_score"""
+        calculator = ScoreCalculator(0.35, 0.25, 0.2, 0.2)
+        cases = [
+            (age, {'is_valid': valid}, {'cipher_score': cipher}, dns)
+            for age in (None, 0.5, 4, 10)
+            for valid in (True, False)
+            for cipher in (0.1, 0.55, 0.9)
+            for dns in (None, {'dns_score': 0.37})
+        ]
+        expected = [
+            calculator.calculate_score(
+                {'domain_age_years': age}, ssl, cipher, dns
+            )
+            for age, ssl, cipher, dns in cases
+        ]
+        # Unrounded sub-scores, as calculate_score weights them
+        rows = [
+            [
+                calculate_domain_age_score(age),
+                calculate_ssl_score(ssl),
+                cipher['cipher_score'] * 100,
+                dns['dns_score'] * 100 if dns else 50.0,
+            ]
+            for age, ssl, cipher, dns in cases
+        ]
 
-        calculator = ScoreCalculator()
-        domain_data = {'domain_age_years': 5.0}
-        ssl_data = {
-            'is_valid': True,
-            'cipher_strength': 'strong',
-        }
+        def check(kernels):
+            batch = calculator.calculate_composites_batch(rows)
+            self.assertEqual(
+                batch['composite_scores'],
+                [r['composite_score'] for r in expected]
+            )
+            self.assertEqual(
+                batch['trust_levels'], [r['trust_level'] for r in expected]
+            )
 
-        # Time multiple calculations
-        start_time = time.time()
-        for _ in range(1000):
-            calculator.calculate_score(domain_data, ssl_data)
-        end_time = time.time()
+        self._check_both_modes(check)
+
+    def test_score_site_matches_calculate_score(self):
+        """The fused kernel reproduces every helper threshold"""
+        weights = (0.35, 0.25, 0.2, 0.2)
+        calculator = ScoreCalculator(*weights)
+        ciphers = [None, (0.9, 0), (0.25, 4)]
+        dns_scores = [None, 0.0, 0.45, 1.2]
+
+        for age, ssl, cipher, dns in itertools.product(
+            self.AGES, self.SSL_CASES[::5], ciphers, dns_scores
+        ):
+            valid, strength, expiring, days = ssl
+            norm, n_weak = cipher or (None, 0)
+            result = calculator.calculate_score(
+                {'domain_age_years': age},
+                {'is_valid': valid, 'cipher_strength': strength,
+                 'expiring_soon': expiring, 'days_until_expiry': days},
+                cipher and {'cipher_score': norm,
+                            'weak_ciphers_found': ['RC4'] * n_weak},
+                None if dns is None else {'dns_score': dns},
+            )
+            code = score_kernels.encode_cipher_strength([strength])[0]
+            scores = score_kernels.score_site(
+                age, valid, code, expiring, days, norm, n_weak, dns, weights
+            )
+            self.assertEqual(
+                [round(float(s), 1) for s in scores],
+                [result[key] for key in (
+                    'domain_score', 'ssl_score', 'cipher_score',
+                    'dns_score', 'composite_score'
+                )],
+            )
 
-        # Should complete 1000 calculations in reasonable time
-        total_time = end_time - start_time
-        # Less than 1 second for 1000 calculations
-        self.assertLess(total_time, 1.0)
+    def test_batch_score_sites(self):
+        """Structured-array batch scoring matches score_site row by row"""
+        sites = [
+            (age, valid, code, expiring, days, norm, n_weak, dns)
+            for age in (None, 0.5, 7)
+            for valid, code, expiring, days in (
+                (True, 2, False, 365), (True, 0, False, 10),
+                (True, 1, True, None), (False, -1, False, None),
+            )
+            for norm, n_weak in ((None, 0), (0.8, 2))
+            for dns in (None, 0.65)
+        ]
+        weights = (0.35, 0.25, 0.2, 0.2)
+        expected = [
+            list(score_kernels.score_site(*site, weights=weights))
+            for site in sites
+        ]
 
-    def test_memory_usage(self):
-        """Test that scoring doesn't consume excessive memory"""
+        original = score_kernels.NUMBA_AVAILABLE
+        # Without Numba installed the kernel still runs, as plain Python
+        modes = [False, True] if score_kernels.NUMPY_AVAILABLE else [False]
         try:
-            import gc as _gc
-        except Exception:
-            _gc = None
-
-        calculator = ScoreCalculator()
-        initial_objects = len(_gc.get_objects()) if _gc else 0
+            for mode in modes:
+                score_kernels.NUMBA_AVAILABLE = mode
+                with self.subTest(numba=mode):
+                    scores = score_kernels.batch_score_sites(sites, weights)
+                    self.assertEqual(
+                        [[float(s) for s in row] for row in scores],
+                        expected
+                    )
+        finally:
+            score_kernels.NUMBA_AVAILABLE = original
+
+
+# Performance characteristics of scoring algorithms
+
+def test_memory_usage(calculator):
+    """Test that scoring doesn't consume excessive memory"""
+    # Leave tracemalloc's own bookkeeping out of the comparison
+    ignore_tracemalloc = (tracemalloc.Filter(False, tracemalloc.__file__),)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(
+            ignore_tracemalloc
+        )
 
         # Perform many calculations
         for i in range(100):
@@ -524,17 +703,32 @@ class TestPerformance(unittest.TestCase):
             ssl_data = {'is_valid': i % 2 == 0}
             calculator.calculate_score(domain_data, ssl_data)
 
-        # Memory usage shouldn't grow significantly
-        if _gc:
-            _gc.collect()
-            final_objects = len(_gc.get_objects())
-            growth = final_objects - initial_objects
-            # Reasonable object growth
-            self.assertLess(growth, 1000)
-        else:
-            self.assertTrue(True)
+        after = tracemalloc.take_snapshot().filter_traces(
+            ignore_tracemalloc
+        )
+    finally:
+        tracemalloc.stop()
+
+    # Memory retained by the loop shouldn't grow significantly
+    growth = sum(
+        stat.size_diff for stat in after.compare_to(before, 'lineno')
+    )
+    assert growth < 100_000  # nosec B101
+
+
+def test_scoring_speed(benchmark):
+    """Benchmark one full calculate_score call (pytest-benchmark)"""
+    calculator = ScoreCalculator()
+    domain_data = {'domain_age_years': 5.0}
+    ssl_data = {
+        'is_valid': True,
+        'cipher_strength': 'strong',
+    }
+
+    result = benchmark(calculator.calculate_score, domain_data, ssl_data)
+    assert result['composite_score'] > 0  # nosec B101
 
 
 if __name__ == '__main__':
     # Configure test runner with detailed output
-    unittest.main(verbosity=2, buffer=True)
\ No newline at end of file
+    raise SystemExit(pytest.main([__file__, '-v']))
\ No newline at end of file
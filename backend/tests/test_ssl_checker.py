@@ -5,12 +5,17 @@ Direct SSL checker test - no Flask involved
 import sys
 import json
 import logging
+import threading
+import time
+from datetime import datetime
+from urllib.parse import urlparse
 
 # Setup logging to see what's happening
 logging.basicConfig(level=logging.DEBUG, format='%(levelname)s: %(message)s')
 
 try:
-    from backend.ssl_checker import check_ssl_certificate
+    from backend import ssl_checker
+    from backend.ssl_checker import _fast_parse, check_ssl_certificate
     print("✓ Successfully imported check_ssl_certificate")
 except ImportError as e:
     print(f"✗ Failed to import ssl_checker: {e}")
@@ -62,6 +67,125 @@ def run_ssl(url):
         traceback.print_exc()
 
 
+def _urlparse_target(url):
+    """(hostname, port) the way check_ssl_certificate reads urlparse"""
+    parsed = urlparse(url)
+    hostname = parsed.hostname or parsed.netloc or parsed.path.split('/')[0]
+    return hostname, parsed.port or 443
+
+
+def test_fast_parse_matches_urlparse():
+    """_fast_parse answers exactly like urlparse, or defers to it"""
+    urls = [
+        "https://example.com", "http://Example.COM/path/to",
+        "https://www.example.com/", "example.com", "Example.com/a/b",
+        "https://example.com:8443/", "https://user@example.com/",
+        "https://example.com?q=1", "https://example.com#frag",
+        "https://[2001:db8::1]/", "https://", "", " example.com",
+        "HTTPS://example.com", "ftp://example.com",
+    ]
+    for url in urls:
+        fast = _fast_parse(url)
+        if fast is not None:
+            assert fast == _urlparse_target(url), url  # nosec B101
+    # The common shapes must actually take the fast path
+    assert _fast_parse("https://example.com/") is not None  # nosec B101
+    assert _fast_parse("example.com") is not None  # nosec B101
+
+
+def _stub_hostname_check(monkeypatch, delay=0.0):
+    """
+    Replace the handshake with a stub that records its arguments and
+    the peak number of checks in flight
+    """
+    calls = []
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def check(hostname, port, timeout, ip=None, now=None, target=None):
+        with lock:
+            calls.append((hostname, port, timeout, now))
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+        return {"valid": True, "hostname": hostname}
+
+    monkeypatch.setattr(ssl_checker, "_check_ssl_hostname", check)
+    return calls, state
+
+
+class TestCheckSslCertificateHost:
+    """The pre-normalized hostname entry point"""
+
+    def test_skips_url_parsing(self, monkeypatch):
+        calls, _ = _stub_hostname_check(monkeypatch)
+        parsed = []
+        monkeypatch.setattr(ssl_checker, "_fast_parse", parsed.append)
+        now = datetime(2026, 1, 1)
+
+        result = ssl_checker.check_ssl_certificate_host(
+            "www.example.com", 8443, timeout=5, now=now
+        )
+
+        # No www. stripping or sanitizing: the hostname goes through as is
+        assert result["hostname"] == "www.example.com"  # nosec B101
+        assert calls == [("www.example.com", 8443, 5, now)]  # nosec B101
+        assert parsed == []  # nosec B101
+
+
+class TestCheckSslBatch:
+    """check_ssl_batch fan-out over a stubbed handshake"""
+
+    def test_results_keep_input_order(self, monkeypatch):
+        _stub_hostname_check(monkeypatch)
+        urls = ["https://c.example", "a.example", "https://b.example/x"]
+
+        results = ssl_checker.check_ssl_batch(urls)
+
+        assert [r["hostname"] for r in results] == [  # nosec B101
+            "c.example", "a.example", "b.example"
+        ]
+
+    def test_timeout_is_passed_to_every_check(self, monkeypatch):
+        calls, _ = _stub_hostname_check(monkeypatch)
+
+        ssl_checker.check_ssl_batch(["a.example", "b.example"], timeout=3)
+
+        assert [c[2] for c in calls] == [3, 3]  # nosec B101
+
+    def test_batch_shares_one_clock_read(self, monkeypatch):
+        calls, _ = _stub_hostname_check(monkeypatch)
+        reads = []
+
+        def utcnow():
+            reads.append(None)
+            return datetime(2026, 1, 1, 0, 0, len(reads))
+
+        monkeypatch.setattr(ssl_checker, "utcnow", utcnow)
+        ssl_checker.check_ssl_batch(["a.example", "b.example", "c.example"])
+
+        assert len(reads) == 1  # nosec B101
+        assert {c[3] for c in calls} == {  # nosec B101
+            datetime(2026, 1, 1, 0, 0, 1)
+        }
+
+    def test_workers_are_bounded(self, monkeypatch):
+        _, state = _stub_hostname_check(monkeypatch, delay=0.02)
+        monkeypatch.setattr(ssl_checker, "SSL_BATCH_MAX_WORKERS", 3)
+        urls = [f"host{i}.example" for i in range(12)]
+
+        ssl_checker.check_ssl_batch(urls, concurrency=100)
+
+        assert 1 < state["peak"] <= 3  # nosec B101
+
+    def test_empty_batch(self, monkeypatch):
+        calls, _ = _stub_hostname_check(monkeypatch)
+        assert ssl_checker.check_ssl_batch([]) == []  # nosec B101
+        assert calls == []  # nosec B101
+
+
 if __name__ == "__main__":
     # Test URLs
     test_urls = [
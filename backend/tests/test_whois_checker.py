@@ -4,6 +4,9 @@ Test suite for whois_checker.py module
 Tests domain age calculation and WHOIS data retrieval functionality
 """
 
+import os
+import tempfile
+import threading
 import unittest
 from datetime import datetime, timedelta
 import requests
@@ -58,7 +61,7 @@ class TestWhoisChecker(unittest.TestCase):
         checker = WhoisChecker()
         self.assertIsInstance(checker, WhoisChecker)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_who_dat_api_success(self, mock_get):
         """Test successful API call to who-dat service"""
         # Mock successful API response
@@ -78,7 +81,7 @@ class TestWhoisChecker(unittest.TestCase):
         self.assertIn('domain_age_years', result)
         self.assertIn('registrar', result)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_who_dat_api_failure(self, mock_get):
         """Test handling of API failure"""
         # Mock API failure
@@ -91,7 +94,7 @@ class TestWhoisChecker(unittest.TestCase):
             result is None or result.get('domain_age_years') == 0
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_rdap_fallback(self, mock_get):
         """Test fallback to RDAP when who-dat fails"""
         # Mock who-dat failure, then RDAP success
@@ -114,6 +117,161 @@ class TestWhoisChecker(unittest.TestCase):
         self.assertEqual(mock_get.call_count, 2)
         self.assertTrue(result is None or isinstance(result, dict))
 
+    @patch.object(WhoisChecker, '_try_whoisxml', return_value=None)
+    @patch.object(WhoisChecker, '_try_python_whois', return_value=None)
+    @patch('requests.Session.get')
+    def test_json_body_decoding(self, mock_get, *_):
+        """Real response bodies decode, and bad JSON counts as failure"""
+        def response(body):
+            resp = requests.Response()
+            resp.status_code = 200
+            resp._content = body
+            return resp
+
+        mock_get.side_effect = [
+            response(b'{"creation_date": "2016-03-15T00:00:00Z",'
+                     b' "registrar": "Test Registrar"}'),
+        ]
+        result = self.checker.get_domain_age(self.test_domain)
+        self.assertEqual(result['registrar'], "Test Registrar")
+
+        mock_get.side_effect = [response(b'<html>'), response(b'{')]
+        result = self.checker.get_domain_age(self.test_new_domain)
+        self.assertEqual(result.get('error'), 'whois_unavailable')
+
+    @patch('requests.Session.get')
+    def test_whoisxml_query_params(self, mock_get):
+        """WhoisXML gets its key and domain as encoded query params"""
+        mock_get.return_value = MagicMock(status_code=200, json=lambda: {
+            "WhoisRecord": {"createdDate": "2010-05-01T00:00:00Z",
+                            "registrarName": "XML Registrar"}
+        })
+        self.checker._whoisxml_key = "k&ey"
+        state = MagicMock()
+
+        created = self.checker._try_whoisxml(self.test_domain, state)
+
+        self.assertEqual(created, datetime(2010, 5, 1))
+        self.assertEqual(state.registrar, "XML Registrar")
+        args, kwargs = mock_get.call_args
+        self.assertNotIn("?", args[0])
+        self.assertEqual(kwargs["params"]["apiKey"], "k&ey")
+        self.assertEqual(kwargs["params"]["domainName"], self.test_domain)
+
+    @patch('whois_checker.WHOIS_HEDGE_DELAY', 0.05)
+    @patch('requests.Session.get')
+    def test_rdap_hedges_slow_who_dat(self, mock_get):
+        """RDAP answers while a slow who-dat is still pending"""
+        released = threading.Event()
+        rdap = MagicMock(status_code=200, json=lambda: {
+            "events": [{
+                "eventAction": "registration",
+                "eventDate": "2018-05-20T10:15:30Z"
+            }]
+        })
+
+        def fake_get(url, **kwargs):
+            if "who-dat" in url:
+                released.wait(5)
+                return MagicMock(status_code=500)
+            return rdap
+
+        mock_get.side_effect = fake_get
+        try:
+            result = self.checker.get_domain_age(self.test_domain)
+        finally:
+            released.set()
+
+        self.assertEqual(result['creation_date'], "2018-05-20T10:15:30")
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('whois.whois')
+    @patch('requests.Session.get')
+    def test_rdap_registrar_skips_whois(self, mock_get, mock_whois):
+        """Registrar comes from the RDAP entities, not a WHOIS query"""
+        mock_get.side_effect = [
+            MagicMock(status_code=404),
+            MagicMock(status_code=200, json=lambda: {
+                "events": [{
+                    "eventAction": "registration",
+                    "eventDate": "2018-05-20T10:15:30Z"
+                }],
+                "entities": [{
+                    "roles": ["registrar"],
+                    "vcardArray": ["vcard", [
+                        ["version", {}, "text", "4.0"],
+                        ["fn", {}, "text", "RDAP Registrar LLC"]
+                    ]]
+                }]
+            })
+        ]
+
+        result = self.checker.get_domain_age(self.test_domain)
+
+        self.assertEqual(result['registrar'], "RDAP Registrar LLC")
+        mock_whois.assert_not_called()
+
+    def test_python_whois_creation_date_types(self):
+        """python-whois dates, lists, strings and empties normalise"""
+        cases = [
+            (datetime(2015, 1, 2, 3, 4), datetime(2015, 1, 2, 3, 4)),
+            (datetime(2015, 1, 2).date(), datetime(2015, 1, 2)),
+            ([datetime(2015, 1, 2), datetime(2016, 1, 1)],
+             datetime(2015, 1, 2)),
+            ("2015-01-02", datetime(2015, 1, 2)),
+            ([], None),
+            (None, None),
+        ]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                # whois_record set: the WHOIS answer already fetched
+                state = MagicMock(
+                    whois_record=MagicMock(creation_date=value)
+                )
+                self.assertEqual(
+                    self.checker._try_python_whois(
+                        self.test_domain, state
+                    ),
+                    expected,
+                )
+
+    @patch('whois.whois')
+    def test_port43_whois_skipped_tlds(self, mock_whois):
+        """Slow TLDs and a disabled flag never send a port-43 query"""
+        from whois_checker import _UNSET
+
+        self.assertIsNone(self.checker._try_python_whois(
+            "example.tk", MagicMock(whois_record=_UNSET)
+        ))
+        checker = WhoisChecker(port43_whois=False)
+        self.assertIsNone(checker._get_registrar(
+            self.test_domain, MagicMock(whois_record=_UNSET)
+        ))
+        mock_whois.assert_not_called()
+
+    @patch('whois_checker.time')
+    @patch.object(WhoisChecker, '_try_whoisxml')
+    @patch.object(WhoisChecker, '_try_python_whois')
+    @patch.object(WhoisChecker, '_race_apis')
+    def test_fallbacks_skipped_over_budget(
+        self, mock_race, mock_whois, mock_xml, mock_time
+    ):
+        """Slow primary APIs skip the fallbacks and cache nothing"""
+        # who-dat and RDAP together took 9s
+        mock_time.monotonic.side_effect = [1000.0, 1009.0]
+
+        def race(domain, state):
+            state.who_dat_failed = state.rdap_failed = True
+            return None
+        mock_race.side_effect = race
+
+        result = self.checker.get_domain_age(self.test_domain)
+
+        self.assertEqual(result.get('error'), 'whois_unavailable')
+        mock_whois.assert_not_called()
+        mock_xml.assert_not_called()
+        self.assertEqual(len(self.checker._cache), 0)
+
     def test_domain_age_calculation_old_domain(self):
         """Test age calculation for old domain (>5 years)"""
         age_years = calculate_domain_age(self.old_creation_date)
@@ -197,7 +355,60 @@ class TestWhoisChecker(unittest.TestCase):
             else:
                 self.assertFalse(False)
 
-    @patch('requests.get')
+    def test_normalize_domain(self):
+        """Normalisation keeps only the registrable host"""
+        cases = [
+            ("EXAMPLE.COM", "example.com"),
+            ("https://www.example.com", "example.com"),
+            ("http://user@example.com:8080/path?q=1", "example.com"),
+            ("example.com/path#frag", "example.com"),
+            ("https://blog.example.co.uk/", "example.co.uk"),
+            ("münchen.de", "xn--mnchen-3ya.de"),
+            ("https://www.Bücher.de/x", "xn--bcher-kva.de"),
+        ]
+        for raw, expected in cases:
+            with self.subTest(raw=raw):
+                self.assertEqual(
+                    self.checker._normalize_domain(raw), expected
+                )
+
+    @patch('whois_checker.TLDEXTRACT_AVAILABLE', False)
+    def test_extract_base_domain_uses_psl(self):
+        """Without tldextract the Public Suffix List picks the domain"""
+        psl = MagicMock()
+        psl.get_sld.return_value = "example.co.nz"
+        with patch('whois_checker._PSL', psl):
+            self.assertEqual(
+                self.checker._extract_base_domain("shop.example.co.nz"),
+                "example.co.nz",
+            )
+            # Apex domains skip the suffix lookup entirely
+            self.assertEqual(
+                self.checker._extract_base_domain("example.nz"),
+                "example.nz",
+            )
+            psl.get_sld.assert_called_once()
+        with patch('whois_checker._PSL', None):
+            self.assertEqual(
+                self.checker._extract_base_domain("shop.example.co.uk"),
+                "example.co.uk",
+            )
+
+    @patch('requests.Session.get')
+    def test_invalid_domain_skips_lookup(self, mock_get):
+        """Invalid domains are rejected before any network call"""
+        self.assertIsNone(self.checker.get_domain_age("invalid..domain"))
+        mock_get.assert_not_called()
+
+    def test_internationalised_domain_is_looked_up(self):
+        """Non-ASCII domains are queried in their IDNA form"""
+        with patch.object(
+            self.checker, '_resolve', return_value=(None, MagicMock())
+        ) as mock_resolve:
+            self.checker.get_domain_age("münchen.de", force_refresh=True)
+        self.assertEqual(mock_resolve.call_args[0][0], "xn--mnchen-3ya.de")
+
+    @patch('requests.Session.get')
     def test_rate_limiting_handling(self, mock_get):
         """Test handling of rate limiting from APIs"""
         # Mock rate limit response
@@ -215,7 +426,7 @@ class TestWhoisChecker(unittest.TestCase):
                                'error' in result)
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_timeout_handling(self, mock_get):
         """Test handling of request timeouts"""
         mock_get.side_effect = requests.Timeout("Request timed out")
@@ -230,7 +441,7 @@ class TestWhoisChecker(unittest.TestCase):
         # Assuming the checker has caching capability
         if hasattr(self.checker, '_cache'):
             # First call - should hit API
-            with patch('requests.get') as mock_get:
+            with patch('requests.Session.get') as mock_get:
                 mock_response = MagicMock()
                 mock_response.status_code = 200
                 mock_response.json.return_value = {
@@ -246,11 +457,171 @@ class TestWhoisChecker(unittest.TestCase):
                 mock_get.assert_called_once()
                 self.assertEqual(result1, result2)
 
+    @patch('requests.Session.get')
+    def test_memory_cache_hit_recomputes_age(self, mock_get):
+        """A memory hit ages like a disk hit instead of freezing"""
+        mock_get.return_value = MagicMock(status_code=200, json=lambda: {
+            "creation_date": "2020-01-01T00:00:00Z",
+            "registrar": "Test Registrar"
+        })
+        with patch('whois_checker.utcnow',
+                   return_value=datetime(2020, 7, 1)):
+            first = self.checker.get_domain_age(self.test_domain)
+        with patch('whois_checker.utcnow',
+                   return_value=datetime(2021, 7, 1)):
+            second = self.checker.get_domain_age(self.test_domain)
+
+        mock_get.assert_called_once()
+        self.assertEqual(first['domain_age_years'], 0.5)
+        self.assertEqual(second['domain_age_years'], 1.5)
+
+    @patch('requests.Session.get')
+    def test_disk_cache_survives_restart(self, mock_get):
+        """Answers persist in the SQLite cache across instances"""
+        mock_get.return_value = MagicMock(status_code=200)
+        mock_get.return_value.json.return_value = {
+            "creation_date": "2020-01-01T00:00:00Z",
+            "registrar": "Test Registrar"
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "whois.sqlite")
+            first = WhoisChecker(cache_path=path)
+            result = first.get_domain_age(self.test_domain)
+
+            second = WhoisChecker(cache_path=path)
+            self.assertEqual(
+                second.get_domain_age(self.test_domain), result
+            )
+            mock_get.assert_called_once()
+            first.close()
+            second.close()
+
+    @patch.object(WhoisChecker, '_try_whoisxml', return_value=None)
+    @patch.object(WhoisChecker, '_try_python_whois', return_value=None)
+    @patch('requests.Session.get')
+    def test_negative_caching(self, mock_get, *_):
+        """Definitive misses are cached, timeouts are retried"""
+        mock_get.return_value = MagicMock(status_code=404)
+        first = self.checker.get_domain_age(self.test_domain)
+        second = self.checker.get_domain_age(self.test_domain)
+        self.assertEqual(first, second)
+        self.assertEqual(first.get('error'), 'whois_unavailable')
+        self.assertEqual(mock_get.call_count, 2)
+
+        mock_get.reset_mock()
+        mock_get.side_effect = requests.Timeout("Request timed out")
+        self.checker.get_domain_age(self.test_new_domain)
+        self.checker.get_domain_age(self.test_new_domain)
+        self.assertEqual(mock_get.call_count, 4)
+
+    @patch.object(WhoisChecker, '_try_whoisxml', return_value=None)
+    @patch.object(WhoisChecker, '_try_python_whois', return_value=None)
+    @patch('requests.Session.get')
+    def test_rdap_rate_limit_is_transient(self, mock_get, *_):
+        """A 429 from RDAP is not cached as whois_unavailable"""
+        mock_get.side_effect = [
+            MagicMock(status_code=404),
+            MagicMock(status_code=429, headers={}),
+        ]
+        self.assertIsNone(self.checker.get_domain_age(self.test_domain))
+        self.assertTrue(self.checker._breakers["rdap"].is_open())
+
+    @patch.object(WhoisChecker, '_try_whoisxml', return_value=None)
+    @patch.object(WhoisChecker, '_try_python_whois', return_value=None)
+    @patch('requests.Session.get')
+    def test_force_refresh_and_clear_cache(self, mock_get, *_):
+        """A cached miss can be bypassed or dropped on request"""
+        mock_get.return_value = MagicMock(status_code=404)
+        self.checker.get_domain_age(self.test_domain)
+        self.assertEqual(mock_get.call_count, 2)
+
+        self.checker.get_domain_age(self.test_domain, force_refresh=True)
+        self.assertEqual(mock_get.call_count, 4)
+
+        self.checker.clear_cache()
+        self.checker.get_domain_age(self.test_domain)
+        self.assertEqual(mock_get.call_count, 6)
+
+    @patch('requests.Session.get')
+    def test_concurrent_lookups_coalesce(self, mock_get):
+        """Concurrent lookups of one domain share a single request"""
+        started = threading.Event()
+        release = threading.Event()
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {
+            "creation_date": "2020-01-01T00:00:00Z",
+            "registrar": "Test Registrar"
+        }
+
+        def slow_get(url, **kwargs):
+            started.set()
+            release.wait(5)
+            return ok
+
+        mock_get.side_effect = slow_get
+        results = []
+        threads = [
+            threading.Thread(target=lambda d=d: results.append(
+                self.checker.get_domain_age(d)
+            ))
+            for d in ("example.com", "www.example.com")
+        ]
+        for thread in threads:
+            thread.start()
+        started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        mock_get.assert_called_once()
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0], results[1])
+
+    @patch.object(WhoisChecker, '_try_whoisxml', return_value=None)
+    @patch.object(WhoisChecker, '_try_python_whois', return_value=None)
+    @patch('requests.Session.get')
+    def test_breaker_skips_failing_endpoints(self, mock_get, *_):
+        """After repeated 5xx answers both endpoints are skipped"""
+        mock_get.return_value = MagicMock(status_code=503)
+        for i in range(5):
+            self.checker.get_domain_age(f"domain{i}.com")
+        self.assertEqual(mock_get.call_count, 10)
+
+        self.assertIsNone(self.checker.get_domain_age("another.com"))
+        self.assertEqual(mock_get.call_count, 10)
+
+    @patch('whois_checker.time')
+    def test_breaker_backs_off_repeated_rate_limits(self, mock_time):
+        """Consecutive 429s open the breaker for longer each time"""
+        clock = [1000.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        breaker = self.checker._breakers["who_dat"]
+
+        breaker.rate_limited(2.0)
+        clock[0] += 2.0
+        self.assertFalse(breaker.is_open())
+
+        breaker.rate_limited(2.0)
+        clock[0] += 59.0
+        self.assertTrue(breaker.is_open())
+        clock[0] += 1.0
+        self.assertFalse(breaker.is_open())
+
+        breaker.rate_limited(2.0)
+        clock[0] += 119.0
+        self.assertTrue(breaker.is_open())
+
+        clock[0] += 1.0
+        breaker.success()
+        breaker.rate_limited(2.0)
+        clock[0] += 2.0
+        self.assertFalse(breaker.is_open())
+
     def test_multiple_domains_batch(self):
         """Test processing multiple domains"""
         domains = ["example.com", "test.org", "sample.net"]
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -267,6 +638,42 @@ class TestWhoisChecker(unittest.TestCase):
                     self.assertIn(domain, domains)
                     self.assertIsNotNone(result)
 
+    @patch('whois_checker.time')
+    @patch('requests.Session.get')
+    def test_multiple_domains_retries_rate_limited(
+        self, mock_get, mock_time
+    ):
+        """A 429 in a batch is retried once after Retry-After"""
+        # Fake clock: sleeping advances it, so the who-dat breaker the
+        # 429 opened has cooled down again by the retry.
+        clock = [1000.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = (
+            lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+        )
+        mock_sleep = mock_time.sleep
+        limited = MagicMock(status_code=429, headers={'Retry-After': '2'})
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {"creation_date": "2020-01-01T00:00:00Z"}
+        # who-dat is rate limited, RDAP has no date, then the retry lands
+        mock_get.side_effect = [limited, ok, ok]
+
+        with patch.object(self.checker, '_try_python_whois',
+                          return_value=None), \
+                patch.object(self.checker, '_try_whoisxml',
+                             return_value=None), \
+                patch.object(self.checker, '_get_registrar',
+                             return_value=None):
+            results = self.checker.get_multiple_domain_ages(
+                [self.test_domain]
+            )
+
+        mock_sleep.assert_called_once_with(2.0)
+        self.assertEqual(
+            results[self.test_domain]['creation_date'],
+            "2020-01-01T00:00:00"
+        )
+
 
 class TestUtilityFunctions(unittest.TestCase):
     """Test utility functions used by WhoisChecker"""
@@ -290,6 +697,15 @@ class TestUtilityFunctions(unittest.TestCase):
         # Should return 0 for future dates
         self.assertEqual(future_domain, 0)
 
+    def test_calculate_domain_age_reference_time(self):
+        """Ages use the given reference time and accept aware dates"""
+        now = datetime(2024, 1, 1)
+        self.assertEqual(calculate_domain_age(datetime(2014, 1, 1), now),
+                         round(3652 / 365.25, 2))
+        aware = parse_creation_date("2023-12-31T23:00:00-05:00")
+        self.assertEqual(calculate_domain_age(aware, now), 0.0)
+        self.assertIsInstance(calculate_domain_age(aware), float)
+
     def test_date_parsing_robustness(self):
         """Test date parsing with various edge cases"""
         edge_cases = [
@@ -303,6 +719,36 @@ class TestUtilityFunctions(unittest.TestCase):
             result = parse_creation_date(date_str)
             self.assertIsInstance(result, datetime)
 
+    def test_parse_creation_date_cached(self):
+        """Repeated strings are served from the parse cache"""
+        if not hasattr(parse_creation_date, 'cache_clear'):
+            self.skipTest("parse_creation_date is not cached")
+        parse_creation_date.cache_clear()
+        first = parse_creation_date("2020-01-15T10:30:00Z")
+        self.assertIs(parse_creation_date("2020-01-15T10:30:00Z"), first)
+        self.assertIsNone(parse_creation_date(None))
+        info = parse_creation_date.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_parse_creation_date_matches_strptime(self):
+        """Regex fast path agrees with the strptime formats it replaces"""
+        cases = [
+            ("2020-01-15T10:30:00.250Z", "%Y-%m-%dT%H:%M:%S.%fZ"),
+            ("2020-01-15T10:30:00Z", "%Y-%m-%dT%H:%M:%SZ"),
+            ("2020-01-15 10:30:00", "%Y-%m-%d %H:%M:%S"),
+            ("2020-01-15", "%Y-%m-%d"),
+            ("12/25/2020", "%m/%d/%Y"),
+            ("25/12/2020", "%d/%m/%Y"),
+            ("15-jan-2020", "%d-%b-%Y"),
+            ("2020-01-15T10:30:00+05:30", "%Y-%m-%dT%H:%M:%S%z"),
+        ]
+        for date_str, fmt in cases:
+            with self.subTest(date_str=date_str):
+                self.assertEqual(
+                    parse_creation_date(date_str),
+                    datetime.strptime(date_str, fmt)
+                )
+
     def test_domain_normalization(self):
         """Test domain name normalization"""
         test_cases = [
@@ -335,7 +781,7 @@ class TestIntegration(unittest.TestCase):
         checker = WhoisChecker()
         test_domain = "example.com"
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             # Mock successful response with all required fields
             mock_response = MagicMock()
             mock_response.status_code = 200
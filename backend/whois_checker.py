@@ -6,36 +6,390 @@ Handles domain age calculation and WHOIS data retrieval
 
 import whois
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TLRUCache
+import json
 import os
-from datetime import datetime, date
+import re
+import sqlite3
+from functools import lru_cache
+import threading
+import time
+import weakref
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+)
+from datetime import datetime, timezone
+from itertools import repeat, zip_longest
 import logging
-from typing import Optional, Dict, Any
-from urllib.parse import urlparse
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
 try:
     from backend import _env  # noqa: F401
 except ImportError:
     import _env  # noqa: F401
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import tldextract  # type: ignore[reportMissingImports]
+    TLDEXTRACT_AVAILABLE = True
+except ImportError:
+    TLDEXTRACT_AVAILABLE = False
+
+try:
+    from publicsuffix2 import PublicSuffixList
+    # Parsed once here rather than on the first lookup
+    _PSL = PublicSuffixList()
+except ImportError:
+    _PSL = None
+
+try:
+    from dateutil import parser as _dateutil_parser
+    _DATEUTIL = _dateutil_parser.parser()
+except ImportError:
+    _DATEUTIL = None
+
 logger = logging.getLogger(__name__)
 
+# Batch lookups are pure network waits, so threads overlap them well;
+# past this many workers the remote rate limits dominate anyway.
+MAX_WHOIS_WORKERS = 32
+# Upper bound on how long a batch waits to honour a 429 Retry-After.
+MAX_RETRY_AFTER = 30.0
 
-class WhoisChecker:
-    """Main class for checking WHOIS information"""
+# Creation dates essentially never change, so answers are kept for 30
+# days (WHOIS_CACHE_TTL_SECONDS); definitive misses (no date anywhere,
+# or every API said no) for an hour so a failing domain is not
+# re-queried on every check. Rate limits and timeouts are transient and
+# never cached.
+WHOIS_CACHE_TTL = int(os.environ.get("WHOIS_CACHE_TTL_SECONDS", 2592000))
+WHOIS_NEGATIVE_TTL = 3600
+# Optional SQLite file that keeps answers across restarts, for workers
+# and scripts that run without the app's Redis cache in front
+WHOIS_CACHE_PATH = os.environ.get("WHOIS_CACHE_PATH")
+
+# A WHOIS endpoint that fails (5xx, timeout, connection error) this many
+# times in a row is skipped for BREAKER_COOLDOWN seconds, so an outage
+# costs a few timeouts rather than one per domain.
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60.0
+API_TIMEOUT = 5.0
+WHOISXML_URL = "https://www.whoisxmlapi.com/whoisserver/WhoisService"
+WHOISXML_TIMEOUT = 6.0
+# A first 429 is honoured for its Retry-After; each further 429 in a
+# row doubles the skip, from RATE_LIMIT_BACKOFF up to
+# MAX_RATE_LIMIT_BACKOFF, until a request succeeds again.
+RATE_LIMIT_BACKOFF = 60.0
+MAX_RATE_LIMIT_BACKOFF = 900.0
+
+# The python-whois fallback talks WHOIS over port 43 with its own
+# socket client, and some registries leave it hanging for 10s+.
+# WHOIS_PORT43=0 turns it off; these TLDs are skipped regardless.
+WHOIS_PORT43 = os.environ.get("WHOIS_PORT43", "1").lower() not in (
+    "0", "false", "no"
+)
+PORT43_WHOIS_SKIP_TLDS = frozenset({"tk", "ml", "ga", "cf"})
+# Once who-dat and RDAP have used this many seconds without a date, the
+# python-whois and WhoisXML fallbacks are skipped, bounding the time
+# one domain can take.
+WHOIS_FALLBACK_BUDGET = 8.0
+
+# RDAP is only raced against who-dat once who-dat has been silent this
+# long, so a healthy who-dat is not paid for twice per domain.
+WHOIS_HEDGE_DELAY = 1.0
+
+USER_AGENT = "SiteOrigin-Checker/1.0 (+https://example.com)"
+_thread_local = threading.local()
+# Live per-thread sessions, so close_sessions() can release them all;
+# weak so a finished thread's session is not kept alive
+_sessions: "weakref.WeakSet[requests.Session]" = weakref.WeakSet()
+_sessions_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return a per-thread requests.Session so who-dat/RDAP connections
+    are kept alive across lookups without sharing a Session between
+    threads."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        # Retry transient 5xx and connection errors only. A 429 is left
+        # to the lookup, which records Retry-After instead of sleeping
+        # inside the adapter, and read timeouts are not retried so a
+        # slow endpoint still fails within its timeout.
+        retries = Retry(
+            total=2, read=False, backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=32, pool_maxsize=32, max_retries=retries
+        )
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = USER_AGENT
+        _thread_local.session = session
+        with _sessions_lock:
+            _sessions.add(session)
+    return session
+
+
+def close_sessions() -> None:
+    """Close the pooled who-dat/RDAP/WhoisXML connections of every
+    thread. Sessions stay usable and reconnect on their next call."""
+    with _sessions_lock:
+        for session in list(_sessions):
+            session.close()
+
+
+_WHOIS_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_whois_executor_lock = threading.Lock()
+
+
+def _get_whois_executor() -> ThreadPoolExecutor:
+    """Return the module-wide pool used to race who-dat and RDAP"""
+    global _WHOIS_EXECUTOR
+    if _WHOIS_EXECUTOR is None:
+        with _whois_executor_lock:
+            if _WHOIS_EXECUTOR is None:
+                _WHOIS_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=2 * MAX_WHOIS_WORKERS,
+                    thread_name_prefix="whois-api",
+                )
+    return _WHOIS_EXECUTOR
+
+
+_UNSET = object()
+
+
+class _Breaker:
+    """Consecutive-failure circuit breaker for one WHOIS endpoint."""
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+        timeout: float = API_TIMEOUT,
+    ):
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._timeouts = 0
+        self._limits = 0
+        self._open_until = 0.0
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    def timeout(self) -> float:
+        """Request timeout, halved (down to a quarter) while the
+        endpoint keeps timing out so it fails faster."""
+        return self._timeout / (1 << min(self._timeouts, 2))
+
+    def success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._timeouts = 0
+            self._limits = 0
+
+    def failure(self, timed_out: bool = False) -> None:
+        with self._lock:
+            self._failures += 1
+            if timed_out:
+                self._timeouts += 1
+            if self._failures >= self._threshold:
+                self._failures = 0
+                self._open_until = time.monotonic() + self._cooldown
+
+    def rate_limited(self, retry_after: float) -> None:
+        """Open after a 429: for Retry-After the first time, then for
+        an exponentially growing back-off while the 429s continue."""
+        with self._lock:
+            self._limits += 1
+            seconds = retry_after
+            if self._limits > 1:
+                backoff = RATE_LIMIT_BACKOFF * (1 << min(self._limits - 2, 8))
+                seconds = max(seconds, min(backoff, MAX_RATE_LIMIT_BACKOFF))
+            self._open_until = max(
+                self._open_until, time.monotonic() + seconds
+            )
+
+
+# Second-level suffixes the fallback treats as a single TLD when neither
+# tldextract nor publicsuffix2 is installed
+_DOUBLE_TLDS = frozenset({
+    'co.uk', 'com.au', 'co.jp', 'co.in', 'co.za',
+    'com.br', 'com.cn', 'com.mx', 'com.ar', 'com.co',
+    'net.au', 'org.uk', 'ac.uk', 'gov.uk', 'sch.uk',
+})
+
+
+class _DiskCache:
+    """SQLite-backed TTL store for lookup results, shared by threads."""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            path, timeout=5, check_same_thread=False,
+            isolation_level=None,
+        )
+        # WAL lets several worker processes read while one writes
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS whois_cache ("
+            "domain TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+            "fetched_at INTEGER NOT NULL, expires_at INTEGER NOT NULL)"
+        )
+
+    def get(self, domain: str) -> Tuple[Any, float]:
+        """(result, seconds left) for domain; _UNSET when absent or
+        expired."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT payload, expires_at FROM whois_cache "
+                "WHERE domain = ? AND expires_at > ?",
+                (domain, int(now)),
+            ).fetchone()
+        if row is None:
+            return _UNSET, 0.0
+        return json.loads(row[0]), row[1] - now
+
+    def set(self, domain: str, result: Any, ttl: float) -> None:
+        now = int(time.time())
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO whois_cache VALUES (?, ?, ?, ?)",
+                (domain, json.dumps(result), now, now + int(ttl)),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM whois_cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+# Hostname of 1-63 character letter/digit/hyphen labels, none starting or
+# ending with '-', at least two labels and at most 253 characters.
+_DOMAIN_RE = re.compile(
+    r"(?=.{1,253}$)(?!-)[A-Za-z0-9-]{1,63}(?<!-)"
+    r"(?:\.(?!-)[A-Za-z0-9-]{1,63}(?<!-))+"
+)
+
+
+class _Lookup:
+    """Flags collected while resolving a single domain.
+
+    Kept per call rather than on the checker so concurrent lookups
+    from get_multiple_domain_ages do not clobber each other.
+    """
+
+    _FLAGS = (
+        "who_dat_rate_limited", "who_dat_failed", "who_dat_timeout",
+        "rdap_rate_limited", "rdap_failed", "rdap_timeout",
+        "whoisxml_rate_limited", "whoisxml_failed", "whoisxml_timeout",
+        "transient",
+    )
+    __slots__ = _FLAGS + ("registrar", "retry_after", "whois_record")
 
     def __init__(self):
-        self._cache: Dict[str, Any] = {}
-        # Per-call flags
-        self._who_dat_rate_limited = False
-        self._who_dat_failed = False
-        self._rdap_failed = False
+        # <endpoint>_rate_limited/_failed/_timeout, set by _fetch
+        self.who_dat_rate_limited = False
+        self.who_dat_failed = False
+        self.rdap_rate_limited = False
+        self.rdap_failed = False
         # Track timeouts separately from other request failures
-        self._who_dat_timeout = False
-        self._rdap_timeout = False
-        self._whoisxml_failed = False
-        self._whoisxml_timeout = False
-        self._last_registrar: Optional[str] = None
+        self.who_dat_timeout = False
+        self.rdap_timeout = False
+        self.whoisxml_rate_limited = False
+        self.whoisxml_failed = False
+        self.whoisxml_timeout = False
+        # Set when the miss may clear up on its own (rate limit, 5xx,
+        # timeout, open breaker), so it must not be negatively cached
+        self.transient = False
+        self.registrar: Optional[str] = None
+        self.retry_after = 0.0
+        # whois.whois() answer, fetched at most once per lookup
+        self.whois_record: Any = _UNSET
+
+    def merge(self, other: "_Lookup") -> None:
+        """Fold the flags of a finished attempt into this lookup."""
+        for flag in self._FLAGS:
+            if getattr(other, flag):
+                setattr(self, flag, True)
+        self.retry_after = max(self.retry_after, other.retry_after)
+        self.registrar = self.registrar or other.registrar
+
+
+class WhoisChecker:
+    """Main class for checking WHOIS information"""
+
+    def __init__(
+        self,
+        cache_ttl: float = WHOIS_CACHE_TTL,
+        negative_ttl: float = WHOIS_NEGATIVE_TTL,
+        cache_path: Optional[str] = WHOIS_CACHE_PATH,
+        port43_whois: bool = WHOIS_PORT43,
+    ):
+        self._cache_ttl = cache_ttl
+        self._negative_ttl = negative_ttl
+        self._port43_whois = port43_whois
+        # Read once; _env has already loaded .env by import time
+        self._whoisxml_key = os.environ.get("WHOISXML_API_KEY")
+        self._disk: Optional[_DiskCache] = None
+        if cache_path:
+            try:
+                self._disk = _DiskCache(cache_path)
+            except sqlite3.Error as e:
+                logger.warning(
+                    "WHOIS disk cache %s unavailable: %s", cache_path, e
+                )
+        # Values are stored as (ttl, result)
+        self._cache = TLRUCache(
+            maxsize=10_000, ttu=lambda _key, value, now: now + value[0]
+        )
+        self._cache_lock = threading.Lock()
+        # Lookups in progress, so concurrent callers asking for the same
+        # domain wait for one set of requests instead of each sending
+        # their own
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._breakers = {
+            "who_dat": _Breaker(),
+            "rdap": _Breaker(),
+            "whoisxml": _Breaker(timeout=WHOISXML_TIMEOUT),
+        }
+
+    def close(self) -> None:
+        """Release pooled HTTP connections and the disk cache."""
+        close_sessions()
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+    def clear_cache(self) -> None:
+        """Forget every cached answer, including cached misses."""
+        with self._cache_lock:
+            self._cache.clear()
+        if self._disk is not None:
+            try:
+                self._disk.clear()
+            except sqlite3.Error as e:
+                logger.warning("WHOIS disk cache clear failed: %s", e)
 
-    def get_domain_age(self, domain: str) -> Optional[Dict[str, Any]]:
+    def get_domain_age(
+        self, domain: str, force_refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """
         Get domain age information.
         Returns dict with:
@@ -45,260 +399,435 @@ class WhoisChecker:
 
         Returns None if unavailable. In case external APIs both fail, an
         explicit error dict is returned so tests can assert that path.
+        force_refresh skips the cache (a cached miss included) and asks
+        the sources again.
         """
+        return self._lookup(domain, force_refresh=force_refresh)[0]
+
+    def get_multiple_domain_ages(
+        self, domains: Iterable[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Look up several domains concurrently.
+
+        Returns a dict mapping each input domain to its get_domain_age
+        result. Same-TLD domains are spaced apart so one registry is not
+        hit in a burst, and rate-limited domains are retried once after
+        the server's Retry-After (capped at MAX_RETRY_AFTER). Ages are
+        all measured against one reference time.
+        """
+        now = utcnow()
+        ordered = _spread_by_tld(dict.fromkeys(domains))
+        if not ordered:
+            return {}
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        workers = min(MAX_WHOIS_WORKERS, len(ordered))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            limited: List[str] = []
+            retry_after = 0.0
+            lookups = executor.map(self._lookup, ordered, repeat(now))
+            for domain, (result, state) in zip(ordered, lookups):
+                results[domain] = result
+                if result is None and state.who_dat_rate_limited:
+                    limited.append(domain)
+                    retry_after = max(retry_after, state.retry_after)
+
+            if limited:
+                time.sleep(min(retry_after, MAX_RETRY_AFTER))
+                lookups = executor.map(
+                    self._lookup, limited, repeat(now)
+                )
+                for domain, (result, _) in zip(limited, lookups):
+                    results[domain] = result
+
+        return results
+
+    def _lookup(
+        self,
+        domain: str,
+        now: Optional[datetime] = None,
+        force_refresh: bool = False,
+    ) -> Tuple[Optional[Dict[str, Any]], _Lookup]:
+        """Resolve one domain, returning its result and call flags."""
         domain = self._normalize_domain(domain)
+        state = _Lookup()
+        # Garbage input would only burn every endpoint's timeout
+        if not self._is_valid_domain(domain):
+            return None, state
 
         # Cache
-        if domain in self._cache:
-            return self._cache[domain]
+        if not force_refresh:
+            with self._cache_lock:
+                entry = self._cache.get(domain)
+            if entry is not None:
+                return _with_current_age(entry[1], now), state
+            result = self._load(domain, now)
+            if result is not _UNSET:
+                return result, state
 
-        # Reset flags for this call
-        self._who_dat_rate_limited = False
-        self._who_dat_failed = False
-        self._rdap_failed = False
-        self._last_registrar = None
+        with self._inflight_lock:
+            # Re-check: an owner finishing since the miss above has
+            # already cached its answer and left _inflight
+            if not force_refresh:
+                with self._cache_lock:
+                    entry = self._cache.get(domain)
+                if entry is not None:
+                    return _with_current_age(entry[1], now), state
+            future = self._inflight.get(domain)
+            owner = future is None
+            if owner:
+                future = self._inflight[domain] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            outcome = self._resolve(domain, now)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(outcome)
+            return outcome
+        finally:
+            with self._inflight_lock:
+                del self._inflight[domain]
 
+    def _resolve(
+        self, domain: str, now: Optional[datetime]
+    ) -> Tuple[Optional[Dict[str, Any]], _Lookup]:
+        """Query the WHOIS sources for a validated, uncached domain."""
+        state = _Lookup()
         creation_date: Optional[datetime] = None
         result: Optional[Dict[str, Any]] = None
 
         try:
-            creation_date = self._try_who_dat(domain)
-            if not creation_date:
-                creation_date = self._try_rdap(domain)
+            started = time.monotonic()
+            creation_date = self._race_apis(domain, state)
 
-            # Try python-whois as fallback if external APIs fail
-            if not creation_date:
-                creation_date = self._try_python_whois(domain)
+            if (not creation_date and time.monotonic() - started
+                    > WHOIS_FALLBACK_BUDGET):
+                # Out of time: skip the slow fallbacks, and do not cache
+                # a miss they never got to confirm
+                logger.debug("WHOIS fallbacks skipped for %s", domain)
+                state.transient = True
+            else:
+                # Try python-whois as fallback if external APIs fail
+                if not creation_date:
+                    creation_date = self._try_python_whois(domain, state)
 
-            # Final fallback: WhoisXMLAPI (requires WHOISXML_API_KEY)
-            if not creation_date:
-                creation_date = self._try_whoisxml(domain)
+                # Final fallback: WhoisXMLAPI (requires WHOISXML_API_KEY)
+                if not creation_date:
+                    creation_date = self._try_whoisxml(domain, state)
 
             if creation_date:
-                age_years = calculate_domain_age(creation_date)
+                age_years = calculate_domain_age(creation_date, now)
                 result = {
                     "domain_age_years": age_years,
                     "creation_date": creation_date.isoformat(),
                     "registrar": None,
                 }
 
-                # Prefer registrar captured from APIs
-                if self._last_registrar:
-                    result["registrar"] = self._last_registrar
+                # Prefer the registrar the answering API already sent;
+                # only fall back to a WHOIS query when none did.
+                if state.registrar:
+                    result["registrar"] = state.registrar
                 else:
-                    reg = self._get_registrar(domain)
+                    reg = self._get_registrar(domain, state)
                     if reg:
                         result["registrar"] = reg
 
-                self._cache[domain] = result
+                self._store(domain, result, self._cache_ttl)
 
         except Exception:  # pragma: no cover - defensive
             logger.exception(
                 "Unexpected error in get_domain_age for %s", domain
             )
 
+        if result:
+            return result, state
+
         # If who-dat was rate-limited, prefer returning None so
         # callers/tests can treat it as temporarily unavailable.
-        if self._who_dat_rate_limited and not result:
-            return None
+        if state.who_dat_rate_limited:
+            return None, state
 
         # If both attempts timed out, return None (network issues)
-        if self._who_dat_timeout and self._rdap_timeout and not result:
-            return None
+        if state.who_dat_timeout and state.rdap_timeout:
+            return None, state
 
         # If both external lookups failed (non-timeout failures), return
         # an explicit error dict for tests that assert that path.
-        if self._who_dat_failed and self._rdap_failed and not result:
-            return {"domain_age_years": 0, "error": "whois_unavailable"}
+        if state.who_dat_failed and state.rdap_failed:
+            result = {"domain_age_years": 0, "error": "whois_unavailable"}
 
-        return result
+        if not state.transient:
+            self._store(domain, result, self._negative_ttl)
+        return result, state
 
-    def _try_who_dat(self, domain: str) -> Optional[datetime]:
-        """Query who-dat API for creation date and registrar."""
-        try:
-            url = f"https://who-dat.as93.net/{domain}"
-            resp = requests.get(url, timeout=5)
-            if resp.status_code == 429:
-                self._who_dat_rate_limited = True
-                return None
-            if resp.status_code != 200:
-                self._who_dat_failed = True
+    def _race_apis(
+        self, domain: str, state: _Lookup
+    ) -> Optional[datetime]:
+        """
+        Ask who-dat, hedging with RDAP if it is slow.
+
+        RDAP starts once who-dat has failed or been silent for
+        WHOIS_HEDGE_DELAY seconds, and the first creation date from
+        either wins. Each attempt records into its own _Lookup so a
+        losing request still in flight cannot touch this call's
+        flags; finished attempts are merged into state.
+        """
+        executor = _get_whois_executor()
+        attempts = {}
+
+        def start(try_api) -> None:
+            attempt = _Lookup()
+            attempts[executor.submit(try_api, domain, attempt)] = attempt
+
+        start(self._try_who_dat)
+        pending = set(attempts)
+        done, pending = wait(pending, timeout=WHOIS_HEDGE_DELAY)
+        while True:
+            for future in done:
+                state.merge(attempts[future])
+                creation_date = future.result()
+                if creation_date:
+                    return creation_date
+            if len(attempts) == 1:
+                start(self._try_rdap)
+                pending |= set(attempts) - done
+            if not pending:
                 return None
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
 
-            data = resp.json()
-            if isinstance(data, dict) and data.get("registrar"):
-                self._last_registrar = data.get("registrar")
+    def _store(
+        self, domain: str, result: Optional[Dict[str, Any]], ttl: float
+    ) -> None:
+        with self._cache_lock:
+            self._cache[domain] = (ttl, result)
+        if self._disk is not None:
+            try:
+                self._disk.set(domain, result, ttl)
+            except sqlite3.Error as e:
+                logger.warning("WHOIS disk cache write failed: %s", e)
 
-            # possible fields containing creation date
-            keys = (
-                "creation_date", "created", "registered", "registration"
-            )
-            for key in keys:
-                if key in data and data[key]:
-                    cd = parse_creation_date(str(data[key]))
-                    if cd:
-                        return cd
+    def _load(self, domain: str, now: Optional[datetime]) -> Any:
+        """Result from the disk cache (promoted to memory), or _UNSET,
+        with its age recomputed like a memory hit."""
+        if self._disk is None:
+            return _UNSET
+        try:
+            result, ttl = self._disk.get(domain)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("WHOIS disk cache read failed: %s", e)
+            return _UNSET
+        if result is _UNSET:
+            return _UNSET
+        with self._cache_lock:
+            self._cache[domain] = (ttl, result)
+        return _with_current_age(result, now)
 
-            return None
+    def _fetch(
+        self, name: str, url: str, state: _Lookup, **kwargs: Any
+    ) -> Any:
+        """
+        GET url from endpoint `name` and return the decoded JSON body.
 
+        Returns None when the endpoint is skipped or fails. The failure
+        is recorded on `name`'s breaker and as the `name`_failed,
+        _timeout and _rate_limited flags on state, so every endpoint
+        shares one set of status, timeout and back-off rules.
+        """
+        breaker = self._breakers[name]
+        if breaker.is_open():
+            state.transient = True
+            return None
+        try:
+            resp = _get_session().get(
+                url, timeout=breaker.timeout(), **kwargs
+            )
+            if resp.status_code == 429:
+                setattr(state, name + "_rate_limited", True)
+                state.transient = True
+                state.retry_after = _retry_after(resp)
+                breaker.rate_limited(state.retry_after)
+                return None
+            _record_status(breaker, resp, state)
+            if resp.status_code != 200:
+                setattr(state, name + "_failed", True)
+                return None
+            return _json(resp)
         except requests.Timeout:
-            self._who_dat_timeout = True
-            self._who_dat_failed = True
+            breaker.failure(timed_out=True)
+            setattr(state, name + "_timeout", True)
+            setattr(state, name + "_failed", True)
+            state.transient = True
             return None
         except requests.RequestException:
-            self._who_dat_failed = True
+            breaker.failure()
+            setattr(state, name + "_failed", True)
+            state.transient = True
             return None
 
-    def _try_rdap(self, domain: str) -> Optional[datetime]:
+    def _try_who_dat(
+        self, domain: str, state: _Lookup
+    ) -> Optional[datetime]:
+        """Query who-dat API for creation date and registrar."""
+        data = self._fetch(
+            "who_dat", f"https://who-dat.as93.net/{domain}", state
+        )
+        if not isinstance(data, dict):
+            return None
+        state.registrar = _registrar_name(data.get("registrar"))
+        return _first_date(data, _WHO_DAT_DATE_KEYS)
+
+    def _try_rdap(
+        self, domain: str, state: _Lookup
+    ) -> Optional[datetime]:
         """Query RDAP endpoints for creation date and registrar."""
-        try:
-            url = f"https://rdap.org/domain/{domain}"
-            # FIXED: Follow redirects automatically
-            resp = requests.get(url, timeout=5, allow_redirects=True)
-            if resp.status_code != 200:
-                self._rdap_failed = True
-                return None
+        # FIXED: Follow redirects automatically
+        data = self._fetch(
+            "rdap", f"https://rdap.org/domain/{domain}", state,
+            allow_redirects=True,
+        )
+        if not isinstance(data, dict):
+            return None
+        state.registrar = (
+            _registrar_name(data.get("registrar"))
+            or _rdap_registrar(data)
+        )
 
-            data = resp.json()
-            if isinstance(data, dict) and data.get("registrar"):
-                self._last_registrar = data.get("registrar")
+        # RDAP often uses events
+        events = data.get("events") or []
+        for ev in events:
+            if ev.get("eventAction") == "registration":
+                date_str = ev.get("eventDate")
+                if date_str:
+                    cd = parse_creation_date(str(date_str))
+                    if cd:
+                        return cd
 
-            # RDAP often uses events
-            events = data.get("events") or []
-            for ev in events:
-                if ev.get("eventAction") == "registration":
-                    date_str = ev.get("eventDate")
-                    if date_str:
-                        cd = parse_creation_date(str(date_str))
-                        if cd:
-                            return cd
+        return None
 
-            return None
+    def _whois(self, domain: str, state: _Lookup) -> Any:
+        """
+        whois.whois(domain), queried at most once per lookup.
 
-        except requests.Timeout:
-            self._rdap_timeout = True
-            self._rdap_failed = True
-            return None
-        except requests.RequestException:
-            self._rdap_failed = True
-            return None
+        None without a query when port-43 WHOIS is disabled or the
+        TLD is in PORT43_WHOIS_SKIP_TLDS.
+        """
+        if state.whois_record is _UNSET:
+            if (not self._port43_whois
+                    or domain.rpartition(".")[2]
+                    in PORT43_WHOIS_SKIP_TLDS):
+                state.whois_record = None
+                return None
+            try:
+                state.whois_record = whois.whois(domain)
+            except Exception:
+                state.whois_record = None
+        return state.whois_record
 
-    def _try_python_whois(self, domain: str) -> Optional[datetime]:
+    def _try_python_whois(
+        self, domain: str, state: _Lookup
+    ) -> Optional[datetime]:
         try:
-            w = whois.whois(domain)
+            w = self._whois(domain, state)
             if not w:
                 return None
-            creation_date = getattr(w, "creation_date", None)
-            if isinstance(creation_date, list) and creation_date:
-                creation_date = creation_date[0]
-
-            # Normalize common types: datetime, date, or string
-            if isinstance(creation_date, datetime):
-                return creation_date
-            if isinstance(creation_date, date):
-                # convert date to datetime at midnight
-                return datetime(
-                    creation_date.year,
-                    creation_date.month,
-                    creation_date.day,
-                )
-            if isinstance(creation_date, str):
-                parsed = parse_creation_date(creation_date)
-                if parsed:
-                    return parsed
+            cd = getattr(w, "creation_date", None)
+            if isinstance(cd, list):
+                cd = cd[0] if cd else None
+            if cd is None:
+                return None
+
+            # Normalize common types: string, datetime, or date
+            if isinstance(cd, str):
+                return parse_creation_date(cd)
+            if isinstance(cd, datetime):
+                return cd
+            if hasattr(cd, "year"):
+                # a date; convert to datetime at midnight
+                return datetime(cd.year, cd.month, cd.day)
         except Exception:
             return None
         return None
 
-    def _get_registrar(self, domain: str) -> Optional[str]:
+    def _get_registrar(
+        self, domain: str, state: _Lookup
+    ) -> Optional[str]:
         try:
-            w = whois.whois(domain)
+            w = self._whois(domain, state)
             registrar = getattr(w, "registrar", None)
             return registrar
         except Exception:
             return None
 
-    def _try_whoisxml(self, domain: str) -> Optional[datetime]:
+    def _try_whoisxml(
+        self, domain: str, state: _Lookup
+    ) -> Optional[datetime]:
         """Query WhoisXMLAPI as final fallback.
 
-        Requires environment variable `WHOISXML_API_KEY` to be set.
+        Requires environment variable `WHOISXML_API_KEY` to be set
+        when the checker is created.
         Returns a datetime on success or None on failure.
         """
-        # Ensure environment variables from .env are loaded and read
-        # (load_dotenv() at module import ensures this in most cases,
-        # but we also guard here).
-        api_key = os.environ.get("WHOISXML_API_KEY")
+        api_key = self._whoisxml_key
         if not api_key:
             logger.debug(
                 "WHOISXML_API_KEY not set; skipping WhoisXML fallback"
             )
             return None
 
-        try:
-            base_url = (
-                "https://www.whoisxmlapi.com/whoisserver/WhoisService"
-            )
-            params = (
-                f"?apiKey={api_key}&domainName={domain}"
-                f"&outputFormat=JSON"
-            )
-            url = base_url + params
-            resp = requests.get(url, timeout=6)
-            if resp.status_code != 200:
-                self._whoisxml_failed = True
-                return None
+        # params= URL-encodes the key and domain for us
+        data = self._fetch(
+            "whoisxml", WHOISXML_URL, state,
+            params={
+                "apiKey": api_key,
+                "domainName": domain,
+                "outputFormat": "JSON",
+            },
+        )
+        if not isinstance(data, dict):
+            return None
+        # Typical structure:
+        # { 'WhoisRecord': { 'createdDate': '...',
+        #   'registryData': {...}, 'registrarName': '...' } }
+        record = data.get("WhoisRecord") or {}
+        registry = record.get("registryData") or {}
 
-            data = resp.json()
-            # Typical structure:
-            # { 'WhoisRecord': { 'createdDate': '...',
-            #   'registryData': {...}, 'registrarName': '...' } }
-            record = data.get("WhoisRecord") or {}
-
-            # Try several possible locations for creation date
-            for key in ("createdDate", "createdDateNormalized", "created"):
-                cd = record.get(key)
-                if cd:
-                    parsed = parse_creation_date(str(cd))
-                    if parsed:
-                        # try to capture registrar
-                        registry = record.get("registryData", {})
-                        registrar = (
-                            record.get("registrarName")
-                            or registry.get("registrarName")
-                        )
-                        if registrar:
-                            self._last_registrar = registrar
-                        return parsed
-
-            # Also inspect nested registryData
-            registry = record.get("registryData") or {}
-            cd = (
-                registry.get("createdDate")
-                or registry.get("createdDateNormalized")
+        # Try the top-level record first, then the nested registryData
+        parsed = _first_date(record, _WHOISXML_DATE_KEYS)
+        if parsed:
+            registrar = (
+                record.get("registrarName")
+                or registry.get("registrarName")
             )
-            if cd:
-                parsed = parse_creation_date(str(cd))
-                if parsed:
-                    registrar = registry.get("registrarName")
-                    if registrar:
-                        self._last_registrar = registrar
-                    return parsed
+        else:
+            parsed = _first_date(registry, _WHOISXML_DATE_KEYS[:2])
+            registrar = registry.get("registrarName")
+        if parsed and registrar:
+            state.registrar = registrar
+        return parsed
 
-            return None
-        except requests.Timeout:
-            self._whoisxml_timeout = True
-            self._whoisxml_failed = True
-            return None
-        except requests.RequestException:
-            self._whoisxml_failed = True
-            return None
+    @staticmethod
+    def _is_valid_domain(domain: str) -> bool:
+        """True for a bare hostname of two or more LDH labels."""
+        return bool(domain) and _DOMAIN_RE.fullmatch(domain) is not None
 
-    def _normalize_domain(self, domain: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _normalize_domain(domain: str) -> str:
         """
         Normalize domain by:
         1. Removing protocol (http/https)
-        2. Removing www prefix
-        3. Extracting base domain from subdomain
+        2. Keeping only the host (no path, query, userinfo or port)
+        3. Removing www prefix
+        4. Extracting base domain from subdomain
+        5. IDNA-encoding internationalised names to their ASCII form
+
+        Memoised: this runs on every lookup, cache hits included, and
+        batches repeat the same inputs.
         """
         if not domain:
             return domain
@@ -306,19 +835,34 @@ class WhoisChecker:
         d = domain.strip().lower()
 
         # Remove protocol
-        if d.startswith(("http://", "https://")):
-            d = urlparse(d).netloc
+        if d.startswith("https://"):
+            d = d[8:]
+        elif d.startswith("http://"):
+            d = d[7:]
+
+        # Host part only, as urlparse's netloc would give it
+        for sep in ("/", "?", "#"):
+            d = d.split(sep, 1)[0]
+        d = d.rpartition("@")[2].partition(":")[0]
 
         # Remove www prefix
         if d.startswith("www."):
             d = d[4:]
 
         # Extract base domain from subdomain
-        d = self._extract_base_domain(d)
+        d = WhoisChecker._extract_base_domain(d)
 
+        # Validated and queried as punycode; a name IDNA rejects stays
+        # non-ASCII, so _is_valid_domain turns it away
+        if not d.isascii():
+            try:
+                d = d.encode("idna").decode("ascii")
+            except UnicodeError:
+                pass
         return d
 
-    def _extract_base_domain(self, domain: str) -> str:
+    @staticmethod
+    def _extract_base_domain(domain: str) -> str:
         """
         Extract the base/root domain from a subdomain.
         Examples:
@@ -326,57 +870,216 @@ class WhoisChecker:
         - shop.example.co.uk -> example.co.uk
         - example.com -> example.com
         """
+        # Two labels or fewer is already a base domain (or a bare
+        # suffix, which every branch below returns unchanged too)
+        if domain.count('.') < 2:
+            return domain
+
         # Try using tldextract library if available
-        try:
-            import tldextract  # type: ignore[reportMissingImports]
+        if TLDEXTRACT_AVAILABLE:
             extracted = tldextract.extract(domain)
             if extracted.domain and extracted.suffix:
                 return f"{extracted.domain}.{extracted.suffix}"
             return domain
-        except ImportError:
-            # Fallback: Simple heuristic for common TLDs
-            # This handles most cases but may not work for all TLDs
-            parts = domain.split('.')
-
-            # Handle multi-part TLDs like .co.uk, .com.au, etc.
-            known_double_tlds = [
-                'co.uk', 'com.au', 'co.jp', 'co.in', 'co.za',
-                'com.br', 'com.cn', 'com.mx', 'com.ar', 'com.co',
-                'net.au', 'org.uk', 'ac.uk', 'gov.uk', 'sch.uk'
-            ]
-
-            if len(parts) >= 3:
-                # Check if last two parts form a known double TLD
-                potential_double_tld = '.'.join(parts[-2:])
-                if potential_double_tld in known_double_tlds:
-                    # Return domain.multi-part-tld (e.g., example.co.uk)
-                    if len(parts) >= 3:
-                        return '.'.join(parts[-3:])
-                    else:
-                        return domain
-                else:
-                    # Return domain.tld (e.g., example.com)
-                    return '.'.join(parts[-2:])
 
-            # If 2 or fewer parts, return as-is
-            return domain
+        # Otherwise the bundled Public Suffix List, if installed
+        if _PSL is not None:
+            return _PSL.get_sld(domain) or domain
+
+        # Last resort: Simple heuristic for common TLDs
+        # This handles most cases but may not work for all TLDs.
+        # Only the last three labels matter.
+        parts = domain.rsplit('.', 3)
 
+        # Handle multi-part TLDs like .co.uk, .com.au, etc.
+        if '.'.join(parts[-2:]) in _DOUBLE_TLDS:
+            # Return domain.multi-part-tld (e.g., example.co.uk)
+            return '.'.join(parts[-3:])
+        # Return domain.tld (e.g., example.com)
+        return '.'.join(parts[-2:])
 
-def calculate_domain_age(creation_date: datetime) -> float:
-    """Calculate domain age in years from creation date."""
+
+def _with_current_age(
+    result: Optional[Dict[str, Any]], now: Optional[datetime]
+) -> Optional[Dict[str, Any]]:
+    """
+    A cached result with domain_age_years recomputed from its creation
+    date. Answers are kept for weeks, so the stored age would otherwise
+    lag behind; the cached dict itself is left untouched.
+    """
+    if not result or not result.get("creation_date"):
+        return result
+    return dict(result, domain_age_years=calculate_domain_age(
+        datetime.fromisoformat(result["creation_date"]), now
+    ))
+
+
+def _spread_by_tld(domains: Iterable[str]) -> List[str]:
+    """Interleave domains round-robin by TLD (a.com, a.org, b.com...)."""
+    by_tld: Dict[str, List[str]] = {}
+    for domain in domains:
+        tld = domain.strip().lower().rstrip(".").rsplit(".", 1)[-1]
+        by_tld.setdefault(tld, []).append(domain)
+    return [
+        domain
+        for batch in zip_longest(*by_tld.values())
+        for domain in batch
+        if domain is not None
+    ]
+
+
+def _registrar_name(value: Any) -> Optional[str]:
+    """Registrar as a string; who-dat may send {"name": ...} instead."""
+    if isinstance(value, dict):
+        value = value.get("name")
+    return value if isinstance(value, str) and value else None
+
+
+def _rdap_registrar(data: Dict[str, Any]) -> Optional[str]:
+    """Name ('fn') of the RDAP entity holding the registrar role."""
+    for entity in data.get("entities") or ():
+        if not isinstance(entity, dict):
+            continue
+        if "registrar" not in (entity.get("roles") or ()):
+            continue
+        vcard = entity.get("vcardArray")
+        if isinstance(vcard, list) and len(vcard) > 1:
+            for prop in vcard[1]:
+                # jCard property: [name, params, type, value]
+                if (isinstance(prop, list) and len(prop) > 3
+                        and prop[0] == "fn"):
+                    return _registrar_name(prop[3])
+    return None
+
+
+# Fields that may hold the creation date, in order of preference
+_WHO_DAT_DATE_KEYS = ("creation_date", "created", "registered",
+                      "registration")
+_WHOISXML_DATE_KEYS = ("createdDate", "createdDateNormalized", "created")
+
+
+def _first_date(
+    data: Dict[str, Any], keys: Tuple[str, ...]
+) -> Optional[datetime]:
+    """First of data[keys] that parses as a creation date, or None."""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            cd = parse_creation_date(str(value))
+            if cd:
+                return cd
+    return None
+
+
+def _json(resp: requests.Response) -> Any:
+    """Decode a JSON body, with orjson when installed; invalid JSON
+    raises a RequestException like resp.json() does."""
+    content = resp.content
+    if ORJSON_AVAILABLE and isinstance(content, bytes):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            raise requests.exceptions.InvalidJSONError(
+                str(e), response=resp
+            )
+    return resp.json()
+
+
+def _record_status(
+    breaker: _Breaker, resp: requests.Response, state: _Lookup
+) -> None:
+    """Feed an HTTP status to the endpoint's breaker: any answer below
+    500 proves the endpoint is up, even a 404 for an unknown domain."""
+    if resp.status_code >= 500:
+        breaker.failure()
+        state.transient = True
+    else:
+        breaker.success()
+
+
+def _retry_after(resp) -> float:
+    """Seconds to wait from a 429's Retry-After header (default 1s)."""
+    try:
+        return max(0.0, float(resp.headers.get("Retry-After", 1)))
+    except (TypeError, ValueError):
+        # HTTP-date form or a missing/odd header
+        return 1.0
+
+
+_INV_YEAR_DAYS = 1.0 / 365.25
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, comparable with the naive
+    UTC timestamps parse_creation_date returns for 'Z' dates."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def calculate_domain_age(
+    creation_date: datetime, now: Optional[datetime] = None
+) -> float:
+    """Calculate domain age in years from creation date.
+
+    `now` (naive UTC) lets a batch share one reference time; aware
+    creation dates are converted to naive UTC first.
+    """
     if not creation_date or not isinstance(creation_date, datetime):
         return None
-    now = datetime.now()
+    if creation_date.tzinfo is not None:
+        creation_date = creation_date.astimezone(timezone.utc).replace(
+            tzinfo=None
+        )
+    if now is None:
+        now = utcnow()
     if creation_date > now:
         return 0.0
     delta = now - creation_date
-    return round(delta.days / 365.25, 2)
+    return round(delta.days * _INV_YEAR_DAYS, 2)
 
 
-def parse_creation_date(date_str: str) -> Optional[datetime]:
-    if not date_str or not isinstance(date_str, str):
-        return None
-    formats = [
+# ISO-8601 as returned by who-dat/RDAP: date, optional time, optional
+# fraction and zone. Matching it directly skips the strptime cascade,
+# whose misses each raise and catch a ValueError.
+_ISO_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:([T ])(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?"
+    r"(Z|[+-]\d{2}:?\d{2})?)?"
+)
+_DMY_NAMED_RE = re.compile(r"(\d{1,2})-([A-Za-z]{3})-(\d{4})")
+_SLASHED_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun",
+         "jul", "aug", "sep", "oct", "nov", "dec"), 1
+    )
+}
+
+
+# Remaining strptime formats, in their historical order, each paired with
+# a regex derived from the format. The regexes are at least as lenient as
+# strptime (1-2 digit fields, any case, runs of spaces), so skipping the
+# formats whose shape does not match cannot change the result; it only
+# avoids a raised ValueError per rejected format.
+_STRPTIME_TOKENS = {
+    "%Y": r"\d{4}", "%m": r"\s?\d{1,2}", "%d": r"\s?\d{1,2}",
+    "%H": r"\d{1,2}", "%M": r"\d{1,2}", "%S": r"\d{1,2}",
+    "%f": r"\d{1,6}", "%b": r"[a-z]+", "%z": r"(?:[+-][\d:.]+|Z)",
+    " ": r"\s+",
+}
+
+
+def _strptime_shape(fmt: str) -> "re.Pattern[str]":
+    return re.compile(
+        "".join(
+            _STRPTIME_TOKENS.get(token) or re.escape(token)
+            for token in re.findall(r"%.|.", fmt)
+        ),
+        re.IGNORECASE,
+    )
+
+
+_STRPTIME_FORMATS = tuple(
+    (_strptime_shape(fmt), fmt) for fmt in (
         "%Y-%m-%dT%H:%M:%S.%fZ",
         "%Y-%m-%dT%H:%M:%SZ",
         "%Y-%m-%d %H:%M:%S",
@@ -387,21 +1090,91 @@ def parse_creation_date(date_str: str) -> Optional[datetime]:
         "%d/%m/%Y",
         "%d-%b-%Y",
         "%Y-%m-%dT%H:%M:%S%z",
-    ]
-    for fmt in formats:
+    )
+)
+
+
+def _parse_iso(match: "re.Match[str]") -> datetime:
+    """Build a datetime from an _ISO_RE match (ValueError if out of range).
+
+    The regex has already pinned the shape to one fromisoformat accepts,
+    so the C parser does the field work. A trailing 'Z' after 'T' yields
+    a naive datetime, as the '%Y-%m-%dT%H:%M:%SZ' formats always have;
+    explicit offsets (and a 'Z' after a space, which only dateutil used
+    to accept) are aware.
+    """
+    date_str = match.string
+    if match.group(9) == "Z" and match.group(4) == "T":
+        date_str = date_str[:-1]
+    return datetime.fromisoformat(date_str)
+
+
+def _parse_common(date_str: str) -> Optional[datetime]:
+    """Regex fast path for the common formats, None if none applies."""
+    try:
+        match = _ISO_RE.fullmatch(date_str)
+        if match:
+            return _parse_iso(match)
+        match = _DMY_NAMED_RE.fullmatch(date_str)
+        if match:
+            month = _MONTHS.get(match.group(2).lower())
+            if month:
+                return datetime(
+                    int(match.group(3)), month, int(match.group(1))
+                )
+            return None
+        match = _SLASHED_RE.fullmatch(date_str)
+        if match:
+            first, second, year = map(int, match.groups())
+            # '%m/%d/%Y' is tried before '%d/%m/%Y'
+            try:
+                return datetime(year, first, second)
+            except ValueError:
+                return datetime(year, second, first)
+    except ValueError:
+        # Out-of-range field; let the full cascade decide
+        pass
+    return None
+
+
+def parse_creation_date(date_str: str) -> Optional[datetime]:
+    if not date_str or not isinstance(date_str, str):
+        return None
+    return _parse_creation_date(date_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_creation_date(date_str: str) -> Optional[datetime]:
+    """parse_creation_date for a non-empty str, memoised: registrars
+    stamp many domains with the same timestamps, and datetimes are
+    immutable so a cached one is safe to hand out."""
+    date_str = date_str.strip()
+    parsed = _parse_common(date_str)
+    if parsed:
+        return parsed
+
+    for shape, fmt in _STRPTIME_FORMATS:
+        if not shape.fullmatch(date_str):
+            continue
         try:
-            return datetime.strptime(date_str.strip(), fmt)
+            return datetime.strptime(date_str, fmt)
         except ValueError:
-            # Expected - date doesn't match this format, try next
+            # Right shape but out of range, try the next candidate
             continue
+    if _DATEUTIL is None:
+        return None
     try:
-        from dateutil import parser
-
-        return parser.parse(date_str)
-    except (ImportError, ValueError) as e:
+        return _DATEUTIL.parse(date_str)
+    except ValueError as e:
         logger.debug(
             "Failed to parse creation date using dateutil: %s (%s)",
             date_str,
             e,
         )
         return None
+
+
+# The guard above keeps None/non-str out of the cache; expose the cache
+# controls on the public name for tests.
+parse_creation_date.cache_clear = _parse_creation_date.cache_clear
+parse_creation_date.cache_info = _parse_creation_date.cache_info